@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DATA WALKER — Travessia única de documentos JSON com handlers por caminho
+
+Os validadores (validate_schema, validate_content) registram handlers para
+padrões de caminho JSON e o documento é percorrido UMA vez: todos os checks
+disparam na mesma passada, em ordem de documento (pré-ordem). O custo da
+travessia é O(documento), independente do número de checks; subárvores que
+nenhum padrão pode alcançar nem são visitadas.
+
+Padrões (segmentos separados por ponto):
+    categorias[*]                  cada item da lista `categorias`
+    categorias[*].base_legal[*]    cada base legal de cada categoria
+    orgaos_estaduais[3]            índice específico
+    categorias.*                   cada valor de um objeto `categorias`
+    **                             qualquer nó, em qualquer profundidade
+    **.url                         qualquer chave `url`
+
+Uso:
+    walker = DataWalker()
+    walker.on("categorias[*]", lambda path, cat: ...)
+    walker.on("**", lambda path, node: ...)
+    walker.walk(data)
+
+O handler recebe `path` (tupla de chaves/índices) e o nó; `format_path`
+gera a notação `categorias[0].links[1].url` usada nas mensagens.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Callable, Iterable, List, Sequence, Tuple
+
+Path = Tuple[Any, ...]
+Handler = Callable[[Path, Any], None]
+
+ANY_KEY = "*"
+ANY_INDEX = "[*]"
+ANY_DEPTH = "**"
+
+_TOKEN_RE = re.compile(r"\[(\*|\d+)\]|([^.\[\]]+)")
+
+
+def parse_pattern(pattern: str) -> List[Any]:
+    """`categorias[*].links[0]` → ['categorias', '[*]', 'links', 0]."""
+    tokens: List[Any] = []
+    for index, key in _TOKEN_RE.findall(pattern):
+        if index == "*":
+            tokens.append(ANY_INDEX)
+        elif index:
+            tokens.append(int(index))
+        else:
+            tokens.append(key)
+    return tokens
+
+
+def format_path(path: Iterable[Any]) -> str:
+    """('categorias', 0, 'links', 1, 'url') → 'categorias[0].links[1].url'."""
+    out = ""
+    for seg in path:
+        if isinstance(seg, int):
+            out += f"[{seg}]"
+        else:
+            out += f".{seg}" if out else str(seg)
+    return out
+
+
+def _step(token: Any, seg: Any) -> bool:
+    if token == ANY_INDEX:
+        return isinstance(seg, int)
+    if token == ANY_KEY:
+        return isinstance(seg, str)
+    return token == seg
+
+
+class DataWalker:
+    """Registro de handlers + travessia única (autômato sobre os padrões).
+
+    Cada nó carrega o conjunto de estados (handler, posição no padrão) ainda
+    vivos; descer um nível avança esses estados pelo segmento. Sem estados
+    vivos a subárvore é podada.
+    """
+
+    def __init__(self):
+        self._patterns: List[Sequence[Any]] = []
+        self._handlers: List[Handler] = []
+
+    def on(self, pattern: str, handler: Handler) -> "DataWalker":
+        """Registra `handler` para os nós que casam com `pattern`."""
+        self._patterns.append(parse_pattern(pattern))
+        self._handlers.append(handler)
+        return self
+
+    def _closure(self, states: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """`**` também casa zero segmentos: avança sem consumir."""
+        out: List[Tuple[int, int]] = []
+        seen = set()
+        stack = list(states)
+        while stack:
+            state = stack.pop()
+            if state in seen:
+                continue
+            seen.add(state)
+            out.append(state)
+            h, pos = state
+            tokens = self._patterns[h]
+            if pos < len(tokens) and tokens[pos] == ANY_DEPTH:
+                stack.append((h, pos + 1))
+        return sorted(out)
+
+    def _advance(self, states: List[Tuple[int, int]], seg: Any) -> List[Tuple[int, int]]:
+        nxt = []
+        for h, pos in states:
+            tokens = self._patterns[h]
+            if pos >= len(tokens):
+                continue
+            token = tokens[pos]
+            if token == ANY_DEPTH:
+                nxt.append((h, pos))
+            elif _step(token, seg):
+                nxt.append((h, pos + 1))
+        return self._closure(nxt)
+
+    def walk(self, document: Any) -> None:
+        """Percorre `document` uma vez, chamando os handlers em pré-ordem.
+
+        No mesmo nó, os handlers disparam na ordem de registro.
+        """
+        self._visit((), document, self._closure((h, 0) for h in range(len(self._patterns))))
+
+    def _visit(self, path: Path, node: Any, states: List[Tuple[int, int]]) -> None:
+        for h in sorted({h for h, pos in states if pos == len(self._patterns[h])}):
+            self._handlers[h](path, node)
+        if isinstance(node, dict):
+            children = node.items()
+        elif isinstance(node, list):
+            children = enumerate(node)
+        else:
+            return
+        for seg, child in children:
+            nxt = self._advance(states, seg)
+            if nxt:
+                self._visit(path + (seg,), child, nxt)
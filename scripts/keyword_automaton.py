@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+KEYWORD AUTOMATON — Busca simultânea de várias palavras-chave (Aho-Corasick)
+
+Monta um autômato com todas as palavras-chave e percorre o texto UMA vez,
+emitindo cada ocorrência (inclusive sobrepostas: "deficiência" dentro de
+"pessoa com deficiência"). O custo é O(texto + ocorrências), independente
+do número de palavras-chave — em vez de um `str.find` em laço por palavra.
+
+Uso:
+    automaton = KeywordAutomaton(["deficiência", "pessoa com deficiência"])
+    for start, keyword in automaton.iter_matches(texto.lower()):
+        ...
+
+Para texto que chega em pedaços (download em streaming), `scanner()`
+mantém o estado entre os pedaços e devolve posições absolutas:
+
+    scanner = automaton.scanner()
+    for pedaco in pedacos:
+        for start, keyword in scanner.feed(pedaco.lower()):
+            ...
+    scanner.found_all  # todas as palavras-chave já apareceram?
+
+A comparação é exata (sensível a caixa): normalize texto e palavras antes.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+
+class KeywordAutomaton:
+    """Trie das palavras-chave + links de falha (Aho-Corasick)."""
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = list(dict.fromkeys(k for k in keywords if k))
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[str, ...]] = [()]
+        for keyword in self.keywords:
+            self._insert(keyword)
+        self._link()
+
+    def _insert(self, keyword: str) -> None:
+        node = 0
+        for ch in keyword:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            node = nxt
+        self._out[node] += (keyword,)
+
+    def _link(self) -> None:
+        """Links de falha em largura; saídas herdam as do sufixo mais longo."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] += self._out[self._fail[child]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str]]:
+        """(posição inicial, palavra) de cada ocorrência, em ordem de fim."""
+        return iter(self.scanner().feed(text))
+
+    def scanner(self) -> "KeywordScanner":
+        return KeywordScanner(self)
+
+
+class KeywordScanner:
+    """Estado do autômato entre pedaços sucessivos do mesmo texto."""
+
+    def __init__(self, automaton: KeywordAutomaton):
+        self.automaton = automaton
+        self.offset = 0
+        self.found: Set[str] = set()
+        self._node = 0
+
+    @property
+    def found_all(self) -> bool:
+        return len(self.found) == len(self.automaton.keywords)
+
+    def feed(self, text: str) -> List[Tuple[int, str]]:
+        """Ocorrências que terminam em `text` (posições desde o 1º pedaço)."""
+        automaton = self.automaton
+        goto, fail, out = automaton._goto, automaton._fail, automaton._out
+        root = goto[0]
+        node = self._node
+        base = self.offset
+        hits: List[Tuple[int, str]] = []
+        for i, ch in enumerate(text, base):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0) if node else root.get(ch, 0)
+            if out[node]:
+                for keyword in out[node]:
+                    hits.append((i - len(keyword) + 1, keyword))
+                    self.found.add(keyword)
+        self._node = node
+        self.offset = base + len(text)
+        return hits
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LAW INDEX — Índice estruturado (Art. → § → inciso) de leis do Planalto
+
+`LawTextParser` extrai o texto plano da página HTML da lei (mesmo texto que o
+acervo local guarda) e, na mesma passada, reconhece os dispositivos pelo
+início de cada bloco (<p>, <div>, ...):
+
+    Art. 20.  /  Art. 3º-A  /  Art. 1.048     → artigo "20", "3-A", "1048"
+    § 3º  /  Parágrafo único                  → parágrafo "3", "unico"
+    XVII -  /  IV-A –                         → inciso "XVII", "IV-A"
+
+O parser aceita a página em pedaços (`feed` a cada bloco baixado) e, com
+`sink`, entrega o texto extraído à medida que sai — sem acumular a página
+nem o texto em memória.
+
+Cada dispositivo vira um span [início, fim) em offsets de caractere do texto
+extraído. `LawIndex` guarda os spans em JSON compacto (um arquivo por lei,
+ao lado do texto no acervo) e responde sem reprocessar o HTML:
+
+    index.has("20", "3")          # Art. 20, § 3º existe?      O(1)
+    index.article_at(offset)      # artigo que contém o offset  O(log n)
+
+`parse_reference` converte o campo `base_legal[].artigo` ("Art. 20, § 3º",
+"Arts. 1º a 5º", "Art. 26 e 26-A", ...) nas chaves consultáveis.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from bisect import bisect_right
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+ARTICLE, PARAGRAPH, INCISO = "art", "par", "inc"
+_LEVEL = {ARTICLE: 0, PARAGRAPH: 1, INCISO: 2}
+
+# Chave de um dispositivo: (artigo, parágrafo, inciso)
+Ref = Tuple[str, Optional[str], Optional[str]]
+
+# Tags que delimitam blocos (um dispositivo começa no início de um bloco)
+BLOCK_TAGS = frozenset({"p", "div", "br", "td", "li", "blockquote",
+                        "h1", "h2", "h3", "h4", "h5", "h6"})
+# Basta o começo do bloco para reconhecer o rótulo do dispositivo
+_PREFIX_CHARS = 40
+
+_ARTICLE_RE = re.compile(r"Art\.?\s*(\d{1,3}(?:\.\d{3})*)\s*[º°o]?(?:\s*-\s*([A-Z])(?!\w))?")
+_PARAGRAPH_RE = re.compile(r"§\s*(\d+)\s*[º°o]?(?:\s*-\s*([A-Z])(?!\w))?")
+_UNICO_RE = re.compile(r"Par[áa]grafo\s+[úu]nico", re.IGNORECASE)
+_INCISO_RE = re.compile(r"([IVXLC]+)(?:-([A-Z]))?\s*[-–—]")
+
+
+def _label(number: str, suffix: Optional[str] = None) -> str:
+    """'1.048' → '1048'; ('3', 'A') → '3-A'."""
+    number = number.replace(".", "").lstrip("0") or "0"
+    return f"{number}-{suffix.upper()}" if suffix else number
+
+
+def format_ref(ref: Ref) -> str:
+    """('20', '3', 'I') → 'Art. 20, § 3º, I' (notação de direitos.json)."""
+    article, paragraph, inciso = ref
+
+    def ordinal(label: str) -> str:
+        number, _, suffix = label.partition("-")
+        out = f"{number}º" if number.isdigit() and int(number) < 10 else number
+        return f"{out}-{suffix}" if suffix else out
+
+    parts = [f"Art. {ordinal(article)}"]
+    if paragraph == "unico":
+        parts.append("parágrafo único")
+    elif paragraph:
+        parts.append(f"§ {ordinal(paragraph)}")
+    if inciso:
+        parts.append(inciso)
+    return ", ".join(parts)
+
+
+class LawTextParser(HTMLParser):
+    """Texto plano + spans de dispositivos de uma página de lei.
+
+    Sem `sink`, o texto fica em memória (`get_text`); com `sink`, cada
+    fragmento (já com o espaço separador) é entregue a `sink(str)`.
+    """
+
+    def __init__(self, sink: Optional[Callable[[str], object]] = None):
+        super().__init__()
+        self.in_body = False
+        self._pieces: List[str] = []
+        self._sink = sink if sink is not None else self._pieces.append
+        self._length = 0
+        self._spans: List[list] = []  # [tipo, rótulo, início, fim, pai]
+        self._open: Dict[str, Optional[int]] = {ARTICLE: None, PARAGRAPH: None, INCISO: None}
+        self._block_start: Optional[int] = None
+        self._block_prefix = ""
+        self._started = False
+        self._events = 0
+        self._last_data = False  # último evento foi texto
+        self._continues = False  # o próximo texto continua o anterior
+
+    @property
+    def length(self) -> int:
+        """Caracteres de texto extraídos até agora."""
+        return self._length
+
+    # ─── HTMLParser ────────────────────────────────────────────────
+    def feed(self, data):
+        if data.startswith("<"):
+            self._continues = False  # "<" sempre encerra o trecho de texto
+        events = self._events
+        super().feed(data)
+        # Texto que chegou ao fim do pedaço é um trecho só com o começo do
+        # próximo pedaço (mesmo resultado de alimentar a página inteira).
+        # Pedaço sem eventos (ex.: parado num "&..." incompleto) não muda nada.
+        if self._events != events:
+            self._continues = self._last_data and not self.rawdata
+
+    def _tag_event(self):
+        self._events += 1
+        self._last_data = self._continues = False
+
+    def handle_starttag(self, tag, attrs):
+        self._tag_event()
+        if tag in ("body", "div", "p"):
+            self.in_body = True
+        if tag in BLOCK_TAGS:
+            self._end_block()
+
+    def handle_endtag(self, tag):
+        self._tag_event()
+        if tag in BLOCK_TAGS:
+            self._end_block()
+
+    def handle_comment(self, data):
+        self._tag_event()
+
+    def handle_decl(self, decl):
+        self._tag_event()
+
+    def handle_pi(self, data):
+        self._tag_event()
+
+    def unknown_decl(self, data):
+        self._tag_event()
+
+    def handle_data(self, data):
+        self._events += 1
+        self._last_data = True
+        if not self.in_body:
+            return
+        if self._continues:
+            self._continues = False
+            self._sink(data)
+            offset = self._length
+        elif self._started:
+            self._sink(" " + data)
+            offset = self._length + 1
+        else:
+            self._sink(data)
+            offset = 0
+        self._started = True
+        self._length = offset + len(data)
+        if len(self._block_prefix) < _PREFIX_CHARS:
+            if self._block_start is None:
+                stripped = data.lstrip()
+                if not stripped:
+                    return
+                self._block_start = offset + len(data) - len(stripped)
+                data = stripped
+            self._block_prefix += data
+
+    def close(self):
+        super().close()
+        self._end_block()
+        self._close_levels(ARTICLE, self._length)
+
+    # ─── Resultado ─────────────────────────────────────────────────
+    def get_text(self) -> str:
+        return "".join(self._pieces)
+
+    def index(self) -> "LawIndex":
+        return LawIndex([list(span) for span in self._spans])
+
+    # ─── Dispositivos ──────────────────────────────────────────────
+    def _end_block(self):
+        start, prefix = self._block_start, self._block_prefix
+        self._block_start, self._block_prefix = None, ""
+        if start is None:
+            return
+        m = _ARTICLE_RE.match(prefix)
+        if m:
+            return self._open_span(ARTICLE, _label(*m.groups()), start)
+        if self._open[ARTICLE] is None:
+            return  # ementa/preâmbulo: § e incisos só valem dentro de artigo
+        m = _PARAGRAPH_RE.match(prefix)
+        if m:
+            return self._open_span(PARAGRAPH, _label(*m.groups()), start)
+        if _UNICO_RE.match(prefix):
+            return self._open_span(PARAGRAPH, "unico", start)
+        m = _INCISO_RE.match(prefix)
+        if m:
+            inciso, suffix = m.groups()
+            self._open_span(INCISO, f"{inciso}-{suffix}" if suffix else inciso, start)
+
+    def _close_levels(self, kind: str, offset: int) -> None:
+        for level, idx in self._open.items():
+            if idx is not None and _LEVEL[level] >= _LEVEL[kind]:
+                self._spans[idx][3] = offset
+                self._open[level] = None
+
+    def _open_span(self, kind: str, label: str, start: int) -> None:
+        self._close_levels(kind, start)
+        if kind == ARTICLE:
+            parent = -1
+        elif kind == PARAGRAPH:
+            parent = self._open[ARTICLE]
+        else:
+            parent = self._open[PARAGRAPH]
+            if parent is None:
+                parent = self._open[ARTICLE]
+        self._open[kind] = len(self._spans)
+        self._spans.append([kind, label, start, start, parent])
+
+
+class LawIndex:
+    """Spans de dispositivos de uma lei, em ordem de documento."""
+
+    VERSION = 1
+
+    def __init__(self, spans: List[list]):
+        self.spans = spans
+        self._keys: Dict[Ref, int] = {}
+        self._article_starts: List[int] = []
+        self._article_ids: List[int] = []
+        for idx, span in enumerate(spans):
+            self._keys.setdefault(self._key(idx), idx)
+            if span[0] == ARTICLE:
+                self._article_starts.append(span[2])
+                self._article_ids.append(idx)
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def _key(self, idx: int) -> Ref:
+        kind, label, _, _, parent = self.spans[idx]
+        if kind == ARTICLE:
+            return (label, None, None)
+        parent_key = self._key(parent)
+        if kind == PARAGRAPH:
+            return (parent_key[0], label, None)
+        return (parent_key[0], parent_key[1], label)
+
+    # ─── Consultas ─────────────────────────────────────────────────
+    def find(self, article: str, paragraph: Optional[str] = None,
+             inciso: Optional[str] = None) -> Optional[Tuple[int, int]]:
+        """Span [início, fim) do dispositivo, ou None se não existe."""
+        idx = self._keys.get((article, paragraph, inciso))
+        if idx is None:
+            return None
+        return self.spans[idx][2], self.spans[idx][3]
+
+    def has(self, article: str, paragraph: Optional[str] = None,
+            inciso: Optional[str] = None) -> bool:
+        return (article, paragraph, inciso) in self._keys
+
+    def articles(self) -> List[str]:
+        """Rótulos dos artigos em ordem de documento."""
+        return [self.spans[idx][1] for idx in self._article_ids]
+
+    def article_at(self, offset: int) -> Optional[str]:
+        """Artigo cujo span contém `offset` (busca binária)."""
+        pos = bisect_right(self._article_starts, offset) - 1
+        if pos < 0:
+            return None
+        _, label, start, end, _ = self.spans[self._article_ids[pos]]
+        return label if start <= offset < end else None
+
+    # ─── Persistência ──────────────────────────────────────────────
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.part")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": self.VERSION, "spans": self.spans}, f,
+                      ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["LawIndex"]:
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == cls.VERSION:
+                return cls(data["spans"])
+        except (OSError, json.JSONDecodeError, AttributeError, KeyError, IndexError, TypeError):
+            pass
+        return None
+
+
+# ─── Referências de base_legal[].artigo ────────────────────────────
+_REF_TOKEN_RE = re.compile(
+    r"(?P<art>\bArts?\b\.?)"
+    r"|(?P<par>§+)"
+    r"|(?P<unico>par[áa]grafo\s+[úu]nico)"
+    r"|(?P<num>\d{1,3}(?:\.\d{3})*)\s*[º°o]?(?:\s*-\s*(?P<suf>[A-Z])(?!\w))?"
+    r"|(?P<inc>\b[IVXLC]+(?:-[A-Z])?\b)",
+    re.IGNORECASE,
+)
+
+
+def parse_reference(artigo: str) -> List[Ref]:
+    """Dispositivos citados em `base_legal[].artigo`.
+
+    "Art. 20, § 3º"          → [('20', '3', None)]
+    "Art. 203, V"            → [('203', None, 'V')]
+    "Arts. 1º a 5º"          → [('1', None, None), ('5', None, None)]  (extremos)
+    "Art. 1º, § 8º e § 10"   → [('1', '8', None), ('1', '10', None)]
+    "Lei completa"           → []  (não cita artigo)
+
+    Comentários entre parênteses ou após travessão ("Art. 93 — reserva de
+    2% a 5%") são ignorados.
+    """
+    text = re.sub(r"\([^)]*\)", " ", (artigo or "").split("—")[0]).strip()
+    if not re.match(r"Arts?\b", text, re.IGNORECASE):
+        return []
+    refs: List[Ref] = []
+    mode = ARTICLE
+
+    def add(ref: Ref) -> None:
+        # "Art. 20" seguido de "§ 3º" vira uma única referência (Art. 20, § 3º)
+        article, paragraph, inciso = refs[-1]
+        if article == ref[0] and inciso is None and paragraph in (None, ref[1]):
+            refs[-1] = ref
+        else:
+            refs.append(ref)
+
+    for m in _REF_TOKEN_RE.finditer(text):
+        if m.group("art"):
+            mode = ARTICLE
+        elif m.group("par"):
+            mode = PARAGRAPH
+        elif m.group("num"):
+            label = _label(m.group("num"), m.group("suf"))
+            if mode == ARTICLE or not refs:
+                refs.append((label, None, None))
+            else:
+                add((refs[-1][0], label, None))
+        elif not refs:
+            continue
+        elif m.group("unico"):
+            add((refs[-1][0], "unico", None))
+        elif m.group("inc").isupper():
+            add((refs[-1][0], refs[-1][1], m.group("inc")))
+    return refs
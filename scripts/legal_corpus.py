@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LEGAL CORPUS — Acervo local dos textos de leis baixados de fontes oficiais
+
+Guarda em `.cache/legal_corpus/` (fora do git) o texto já extraído de cada
+lei buscada pelo validate_legal_sources:
+
+  index.json          URL → {sha256, fetched_at, checked_at, etag, last_modified, partial}
+  texts/<sha256>.txt  texto plano (conteúdo endereçado pelo hash)
+  laws/<sha256>.json  índice Art./§/inciso do texto (law_index.LawIndex)
+
+Duas URLs com o mesmo texto compartilham o arquivo. Entradas checadas há
+menos de `ttl_days` são usadas sem rede; depois disso a URL é revalidada
+com If-None-Match / If-Modified-Since e um 304 só renova `checked_at` —
+assim cada lei é baixada no máximo uma vez por TTL.
+
+O texto pode ser gravado em streaming (`writer`): cada pedaço extraído vai
+direto para um `.part` com hash incremental, renomeado no `commit`. Textos
+interrompidos de propósito (parada antecipada) ficam marcados `partial` e
+só são servidos a quem aceita texto parcial.
+
+Uso:
+    corpus = LegalCorpus()
+    texto = corpus.fresh_text(url)
+    if texto is None:
+        headers = corpus.conditional_headers(url)
+        ...  # 304 → corpus.touch(url); 200 → corpus.store(url, texto, etag, lm)
+        # ou, em streaming:
+        with corpus.writer(url, etag, lm) as out:
+            for pedaco in pedacos:
+                out.write(pedaco)
+            out.commit(index=indice)
+    corpus.save()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from itertools import count
+from pathlib import Path
+from typing import Dict, Optional
+
+from law_index import LawIndex
+
+CORPUS_DIR = Path(__file__).parent.parent / ".cache" / "legal_corpus"
+CORPUS_TTL_DAYS = 7
+_READ_CHUNK = 1 << 16
+_part_ids = count()
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def text_hash(text: str) -> str:
+    """SHA-256 do texto (UTF-8) — chave do arquivo em `texts/`."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class LegalCorpus:
+    """Índice URL → texto extraído, com revalidação condicional por TTL."""
+
+    VERSION = 2
+
+    def __init__(self, path: Path = CORPUS_DIR, ttl_days: float = CORPUS_TTL_DAYS):
+        self.path = Path(path)
+        self.ttl_days = ttl_days
+        self.entries: Dict[str, dict] = self._load()
+        self._lock = threading.Lock()
+        self.stats = {"fresh": 0, "not_modified": 0, "stored": 0}
+        self._indexes: Dict[str, Optional[LawIndex]] = {}
+
+    # ─── Persistência ──────────────────────────────────────────────
+    @property
+    def index_file(self) -> Path:
+        return self.path / "index.json"
+
+    def _blob(self, sha: str) -> Path:
+        return self.path / "texts" / f"{sha}.txt"
+
+    def _index_blob(self, sha: str) -> Path:
+        return self.path / "laws" / f"{sha}.json"
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            with open(self.index_file, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == self.VERSION:
+                return data.get("entries", {})
+        except (FileNotFoundError, json.JSONDecodeError, AttributeError):
+            pass
+        return {}
+
+    @staticmethod
+    def _write(path: Path, text: str) -> None:
+        """Escrita atômica (`.part` + os.replace)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.part")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+
+    def save(self) -> None:
+        with self._lock:
+            payload = {"version": self.VERSION, "entries": self.entries}
+            self._write(self.index_file,
+                        json.dumps(payload, ensure_ascii=False, indent=1, sort_keys=True))
+
+    # ─── Consulta ──────────────────────────────────────────────────
+    def get(self, url: str) -> Optional[dict]:
+        with self._lock:
+            entry = self.entries.get(url)
+            return dict(entry) if entry else None
+
+    def text_path(self, url: str) -> Optional[Path]:
+        """Arquivo do texto de `url`, com hash conferido em blocos (None se inválido)."""
+        entry = self.get(url)
+        if not entry or "sha256" not in entry:
+            return None
+        path = self._blob(entry["sha256"])
+        digest = hashlib.sha256()
+        try:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(_READ_CHUNK), b""):
+                    digest.update(chunk)
+        except OSError:
+            return None
+        return path if digest.hexdigest() == entry["sha256"] else None
+
+    def text(self, url: str) -> Optional[str]:
+        """Texto guardado para `url` (None se ausente ou com hash divergente)."""
+        path = self.text_path(url)
+        return path.read_text(encoding="utf-8") if path else None
+
+    def fresh(self, url: str, allow_partial: bool = False) -> bool:
+        """True se a entrada foi checada há menos de `ttl_days`."""
+        if self.ttl_days <= 0:
+            return False
+        entry = self.get(url)
+        if not entry or (entry.get("partial") and not allow_partial):
+            return False
+        try:
+            checked = datetime.fromisoformat(entry["checked_at"])
+        except (KeyError, ValueError):
+            return False
+        return datetime.now(timezone.utc) - checked < timedelta(days=self.ttl_days)
+
+    def fresh_path(self, url: str, allow_partial: bool = False) -> Optional[Path]:
+        """Arquivo do texto de `url` se checado dentro do TTL (dispensa a rede)."""
+        path = self.text_path(url) if self.fresh(url, allow_partial) else None
+        if path is not None:
+            with self._lock:
+                self.stats["fresh"] += 1
+        return path
+
+    def fresh_text(self, url: str, allow_partial: bool = False) -> Optional[str]:
+        """Texto de `url` se checado dentro do TTL (dispensa a rede)."""
+        path = self.fresh_path(url, allow_partial)
+        return path.read_text(encoding="utf-8") if path else None
+
+    def index(self, url: str) -> Optional[LawIndex]:
+        """Índice estruturado do texto de `url` (None se ausente)."""
+        entry = self.get(url)
+        if not entry or "sha256" not in entry:
+            return None
+        sha = entry["sha256"]
+        if sha not in self._indexes:
+            self._indexes[sha] = LawIndex.load(self._index_blob(sha))
+        return self._indexes[sha]
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since da última busca (se houver)."""
+        entry = self.get(url) or {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    # ─── Atualização ───────────────────────────────────────────────
+    def touch(self, url: str) -> None:
+        """Resposta 304: o texto guardado continua válido."""
+        with self._lock:
+            if url in self.entries:
+                self.entries[url]["checked_at"] = _now()
+                self.stats["not_modified"] += 1
+
+    def store(self, url: str, text: str, etag: Optional[str] = None,
+              last_modified: Optional[str] = None,
+              index: Optional[LawIndex] = None) -> dict:
+        """Guarda o texto extraído de `url` (e seu índice) e devolve a entrada."""
+        with self.writer(url, etag, last_modified) as out:
+            out.write(text)
+            return out.commit(index=index)
+
+    def writer(self, url: str, etag: Optional[str] = None,
+               last_modified: Optional[str] = None) -> "TextWriter":
+        """Gravação em streaming do texto de `url` (ver TextWriter)."""
+        return TextWriter(self, url, etag, last_modified)
+
+    def _record(self, url: str, sha: str, chars: int, etag: Optional[str],
+                last_modified: Optional[str], index: Optional[LawIndex],
+                partial: bool) -> dict:
+        if index is not None:
+            index.save(self._index_blob(sha))
+            self._indexes[sha] = index
+        now = _now()
+        entry = {"sha256": sha, "fetched_at": now, "checked_at": now, "chars": chars}
+        if etag:
+            entry["etag"] = etag
+        if last_modified:
+            entry["last_modified"] = last_modified
+        if partial:
+            entry["partial"] = True
+        with self._lock:
+            previous = self.entries.get(url, {}).get("sha256")
+            self.entries[url] = entry
+            self.stats["stored"] += 1
+            orphan = (previous and previous != sha
+                      and all(e.get("sha256") != previous for e in self.entries.values()))
+        if orphan:
+            self._blob(previous).unlink(missing_ok=True)
+            self._index_blob(previous).unlink(missing_ok=True)
+        return dict(entry)
+
+
+class TextWriter:
+    """Texto de uma URL gravado em pedaços: `.part` + SHA-256 incremental.
+
+    `commit` renomeia para texts/<sha256>.txt (ou descarta, se o conteúdo já
+    existe) e registra a entrada; sem commit, o `.part` é apagado.
+    """
+
+    def __init__(self, corpus: LegalCorpus, url: str, etag: Optional[str],
+                 last_modified: Optional[str]):
+        self.corpus = corpus
+        self.url = url
+        self.etag = etag
+        self.last_modified = last_modified
+        self.chars = 0
+        texts = corpus.path / "texts"
+        texts.mkdir(parents=True, exist_ok=True)
+        self._tmp = texts / f"{os.getpid()}-{next(_part_ids)}.part"
+        self._file = open(self._tmp, "wb")
+        self._digest = hashlib.sha256()
+        self._done = False
+
+    def write(self, text: str) -> None:
+        data = text.encode("utf-8")
+        self._digest.update(data)
+        self._file.write(data)
+        self.chars += len(text)
+
+    def commit(self, index: Optional[LawIndex] = None, partial: bool = False) -> dict:
+        self._file.close()
+        self._done = True
+        sha = self._digest.hexdigest()
+        blob = self.corpus._blob(sha)
+        if blob.exists():
+            self._tmp.unlink(missing_ok=True)
+        else:
+            os.replace(self._tmp, blob)
+        return self.corpus._record(self.url, sha, self.chars, self.etag,
+                                   self.last_modified, index, partial)
+
+    def abort(self) -> None:
+        self._file.close()
+        self._done = True
+        self._tmp.unlink(missing_ok=True)
+
+    def __enter__(self) -> "TextWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if not self._done:
+            self.abort()
@@ -1,34 +1,106 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-"""Merge de dois relatórios JSON do validate_sources.py em um único.
+"""Merge de relatórios JSON do validate_sources.py em um único.
+
+Aceita relatórios `--json` e streams `--ndjson` (lidos linha a linha; uma
+última linha truncada por um processo morto é ignorada e o relatório é
+marcado como parcial), completos ou shards (`--shard i/N`). Resultados
+repetidos são deduplicados por (fonte, URL); se algum relatório declarar
+`shard`, todos os shards 1..N precisam estar presentes — caso contrário o
+relatório combinado lista `missing_shards` e a saída é 1.
 
 Uso:
     python scripts/merge_freshness_reports.py report1.json report2.json > combined.json
+    python scripts/merge_freshness_reports.py shard-*.json cid.json > combined.json
+    python scripts/merge_freshness_reports.py urls.ndjson cid.ndjson > combined.json
 """
 from __future__ import annotations
 
 import json
 import sys
 from datetime import date
+from typing import Iterator
+
+EMPTY_REPORT = {"timestamp": "", "total": 0, "ok": 0, "warnings": 0, "errors": 0, "results": []}
+
+
+def _is_ndjson(path: str) -> bool:
+    """NDJSON do validate_sources: primeira linha é um objeto com "event"."""
+    with open(path, encoding="utf-8") as f:
+        first = f.readline()
+    try:
+        return "event" in json.loads(first)
+    except (json.JSONDecodeError, TypeError):
+        return False
+
+
+def _iter_ndjson_results(path: str, report: dict) -> Iterator[dict]:
+    """Resultados de um stream NDJSON, lidos incrementalmente.
+
+    Ao final marca `report["partial"]` se não houve evento `summary` (processo
+    interrompido) e conta linhas ilegíveis (ex.: última linha truncada).
+    """
+    report["partial"] = True
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                report["bad_lines"] = report.get("bad_lines", 0) + 1
+                continue
+            kind = event.pop("event", "")
+            if kind == "result":
+                yield event
+            elif kind == "summary":
+                report["partial"] = False
+    if report["partial"] or report.get("bad_lines"):
+        print(f"⚠️  {path}: stream incompleto — {report.get('bad_lines', 0)} linha(s) "
+              "ilegível(is), resultados parciais aproveitados", file=sys.stderr)
 
 
 def load(path: str) -> dict:
     try:
+        if _is_ndjson(path):
+            with open(path, encoding="utf-8") as f:
+                start = json.loads(f.readline())
+            report = {"timestamp": start.get("timestamp", ""), "shard": start.get("shard")}
+            report["results"] = _iter_ndjson_results(path, report)
+            return report
         with open(path, encoding="utf-8") as f:
             return json.load(f)
     except (FileNotFoundError, json.JSONDecodeError):
-        return {"timestamp": "", "total": 0, "ok": 0, "warnings": 0, "errors": 0, "results": []}
+        return dict(EMPTY_REPORT)
 
 
-def main() -> int:
-    if len(sys.argv) < 2:
-        print("uso: merge_freshness_reports.py <r1.json> [<r2.json> ...]", file=sys.stderr)
-        return 2
+def result_key(result: dict) -> tuple[str, str]:
+    """Chave de deduplicação: (fonte, URL) — ou (fonte, item) sem URL."""
+    return (result.get("source", ""), result.get("url") or result.get("item", ""))
+
+
+def missing_shards(reports: list[dict]) -> list[int]:
+    """Shards (1-based) esperados mas ausentes. Vazio se não houver shards."""
+    totals = {r["shard"]["total"] for r in reports if r.get("shard")}
+    if not totals:
+        return []
+    expected = set(range(1, max(totals) + 1))
+    seen = {r["shard"]["index"] for r in reports if r.get("shard")}
+    if len(totals) > 1:
+        print(f"⚠️  Shards com totais divergentes: {sorted(totals)}", file=sys.stderr)
+    return sorted(expected - seen)
 
+
+def merge(reports: list[dict]) -> dict:
     merged_results: list[dict] = []
-    for path in sys.argv[1:]:
-        r = load(path)
-        merged_results.extend(r.get("results", []))
+    seen: set[tuple[str, str]] = set()
+    for r in reports:
+        for result in r.get("results", []):
+            key = result_key(result)
+            if key in seen:
+                continue
+            seen.add(key)
+            merged_results.append(result)
 
     combined = {
         "timestamp": date.today().isoformat(),
@@ -38,7 +110,25 @@ def main() -> int:
         "errors": sum(1 for r in merged_results if r.get("status") == "error"),
         "results": merged_results,
     }
+    missing = missing_shards(reports)
+    if missing:
+        combined["missing_shards"] = missing
+    partial = sum(1 for r in reports if r.get("partial"))
+    if partial:
+        combined["partial_reports"] = partial
+    return combined
+
+
+def main() -> int:
+    if len(sys.argv) < 2:
+        print("uso: merge_freshness_reports.py <r1.json> [<r2.json> ...]", file=sys.stderr)
+        return 2
+
+    combined = merge([load(path) for path in sys.argv[1:]])
     print(json.dumps(combined, ensure_ascii=False, indent=2))
+    if combined.get("missing_shards"):
+        print(f"❌ Shards ausentes: {combined['missing_shards']}", file=sys.stderr)
+        return 1
     return 0
 
 
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+OFICIAL HOSTS — Matcher único da allowlist de fontes oficiais
+
+Constrói, a partir de data/fontes_oficiais.json, uma trie de rótulos
+invertidos (`br → gov → planalto`) e responde em O(rótulos do host) qual
+entrada da allowlist casa com um host — independente do tamanho da
+allowlist. É a mesma classificação usada por:
+
+  - validate_schema (G1): URL fora da allowlist = violação
+  - validate_sources: política ci_blocked só para poder público BR
+  - validate_legal_compliance: camada (federal, estadual/municipal, ...)
+
+Semântica dos padrões (igual à regex anterior do G1):
+  - `*.gov.br`      → gov.br e qualquer subdomínio (rótulos [a-z0-9-])
+  - `www.in.gov.br` → só o host exato
+Com vários padrões casando, `match` devolve o mais específico (exato vence
+curinga no mesmo nível); `matches` devolve todos, do mais amplo ao mais
+específico.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+ALLOWLIST_JSON = Path(__file__).parent.parent / "data" / "fontes_oficiais.json"
+
+# Categorias da allowlist que são domínios do poder público brasileiro
+# (executivo, judiciário, legislativo, MP e defensoria) — base da política
+# ci_blocked do validate_sources (403/geo-fence em runner CI viram warning)
+PODER_PUBLICO_BR = frozenset({
+    "executivo-federal-estadual-municipal",
+    "executivo-estadual-municipal",
+    "judiciario",
+    "legislativo",
+    "ministerio-publico",
+    "defensoria-publica",
+})
+
+_LABEL_RE = re.compile(r"^[a-z0-9-]+$")
+_EXACT = "="
+_WILDCARD = "*"
+
+
+@dataclass(frozen=True)
+class Dominio:
+    """Entrada da allowlist que casou com um host."""
+
+    padrao: str
+    categoria: str
+
+
+class OficialHosts:
+    """Trie de rótulos invertidos sobre `dominios[].padrao`."""
+
+    def __init__(self, dominios: Iterable[dict]):
+        self._root: Dict[str, dict] = {}
+        self._size = 0
+        for entry in dominios:
+            self.add(entry["padrao"], entry.get("categoria", ""))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, padrao: str, categoria: str) -> None:
+        padrao = padrao.strip().lower()
+        wildcard = padrao.startswith("*.")
+        node = self._root
+        for label in reversed((padrao[2:] if wildcard else padrao).split(".")):
+            node = node.setdefault(label, {})
+        node[_WILDCARD if wildcard else _EXACT] = Dominio(padrao, categoria)
+        self._size += 1
+
+    def matches(self, host: str) -> List[Dominio]:
+        """Todas as entradas que casam com `host`, da mais ampla à mais específica."""
+        labels = (host or "").lower().split(".")
+        found: List[Dominio] = []
+        node = self._root
+        for depth, label in enumerate(reversed(labels), 1):
+            node = node.get(label)
+            if node is None:
+                break
+            rest = labels[:len(labels) - depth]
+            wildcard = node.get(_WILDCARD)
+            if wildcard is not None and all(_LABEL_RE.match(part) for part in rest):
+                found.append(wildcard)
+            if not rest and _EXACT in node:
+                found.append(node[_EXACT])
+        return found
+
+    def match(self, host: str) -> Optional[Dominio]:
+        """Entrada mais específica para `host`, ou None se fora da allowlist."""
+        found = self.matches(host)
+        return found[-1] if found else None
+
+    def is_poder_publico_br(self, host: str) -> bool:
+        """True se algum padrão casado é de poder público brasileiro."""
+        return any(d.categoria in PODER_PUBLICO_BR for d in self.matches(host))
+
+
+def load(path: Path = ALLOWLIST_JSON) -> OficialHosts:
+    """Matcher a partir de data/fontes_oficiais.json (ou outro arquivo)."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return OficialHosts(data.get("dominios", []))
+
+
+@lru_cache(maxsize=None)
+def default() -> OficialHosts:
+    """Matcher da allowlist do projeto, carregado uma vez por processo."""
+    return load(ALLOWLIST_JSON)
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ROUND ROBIN — Ordem de submissão intercalada por chave
+
+Os checadores de rede limitam a concorrência por grupo (vagas por host no
+validate_sources, semáforo por camada no validate_legal_compliance). Em
+ordem natural os itens de um mesmo grupo vêm juntos, e os workers ficam
+todos presos esperando a vaga desse grupo enquanto os demais ficam
+ociosos. `interleave` reordena em round-robin pela chave informada:
+
+    interleave(items, key=lambda item: host(item["url"]))
+    # a1 a2 a3 b1 c1  →  a1 b1 c1 a2 a3
+
+A ordem relativa dentro de cada grupo é preservada.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, Hashable, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+def interleave(items: Sequence[T], key: Callable[[T], Hashable]) -> List[T]:
+    """Reordena `items` em round-robin pelos grupos de `key(item)`.
+
+    Grupos entram na ordem da primeira ocorrência; cada volta pega o próximo
+    item de cada grupo que ainda tiver itens.
+    """
+    buckets: Dict[Hashable, List[T]] = {}
+    for item in items:
+        buckets.setdefault(key(item), []).append(item)
+    queues = list(buckets.values())
+    ordered: List[T] = []
+    depth = 0
+    while len(ordered) < len(items):
+        for queue in queues:
+            if depth < len(queue):
+                ordered.append(queue[depth])
+        depth += 1
+    return ordered
@@ -29,6 +29,12 @@ Uso:
     python scripts/validate_all.py --fix              # Auto-corrige problemas
     python scripts/validate_all.py --notify           # Envia notificações
     python scripts/validate_all.py --fix --notify     # Ambos
+    python scripts/validate_all.py --jobs 1           # Fases em série (sem paralelismo)
+    python scripts/validate_all.py --subprocess       # Também as fases sem rede em processo isolado
+    python scripts/validate_all.py --quick --no-cache # Ignora o cache de resultados por fase
+    python scripts/validate_all.py --trace trace.json # Exporta a linha do tempo (chrome://tracing)
+    python scripts/validate_all.py --profile-memory   # Pico de alocação in-process (tracemalloc)
+    python scripts/validate_all.py --trend            # p50/p95 por fase, regressões e flaky
 
 Configuração (variáveis de ambiente):
     SLACK_WEBHOOK_URL    - URL do webhook Slack para notificações
@@ -36,13 +42,22 @@ Configuração (variáveis de ambiente):
     AUTO_BACKUP=1        - Ativa backup automático antes de validações
 """
 
+import hashlib
+import importlib
+import importlib.util
+import io
 import json
 import os
+import re
 import subprocess
 import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 # Configurar encoding UTF-8 para saída (Windows compatibility)
 if hasattr(sys.stdout, 'reconfigure'):
@@ -55,33 +70,311 @@ elif hasattr(sys.stdout, 'buffer'):
 class ValidationResult:
     """Resultado de uma validação individual"""
 
-    def __init__(self, name: str, success: bool, message: str = "", details: str = "", is_timeout: bool = False):
+    def __init__(self, name: str, success: bool, message: str = "", details: str = "", is_timeout: bool = False,
+                 cached: bool = False):
         self.name = name
         self.success = success
         self.message = message
         self.details = details
         self.is_timeout = is_timeout
+        self.cached = cached  # reaproveitado do cache de fases (entradas inalteradas)
+        self.phase: Optional[str] = None  # chave da fase (métricas em report['phases'])
         self.timestamp = datetime.now()
 
 
+class _ThreadLocalStdout:
+    """sys.stdout que desvia a saída, por thread, para o buffer da fase.
+
+    Usado no modo in-process: cada validador roda numa thread do pool e o
+    que ele imprime vira o `details` do seu ValidationResult, como o stdout
+    capturado do subprocess. Threads sem buffer escrevem no stdout real.
+    """
+
+    def __init__(self, real):
+        self._real = real
+        self._local = threading.local()
+
+    def capture(self, buffer: Optional[io.StringIO]):
+        self._local.buffer = buffer
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer if buffer is not None else self._real).write(text)
+
+    def flush(self):
+        if getattr(self._local, 'buffer', None) is None:
+            self._real.flush()
+
+    def reconfigure(self, **kwargs):
+        """No-op: validadores chamam sys.stdout.reconfigure(encoding='utf-8')."""
+
+    def isatty(self) -> bool:
+        return False
+
+    def __getattr__(self, name):
+        return getattr(self._real, name)
+
+
+# Após matar um filho por timeout, espera máxima pelos pipes (netos podem herdá-los)
+_KILL_GRACE_S = 1.0
+
+
+def _communicate_with_rusage(proc: subprocess.Popen, timeout: float):
+    """Lê stdout/stderr e coleta o filho com os.wait4 numa thread dedicada.
+
+    Retorna (stdout, stderr, rusage, timed_out): CPU e pico de RSS do próprio
+    subprocess — RUSAGE_CHILDREN misturaria fases concorrentes. Estourado o
+    timeout, o filho é morto e coletado; os pipes ganham só _KILL_GRACE_S para
+    esvaziar (um neto que herdou stdout/stderr, como workers do pytest-xdist,
+    não segura a execução) e retorna o que foi capturado até ali.
+
+    As threads leitoras são donas dos pipes e os fecham ao terminar.
+    """
+    streams = {'stdout': [], 'stderr': []}
+    reaped = {}
+
+    def read(name, pipe):
+        with pipe:
+            for line in pipe:  # por linha: no timeout, o parcial já está capturado
+                streams[name].append(line)
+
+    def reap():
+        _, status, reaped['rusage'] = os.wait4(proc.pid, 0)
+        reaped['status'] = status
+
+    readers = [threading.Thread(target=read, args=(name, pipe), daemon=True)
+               for name, pipe in (('stdout', proc.stdout), ('stderr', proc.stderr))]
+    waiter = threading.Thread(target=reap, daemon=True)
+    for thread in (*readers, waiter):
+        thread.start()
+    waiter.join(timeout)
+    timed_out = waiter.is_alive()
+    if timed_out:
+        proc.kill()  # ainda não coletado: o pid segue válido
+        waiter.join()
+    for thread in readers:
+        thread.join(_KILL_GRACE_S if timed_out else None)
+    # returncode definido: o Popen não tenta coletar de novo um pid já reaproveitável
+    proc.returncode = os.waitstatus_to_exitcode(reaped['status'])
+    return ''.join(streams['stdout']), ''.join(streams['stderr']), reaped['rusage'], timed_out
+
+
+def _maxrss_kb(rusage) -> int:
+    """ru_maxrss em KiB (macOS reporta bytes, Linux já reporta KiB)."""
+    return rusage.ru_maxrss // 1024 if sys.platform == 'darwin' else rusage.ru_maxrss
+
+
+# Cache de resultados por fase (local, fora do git — ver .gitignore)
+PHASE_CACHE_DIR = Path(__file__).parent.parent / '.cache' / 'validate_all'
+
+# Histórico append-only (uma linha NDJSON por execução) para --trend
+HISTORY_FILE = PHASE_CACHE_DIR / 'history.ndjson'
+TREND_WINDOW = 20            # últimas N execuções consideradas
+REGRESSION_THRESHOLD = 0.5   # +50% sobre a mediana histórica
+REGRESSION_MIN_SECONDS = 1.0  # ignora oscilações absolutas pequenas
+TREND_MIN_RUNS = 3           # execuções anteriores necessárias para comparar
+
+
+def _percentile(values: Sequence[float], q: float) -> float:
+    """Percentil com interpolação linear (q em 0..100)."""
+    ordered = sorted(values)
+    pos = (len(ordered) - 1) * q / 100
+    low = int(pos)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (pos - low)
+
+
+def load_history(path: Path = HISTORY_FILE, limit: Optional[int] = None) -> List[dict]:
+    """Execuções registradas, da mais antiga para a mais recente.
+
+    Linhas ilegíveis (ex.: escrita interrompida) são ignoradas.
+    """
+    entries = []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    except FileNotFoundError:
+        return []
+    return entries[-limit:] if limit else entries
+
+
+def compute_trend(entries: List[dict], threshold: float = REGRESSION_THRESHOLD,
+                  min_seconds: float = REGRESSION_MIN_SECONDS,
+                  min_runs: int = TREND_MIN_RUNS) -> Dict[str, dict]:
+    """p50/p95 por fase, regressão da última execução e instabilidade.
+
+    Durações de fases reaproveitadas do cache ou que estouraram o timeout
+    não entram nas estatísticas. A última execução é comparada com a
+    mediana das anteriores: regressão = acima de p50 × (1 + threshold) e
+    pelo menos `min_seconds` mais lenta. Flaky = alternou entre sucesso e
+    falha ao menos duas vezes na janela.
+    """
+    trend: Dict[str, dict] = {}
+    keys = list(dict.fromkeys(k for e in entries for k in e.get('phases', {})))
+    for key in keys:
+        runs = [e['phases'][key] for e in entries if key in e.get('phases', {})]
+        durations = [r['wall_s'] for r in runs if not r.get('cached') and not r.get('timeout')]
+        outcomes = [bool(r.get('success')) for r in runs]
+        flips = sum(1 for a, b in zip(outcomes, outcomes[1:]) if a != b)
+        stats = {
+            'runs': len(runs),
+            'failures': outcomes.count(False),
+            'flaky': flips >= 2,
+            'p50': round(_percentile(durations, 50), 3) if durations else None,
+            'p95': round(_percentile(durations, 95), 3) if durations else None,
+            'last': None,
+            'regression': False,
+        }
+        last = runs[-1]
+        if not last.get('cached') and not last.get('timeout'):
+            stats['last'] = round(last['wall_s'], 3)
+        if stats['last'] is not None and len(durations) > min_runs:
+            baseline = _percentile(durations[:-1], 50)
+            stats['regression'] = (last['wall_s'] > baseline * (1 + threshold)
+                                   and last['wall_s'] - baseline >= min_seconds)
+        trend[key] = stats
+    return trend
+
+
+def print_trend(trend: Dict[str, dict], runs: int):
+    print("=" * 100)
+    print(f"📈 TENDÊNCIA DE DESEMPENHO — últimas {runs} execução(ões)")
+    print("=" * 100)
+    if not trend:
+        print("   (sem histórico — rode validate_all.py ao menos uma vez)")
+        return
+    def fmt(value: Optional[float]) -> str:
+        return f"{value:.2f}s" if value is not None else "—"
+
+    print(f"   {'fase':<17} {'runs':>4} {'p50':>8} {'p95':>8} {'última':>8} {'falhas':>6}")
+    for key, t in trend.items():
+        flags = []
+        if t['regression']:
+            flags.append("🐢 REGRESSÃO")
+        if t['flaky']:
+            flags.append("🎲 FLAKY")
+        print(f"   {key:<17} {t['runs']:>4} {fmt(t['p50']):>8} {fmt(t['p95']):>8} "
+              f"{fmt(t['last']):>8} {t['failures']:>6}  {' '.join(flags)}".rstrip())
+
+
+# Fases independentes rodam em paralelo (as de rede passam a maior parte do
+# tempo esperando I/O); --jobs 1 volta à execução em série.
+DEFAULT_JOBS = 4
+
+# Linha de resumo do pool HTTP do validate_sources (bytes de corpo lidos)
+_POOL_BYTES_RE = re.compile(r"(\d+) KiB de corpo lidos")
+
+
+class Phase:
+    """Fase declarativa do grafo de validação.
+
+    `run` devolve um ou mais ValidationResult; `deps` são chaves de fases que
+    precisam terminar antes (só ordem — uma dependência que falhou não impede
+    a fase, como na execução em série). Fases sem `deps` pendentes rodam em
+    paralelo no pool de `--jobs` workers.
+
+    `inputs` (globs relativos à raiz, incluindo o próprio validador) tornam a
+    fase cacheável: com o mesmo hash de entradas, o último resultado de
+    sucesso é reaproveitado. Fases de rede ou que olham o workspace inteiro
+    não declaram `inputs`.
+    """
+
+    def __init__(self, key: str, banner: str, run: Callable[[], object],
+                 deps: Sequence[str] = (), quick: bool = False, script: Optional[Path] = None,
+                 inputs: Sequence[str] = ()):
+        self.key = key
+        self.banner = banner
+        self.run = run
+        self.deps = tuple(deps)
+        self.quick = quick
+        self.script = script
+        self.inputs = tuple(inputs)
+
+
 class MasterValidator:
     """
     Orquestrador de todas as validações do projeto
     Executa scripts em ordem de prioridade e consolida resultados
     """
 
-    def __init__(self, auto_fix: bool = False, notify: bool = False, verbose: bool = True):
+    def __init__(self, auto_fix: bool = False, notify: bool = False, verbose: bool = True,
+                 jobs: int = DEFAULT_JOBS, use_subprocess: bool = False,
+                 use_cache: bool = True, cache_dir: Path = PHASE_CACHE_DIR,
+                 profile_memory: bool = False, history_file: Optional[Path] = HISTORY_FILE):
         self.auto_fix = auto_fix
         self.notify = notify
         self.verbose = verbose
+        self.jobs = max(1, jobs)
+        self.use_subprocess = use_subprocess
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir
+        self.cache_stats = {'eligible': 0, 'hits': 0}
+        # tracemalloc deixa a fase de schema ~5x mais lenta: só sob demanda
+        self.profile_memory = profile_memory
+        self.history_file = history_file  # None = não registra a execução
+        self.quick = False
+        self.wall_time = 0.0
+        # JSONs parseados uma vez em validate_json_files e compartilhados
+        # (somente leitura) com os validadores no modo in-process
+        self.dataset: Dict[str, dict] = {}
+        self._stdout: Optional[_ThreadLocalStdout] = None
         self.results: List[ValidationResult] = []
         self.root = Path(__file__).parent.parent
+        self._local = threading.local()
+        self._print_lock = threading.Lock()
+        # Métricas por fase (wall, CPU, memória, rede) para o relatório/trace
+        self.phase_metrics: Dict[str, dict] = {}
+        self._t0 = time.monotonic()
 
     def log(self, message: str):
-        """Log condicional baseado em verbose"""
-        if self.verbose:
+        """Log condicional baseado em verbose.
+
+        Dentro de uma fase o log vai para o buffer da fase, impresso em bloco
+        quando ela termina — fases paralelas não intercalam linhas.
+        """
+        if not self.verbose:
+            return
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is not None:
+            buffer.append(message)
+        else:
             print(message)
 
+    def _record(self, cpu_s: float = 0.0, peak_rss_kb: Optional[int] = None,
+                peak_alloc_kb: Optional[int] = None, net_bytes: Optional[int] = None):
+        """Soma medições de um validador às métricas da fase corrente.
+
+        net_bytes só é informado pela fase sources; as demais fases de rede
+        não expõem os bytes lidos e ficam com None.
+        """
+        metrics = getattr(self._local, 'metrics', None)
+        if metrics is None:
+            return
+        metrics['cpu_s'] += cpu_s
+        for key, value in (('peak_rss_kb', peak_rss_kb), ('peak_alloc_kb', peak_alloc_kb)):
+            if value is not None:
+                metrics[key] = max(metrics[key] or 0, value)
+        if net_bytes is not None:
+            metrics['net_bytes'] = (metrics['net_bytes'] or 0) + net_bytes
+
+    def _run_command(self, cmd: List[str], timeout: float) -> subprocess.CompletedProcess:
+        """subprocess.run com rusage do filho registrado nas métricas da fase."""
+        popen_kwargs = dict(cwd=self.root, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            text=True, encoding='utf-8', errors='replace')
+        if not hasattr(os, 'wait4'):  # Windows: sem rusage por processo
+            return subprocess.run(cmd, timeout=timeout, **popen_kwargs)
+        # Sem `with`: fechar um pipe ainda em leitura bloquearia nesta thread
+        proc = subprocess.Popen(cmd, **popen_kwargs)
+        stdout, stderr, rusage, timed_out = _communicate_with_rusage(proc, timeout)
+        self._record(cpu_s=rusage.ru_utime + rusage.ru_stime, peak_rss_kb=_maxrss_kb(rusage))
+        if timed_out:
+            raise subprocess.TimeoutExpired(cmd, timeout, stdout, stderr)
+        return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
     def run_script(self, name: str, script_path: str, timeout: int = 60,
                    timeout_as_warning: bool = False,
                    extra_args: list[str] | None = None) -> ValidationResult:
@@ -93,15 +386,7 @@ class MasterValidator:
             cmd.extend(extra_args)
 
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=self.root,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                encoding='utf-8',
-                errors='replace'
-            )
+            result = self._run_command(cmd, timeout)
 
             success = result.returncode == 0
 
@@ -126,6 +411,109 @@ class MasterValidator:
             self.log(f"      {str(e)}")
             return ValidationResult(name, False, f"Exception: {str(e)}")
 
+    def run_validator(self, name: str, script_path: Path, target: Callable[[], object],
+                      timeout: int = 60, timeout_as_warning: bool = False,
+                      extra_args: list[str] | None = None) -> ValidationResult:
+        """Executa um validador in-process (padrão) ou via subprocess (--subprocess).
+
+        In-process: `target` importa o entry point do validador e o chama com
+        o dataset já parseado; o retorno (bool ou exit code) e o stdout
+        capturado viram o ValidationResult, como no subprocess. O timeout é
+        aplicado com join na thread do validador — que não pode ser
+        interrompida. Por isso só fases sem rede (CPU, segundos) passam por
+        aqui; as de rede usam `run_script`, cujo timeout mata o processo
+        junto com o pool de workers dele.
+        """
+        if self.use_subprocess or self._stdout is None:
+            return self.run_script(name, script_path, timeout=timeout,
+                                   timeout_as_warning=timeout_as_warning, extra_args=extra_args)
+
+        self.log(f"▶️  {name}...")
+        output = io.StringIO()
+        outcome: Dict[str, object] = {}
+
+        metrics = getattr(self._local, 'metrics', None)
+
+        def worker():
+            # A thread do validador soma nas métricas da fase que a disparou;
+            # o pico do tracemalloc é do processo (aproximado com --jobs > 1)
+            self._local.metrics = metrics
+            self._stdout.capture(output)
+            tracing = tracemalloc.is_tracing()
+            if tracing:
+                base = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+            cpu = time.thread_time()
+            try:
+                outcome['value'] = target()
+            except SystemExit as e:
+                outcome['value'] = e.code if e.code is not None else 0
+            except Exception as e:
+                outcome['error'] = e
+            finally:
+                self._stdout.capture(None)
+                self._record(cpu_s=time.thread_time() - cpu,
+                             peak_alloc_kb=(tracemalloc.get_traced_memory()[1] - base) // 1024
+                             if tracing else None)
+
+        thread = threading.Thread(target=worker, name=f"validator-{script_path.stem}", daemon=True)
+        thread.start()
+        thread.join(timeout)
+
+        if thread.is_alive():
+            # A thread segue em background (daemon) até o fim do processo
+            if timeout_as_warning:
+                self.log(f"   ⏱️ {name}: TIMEOUT ({timeout}s) — rede lenta (warning)")
+                return ValidationResult(name, True, f"Timeout after {timeout}s (rede)", is_timeout=True)
+            self.log(f"   ⏱️ {name}: TIMEOUT ({timeout}s)")
+            return ValidationResult(name, False, f"Timeout after {timeout}s")
+
+        if 'error' in outcome:
+            e = outcome['error']
+            self.log(f"   ❌ {name}: EXCEPTION")
+            self.log(f"      {str(e)}")
+            return ValidationResult(name, False, f"Exception: {str(e)}")
+
+        # Mesmo contrato do exit code: retorno normal (None), True ou 0 = sucesso
+        value = outcome.get('value')
+        success = value is None or value is True or (type(value) is int and value == 0)
+        if success:
+            self.log(f"   ✅ {name}: OK")
+            return ValidationResult(name, True, "Validation passed", output.getvalue())
+        self.log(f"   ❌ {name}: FAILED")
+        error_msg = output.getvalue()[-500:] or "Unknown error"
+        self.log(f"      Error: {error_msg}")
+        return ValidationResult(name, False, "Validation failed", error_msg)
+
+    def _import_validator(self, module: str):
+        """Importa um validador de scripts/ (mesmo diretório deste arquivo)."""
+        scripts = str(self.root / "scripts")
+        if scripts not in sys.path:
+            sys.path.insert(0, scripts)
+        return importlib.import_module(module)
+
+    def _schema_target(self):
+        datasets = {'dicionario_pcd.json': self.dataset.get('dicionario'),
+                    'matching_engine.json': self.dataset.get('matching')}
+        return self._import_validator("validate_schema").run(
+            data=self.dataset.get('direitos'),
+            datasets={name: doc for name, doc in datasets.items() if doc is not None},
+            use_cache=self.use_cache)
+
+    def _content_target(self):
+        content = self._import_validator("validate_content")
+        return content.ContentValidator(
+            data=self.dataset.get('direitos'), matching=self.dataset.get('matching')).run()
+
+    def _sources_phase(self, script_path: Path) -> ValidationResult:
+        """validate_sources em subprocess; bytes de rede lidos vêm do resumo do pool."""
+        result = self.run_script("Fontes Oficiais (gov.br, planalto)", script_path,
+                                 timeout=180, timeout_as_warning=True)
+        match = _POOL_BYTES_RE.search(result.details or "")
+        if match:
+            self._record(net_bytes=int(match.group(1)) * 1024)
+        return result
+
     def validate_structure(self) -> ValidationResult:
         """Valida estrutura de arquivos e pastas"""
         self.log("▶️  Validando estrutura de arquivos...")
@@ -222,18 +610,18 @@ class MasterValidator:
         """Valida sintaxe de arquivos JSON"""
         self.log("▶️  Validando arquivos JSON...")
 
-        json_files = [
-            'data/direitos.json',
-            'data/dicionario_pcd.json',
-            'data/matching_engine.json'
-        ]
+        json_files = {
+            'direitos': 'data/direitos.json',
+            'dicionario': 'data/dicionario_pcd.json',
+            'matching': 'data/matching_engine.json'
+        }
 
         errors = []
-        for file_path in json_files:
+        for key, file_path in json_files.items():
             try:
                 with open(self.root / file_path, 'r', encoding='utf-8') as f:
-                    json.load(f)
-            except json.JSONDecodeError as e:
+                    self.dataset[key] = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError) as e:
                 errors.append(f"{file_path}: {str(e)}")
 
         if errors:
@@ -272,19 +660,19 @@ class MasterValidator:
         self.log(f"   ✅ Backup criado em: {backup_dir}")
 
     def run_pytest(self, name: str, test_path: str, timeout: int = 120) -> ValidationResult:
-        """Executa pytest e retorna resultado"""
+        """Executa pytest e retorna resultado.
+
+        Com pytest-xdist instalado (requirements-dev.txt) a suíte roda em
+        paralelo (`-n auto`); os workers compartilham os snapshots de dados
+        gerados pelo conftest.
+        """
         self.log(f"▶️  {name}...")
 
+        cmd = [sys.executable, "-m", "pytest", str(test_path), "-v", "--tb=short"]
+        if importlib.util.find_spec("xdist") is not None:
+            cmd += ["-n", "auto"]
         try:
-            result = subprocess.run(
-                [sys.executable, "-m", "pytest", str(test_path), "-v", "--tb=short"],
-                cwd=self.root,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                encoding='utf-8',
-                errors='replace'
-            )
+            result = self._run_command(cmd, timeout)
 
             success = result.returncode == 0
 
@@ -361,9 +749,194 @@ class MasterValidator:
         print()
         print("=" * 100)
 
+    def phases(self) -> List[Phase]:
+        """Grafo de fases na ordem declarada (= ordem do relatório)."""
+        scripts = self.root / "scripts"
+        return [
+            Phase("pre", "📋 FASE 1/11: PRÉ-VALIDAÇÕES (Estrutura & Sintaxe)",
+                  lambda: [self.validate_structure(), self.validate_json_files(),
+                           self.validate_workspace_hygiene()],
+                  quick=True),
+            Phase("schema", "📐 FASE 2/11: VALIDAÇÃO DE SCHEMA (JSON Schema Draft 7)",
+                  lambda: self.run_validator(
+                      "JSON Schema (direitos.json vs schema)",
+                      scripts / "validate_schema.py",
+                      self._schema_target,
+                      timeout=30,
+                      extra_args=None if self.use_cache else ['--no-cache']
+                  ),
+                  deps=("pre",), quick=True,
+                  inputs=("data/*.json", "schemas/*.json", "scripts/validate_schema.py",
+                          "scripts/data_walker.py", "scripts/oficial_hosts.py")),
+            Phase("content", "🔬 FASE 3/11: VALIDAÇÃO DE CONTEÚDO PROFUNDO (147 checks)",
+                  lambda: self.run_validator(
+                      "Conteúdo Profundo (categorias, matching engine, IPVA, semântica)",
+                      scripts / "validate_content.py",
+                      self._content_target,
+                      timeout=60
+                  ),
+                  deps=("schema",), quick=True,
+                  inputs=("data/*.json", "index.html", "js/app.js", "scripts/validate_content.py",
+                          "scripts/data_walker.py")),
+            # Fases de rede: sempre em subprocess (ver run_validator)
+            Phase("sources", "🔗 FASE 5/8: VALIDAÇÃO DE FONTES OFICIAIS (URLs)",
+                  lambda: self._sources_phase(scripts / "validate_sources.py"),
+                  deps=("pre",), script=scripts / "validate_sources.py"),
+            Phase("legal_compliance", "⚖️ FASE 6/8: BASE LEGAL (Compliance, Vigência)",
+                  lambda: self.run_script(
+                      "Base Legal (compliance, vigência de leis)",
+                      scripts / "validate_legal_compliance.py",
+                      timeout=240,
+                      timeout_as_warning=True
+                  ),
+                  deps=("pre",), script=scripts / "validate_legal_compliance.py"),
+            Phase("legal_sources", "📜 FASE 7/8: FONTES LEGAIS (Acesso HTTP)",
+                  lambda: self.run_script(
+                      "Fontes Legais (acesso HTTP a fontes oficiais)",
+                      scripts / "validate_legal_sources.py",
+                      timeout=180
+                  ),
+                  deps=("pre",), script=scripts / "validate_legal_sources.py"),
+            Phase("pytest", "🧪 FASE 8/8: PYTEST (Unit Tests — JSON, campos, base_legal)",
+                  lambda: self.run_pytest(
+                      "Pytest (tests/test_master_compliance.py)",
+                      "tests/"
+                  ),
+                  deps=("pre",)),
+        ]
+
+    def _phase_hash(self, phase: Phase) -> str:
+        """Hash do conteúdo das entradas declaradas da fase (arquivos ordenados)."""
+        digest = hashlib.sha256(phase.key.encode('utf-8'))
+        files = sorted({f for pattern in phase.inputs for f in self.root.glob(pattern) if f.is_file()})
+        for f in files:
+            digest.update(f.relative_to(self.root).as_posix().encode('utf-8'))
+            digest.update(hashlib.sha256(f.read_bytes()).digest())
+        return digest.hexdigest()
+
+    def _load_cached(self, phase: Phase, key: str) -> Optional[List[ValidationResult]]:
+        try:
+            with open(self.cache_dir / f"{phase.key}.json", 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if entry.get('hash') != key:
+            return None
+        return [
+            ValidationResult(r['name'], r['success'], r['message'], r.get('details', ''),
+                             r.get('is_timeout', False), cached=True)
+            for r in entry.get('results', [])
+        ]
+
+    def _store_cached(self, phase: Phase, key: str, results: List[ValidationResult]):
+        """Guarda só resultados de sucesso: falhas sempre reexecutam."""
+        if not results or not all(r.success and not r.is_timeout for r in results):
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / f"{phase.key}.json"
+        tmp = path.with_name(path.name + '.part')
+        entry = {
+            'hash': key,
+            'stored_at': datetime.now().isoformat(),
+            'results': [
+                {'name': r.name, 'success': r.success, 'message': r.message,
+                 'details': r.details, 'is_timeout': r.is_timeout}
+                for r in results
+            ],
+        }
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def _run_phase(self, phase: Phase) -> Tuple[List[ValidationResult], float]:
+        """Executa uma fase com log bufferizado; imprime o bloco ao terminar."""
+        self._local.buffer = []
+        self._local.metrics = metrics = {
+            'cpu_s': 0.0, 'peak_rss_kb': None, 'peak_alloc_kb': None, 'net_bytes': None}
+        started = time.monotonic()
+        cpu = time.thread_time()
+        cache_key = None
+        try:
+            if phase.script is not None and not phase.script.exists():
+                self.log(f"   ⚠️ {phase.script.name}: NÃO ENCONTRADO")
+                outcome = []
+            else:
+                outcome = None
+                if self.use_cache and phase.inputs:
+                    cache_key = self._phase_hash(phase)
+                    outcome = self._load_cached(phase, cache_key)
+                    with self._print_lock:
+                        self.cache_stats['eligible'] += 1
+                        self.cache_stats['hits'] += outcome is not None
+                    for r in outcome or []:
+                        self.log(f"   ♻️ {r.name}: OK (cache — entradas inalteradas)")
+                if outcome is None:
+                    outcome = phase.run()
+                    if isinstance(outcome, ValidationResult):
+                        outcome = [outcome]
+                    if cache_key is not None:
+                        self._store_cached(phase, cache_key, list(outcome))
+        except Exception as e:
+            self.log(f"   ❌ {phase.key}: EXCEPTION — {str(e)}")
+            outcome = ValidationResult(phase.key, False, f"Exception: {str(e)}")
+        finally:
+            lines, self._local.buffer = self._local.buffer, None
+            self._local.metrics = None
+        elapsed = time.monotonic() - started
+        if isinstance(outcome, ValidationResult):
+            outcome = [outcome]
+        metrics.update(
+            start_s=round(started - self._t0, 6),
+            wall_s=round(elapsed, 6),
+            cpu_s=round(metrics['cpu_s'] + time.thread_time() - cpu, 6),
+            cached=bool(outcome) and all(r.cached for r in outcome),
+            thread=threading.current_thread().name,
+        )
+
+        with self._print_lock:
+            if phase.banner:
+                print()
+                print("=" * 100)
+                print(phase.banner)
+                print("=" * 100)
+            for line in lines:
+                print(line)
+            self.phase_metrics[phase.key] = metrics
+        return list(outcome), elapsed
+
+    def run_phases(self, phases: List[Phase]) -> Dict[str, List[ValidationResult]]:
+        """Executa o grafo com até `self.jobs` fases simultâneas.
+
+        Uma fase entra no pool assim que todas as suas dependências terminam;
+        o tempo total passa a ser o do caminho crítico, não a soma das fases.
+        """
+        keys = {p.key for p in phases}
+        pending = {p.key: p for p in phases}
+        done: Dict[str, List[ValidationResult]] = {}
+        self.phase_durations: Dict[str, float] = {}
+        self._t0 = time.monotonic()
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            while pending or running:
+                for key, phase in list(pending.items()):
+                    if len(running) >= self.jobs:
+                        break
+                    # Dependências fora do grafo (ex.: modo quick) são ignoradas
+                    if all(d in done or d not in keys for d in phase.deps):
+                        running[pool.submit(self._run_phase, phase)] = key
+                        del pending[key]
+                if not running:
+                    raise RuntimeError(f"Dependência circular entre fases: {sorted(pending)}")
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    key = running.pop(future)
+                    done[key], self.phase_durations[key] = future.result()
+        return done
+
     def run_all_validations(self, quick: bool = False) -> Tuple[int, int]:
         """
-        Executa todas as validações em ordem de prioridade.
+        Executa todas as validações (grafo de fases, até `jobs` em paralelo).
         quick=True: apenas fases 1-4 (sem rede, sem testes longos).
         Retorna: (passed, total)
         """
@@ -374,6 +947,7 @@ class MasterValidator:
         print(f"🔧 Modo: {'AUTO-FIX ✨' if self.auto_fix else 'READ-ONLY 📖'}")
         print(f"📢 Notificações: {'ATIVADAS ✅' if self.notify else 'DESATIVADAS ❌'}")
         print(f"⚡ Quick: {'SIM (fases 1-4)' if quick else 'NÃO (todas as 16 fases)'}")
+        print(f"🧵 Jobs: {self.jobs} ({'subprocess' if self.use_subprocess else 'in-process'})")
         print()
 
         # Backup preventivo se auto-fix ativo
@@ -381,123 +955,84 @@ class MasterValidator:
             self.backup_before_fixes()
             print()
 
-        # ====================
-        # FASE 1: PRÉ-VALIDAÇÕES (Estrutura & Sintaxe)
-        # ====================
-        print("=" * 100)
-        print("📋 FASE 1/11: PRÉ-VALIDAÇÕES (Estrutura & Sintaxe)")
-        print("=" * 100)
-
-        self.results.append(self.validate_structure())
-        self.results.append(self.validate_json_files())
-        self.results.append(self.validate_workspace_hygiene())
-
-        # ====================
-        # FASE 2: SCHEMA (JSON Schema Draft 7)
-        # ====================
-        print()
-        print("=" * 100)
-        print("📐 FASE 2/11: VALIDAÇÃO DE SCHEMA (JSON Schema Draft 7)")
-        print("=" * 100)
-
-        self.results.append(self.run_script(
-            "JSON Schema (direitos.json vs schema)",
-            self.root / "scripts" / "validate_schema.py",
-            timeout=30
-        ))
-
-        # ====================
-        # FASE 3: CONTEÚDO PROFUNDO (36 categorias, matching, IPVA, semântica)
-        # ====================
-        print()
-        print("=" * 100)
-        print("🔬 FASE 3/11: VALIDAÇÃO DE CONTEÚDO PROFUNDO (147 checks)")
-        print("=" * 100)
-
-        self.results.append(self.run_script(
-            "Conteúdo Profundo (categorias, matching engine, IPVA, semântica)",
-            self.root / "scripts" / "validate_content.py",
-            timeout=60
-        ))
-
-        # No modo quick, parar aqui após pré-validações + schema.
-        if quick:
-            self._print_summary()
-            return sum(1 for r in self.results if r.success), len(self.results)
-
-        # ====================
-        # FASE 5: FONTES OFICIAIS (URLs gov.br, planalto)
-        # ====================
-        print()
-        print("=" * 100)
-        print("🔗 FASE 5/8: VALIDAÇÃO DE FONTES OFICIAIS (URLs)")
-        print("=" * 100)
-
-        if (self.root / "scripts" / "validate_sources.py").exists():
-            self.results.append(self.run_script(
-                "Fontes Oficiais (gov.br, planalto)",
-                self.root / "scripts" / "validate_sources.py",
-                timeout=180,
-                timeout_as_warning=True
-            ))
-        else:
-            self.log("   ⚠️ validate_sources.py: NÃO ENCONTRADO")
-
-        # ====================
-        # FASE 6: BASE LEGAL (Compliance, leis vigentes)
-        # ====================
-        print()
-        print("=" * 100)
-        print("⚖️ FASE 6/8: BASE LEGAL (Compliance, Vigência)")
-        print("=" * 100)
-
-        if (self.root / "scripts" / "validate_legal_compliance.py").exists():
-            self.results.append(self.run_script(
-                "Base Legal (compliance, vigência de leis)",
-                self.root / "scripts" / "validate_legal_compliance.py",
-                timeout=240,
-                timeout_as_warning=True
-            ))
-        else:
-            self.log("   ⚠️ validate_legal_compliance.py: NÃO ENCONTRADO")
-
-        # ====================
-        # FASE 7: FONTES LEGAIS (acesso HTTP)
-        # ====================
-        print()
-        print("=" * 100)
-        print("📜 FASE 7/8: FONTES LEGAIS (Acesso HTTP)")
-        print("=" * 100)
-
-        if (self.root / "scripts" / "validate_legal_sources.py").exists():
-            self.results.append(self.run_script(
-                "Fontes Legais (acesso HTTP a fontes oficiais)",
-                self.root / "scripts" / "validate_legal_sources.py",
-                timeout=180
-            ))
-        else:
-            self.log("   ⚠️ validate_legal_sources.py: NÃO ENCONTRADO")
-
-        # ====================
-        # FASE 8: PYTEST (Unit Tests)
-        # ====================
-        print()
-        print("=" * 100)
-        print("🧪 FASE 8/8: PYTEST (Unit Tests — JSON, campos, base_legal)")
-        print("=" * 100)
-
-        self.results.append(self.run_pytest(
-            "Pytest (tests/test_master_compliance.py)",
-            "tests/"
-        ))
+        # No modo quick, só pré-validações + schema + conteúdo (sem rede).
+        self.quick = quick
+        phases = [p for p in self.phases() if p.quick or not quick]
+        started = time.monotonic()
+        trace_memory = self.profile_memory and not self.use_subprocess and not tracemalloc.is_tracing()
+        if not self.use_subprocess:
+            self._stdout = _ThreadLocalStdout(sys.stdout)
+            sys.stdout = self._stdout
+        if trace_memory:
+            tracemalloc.start()
+        try:
+            done = self.run_phases(phases)
+        finally:
+            if trace_memory:
+                tracemalloc.stop()
+            if self._stdout is not None:
+                sys.stdout = self._stdout._real
+                self._stdout = None
+
+        # Relatório na ordem declarada, independente da ordem de conclusão
+        for phase in phases:
+            for r in done[phase.key]:
+                r.phase = phase.key
+            self.results.extend(done[phase.key])
 
         # ====================
         # CONSOLIDAÇÃO DE RESULTADOS
         # ====================
         self._print_summary()
+        wall = self.wall_time = time.monotonic() - started
+        serial = sum(self.phase_durations.values())
+        print(f"⏱️ Tempo total: {wall:.1f}s (soma das fases: {serial:.1f}s, jobs={self.jobs})")
+        for phase in phases:
+            m = self.phase_metrics.get(phase.key)
+            if m:
+                print(f"   • {phase.key:<17} {self._format_metrics(m)}")
+        if self.use_cache and self.cache_stats['eligible']:
+            print(f"♻️ Cache de fases: {self.cache_stats['hits']}/{self.cache_stats['eligible']} "
+                  "reaproveitadas (entradas e validador inalterados)")
 
         return sum(1 for r in self.results if r.success), len(self.results)
 
+    @staticmethod
+    def _format_metrics(m: dict) -> str:
+        parts = [f"{m['wall_s']:.1f}s", f"CPU {m['cpu_s']:.1f}s"]
+        if m['peak_rss_kb'] is not None:
+            parts.append(f"RSS {m['peak_rss_kb'] / 1024:.0f} MiB")
+        if m['peak_alloc_kb'] is not None:
+            parts.append(f"alloc {m['peak_alloc_kb'] / 1024:.1f} MiB")
+        if m['net_bytes'] is not None:
+            parts.append(f"rede {m['net_bytes'] / 1024:.0f} KiB")
+        if m['cached']:
+            parts.append("cache")
+        return " | ".join(parts)
+
+    def write_trace(self, path: Path) -> Path:
+        """Exporta as fases no formato Chrome trace-event (chrome://tracing, Perfetto).
+
+        Uma trilha (tid) por worker do pool; cada fase é um evento completo
+        ("ph": "X") com as métricas em `args`.
+        """
+        tids: Dict[str, int] = {}
+        events = []
+        for key, m in sorted(self.phase_metrics.items(), key=lambda kv: kv[1]['start_s']):
+            tid = tids.setdefault(m['thread'], len(tids) + 1)
+            events.append({
+                'name': key, 'cat': 'phase', 'ph': 'X', 'pid': 1, 'tid': tid,
+                'ts': round(m['start_s'] * 1e6), 'dur': round(m['wall_s'] * 1e6),
+                'args': {k: v for k, v in m.items() if k not in ('start_s', 'wall_s', 'thread')},
+            })
+        events.extend(
+            {'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': tid, 'args': {'name': thread}}
+            for thread, tid in tids.items()
+        )
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
+        return path
+
     def generate_report(self):
         """Gera relatório JSON consolidado"""
         report_path = self.root / "validation_report.json"
@@ -511,11 +1046,17 @@ class MasterValidator:
                 'failed': sum(1 for r in self.results if not r.success),
                 'percentage': (sum(1 for r in self.results if r.success) / len(self.results) * 100) if self.results else 0
             },
+            # wall/CPU em segundos; pico de RSS dos subprocessos e de alocação
+            # Python (tracemalloc) in-process, em KiB; net_bytes só na fase
+            # sources (resumo do pool HTTP do validate_sources), None nas demais
+            'phases': self.phase_metrics,
             'results': [
                 {
                     'name': r.name,
+                    'phase': r.phase,
                     'success': r.success,
                     'is_timeout': r.is_timeout,
+                    'cached': r.cached,
                     'message': r.message,
                     'timestamp': r.timestamp.isoformat()
                 }
@@ -530,12 +1071,40 @@ class MasterValidator:
 
         return report
 
-    def send_notifications(self, report: Dict):
-        """Envia notificações via Slack/Email"""
+    def append_history(self) -> Optional[dict]:
+        """Acrescenta a execução ao histórico NDJSON (nunca reescreve linhas)."""
+        if self.history_file is None or not self.phase_metrics:
+            return None
+        phases = {}
+        for key, m in self.phase_metrics.items():
+            results = [r for r in self.results if r.phase == key]
+            phases[key] = {
+                'wall_s': m['wall_s'],
+                'cpu_s': m['cpu_s'],
+                'success': all(r.success for r in results),
+                'timeout': any(r.is_timeout for r in results),
+                'cached': m['cached'],
+            }
+        entry = {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'quick': self.quick,
+            'jobs': self.jobs,
+            'mode': 'subprocess' if self.use_subprocess else 'in-process',
+            'wall_s': round(self.wall_time, 3),
+            'phases': phases,
+        }
+        self.history_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.history_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        return entry
+
+    def send_notifications(self, report: Dict, trend: Optional[Dict[str, dict]] = None):
+        """Envia notificações via Slack/Email (falhas e regressões de desempenho)"""
         if not self.notify:
             return
 
         failed = [r for r in self.results if not r.success]
+        slower = [k for k, t in (trend or {}).items() if t['regression']]
 
         # Notificação Slack
         webhook_url = os.getenv('SLACK_WEBHOOK_URL')
@@ -546,6 +1115,9 @@ class MasterValidator:
                 if failed:
                     message = f"❌ NossoDireito: {len(failed)} validações falharam!"
                     color = "danger"
+                elif slower:
+                    message = f"🐢 NossoDireito: {len(slower)} fase(s) mais lenta(s) que o histórico"
+                    color = "warning"
                 else:
                     message = f"✅ NossoDireito: Todas as validações passaram! ({report['summary']['total']}/{report['summary']['total']})"
                     color = "good"
@@ -559,6 +1131,10 @@ class MasterValidator:
                             {"title": "Passed", "value": str(report['summary']['passed']), "short": True},
                             {"title": "Failed", "value": str(report['summary']['failed']), "short": True},
                             {"title": "Percentage", "value": f"{report['summary']['percentage']:.1f}%", "short": True},
+                        ] + [
+                            {"title": f"Regressão: {k}",
+                             "value": f"{trend[k]['last']:.1f}s (p50 {trend[k]['p50']:.1f}s)", "short": True}
+                            for k in slower
                         ],
                         "footer": "NossoDireito Master Validator",
                         "ts": int(datetime.now().timestamp())
@@ -590,6 +1166,12 @@ Exemplos de uso:
   python scripts/validate_all.py --fix              # Validar e corrigir
   python scripts/validate_all.py --notify           # Validar e notificar
   python scripts/validate_all.py --fix --notify     # Tudo junto
+  python scripts/validate_all.py --jobs 1           # Fases em série
+  python scripts/validate_all.py --subprocess       # Também as fases sem rede em processos isolados
+  python scripts/validate_all.py --quick --no-cache # Sem cache de fases (reexecuta tudo)
+  python scripts/validate_all.py --trace trace.json # Linha do tempo das fases (chrome://tracing)
+  python scripts/validate_all.py --profile-memory   # Pico de alocação por fase (tracemalloc)
+  python scripts/validate_all.py --trend            # Histórico: p50/p95, regressões, flaky
 
 FASES:
    1 Estrutura & Sintaxe     9  Base Legal
@@ -612,13 +1194,43 @@ Variáveis de ambiente:
     parser.add_argument('--notify', action='store_true', help='Enviar notificações (Slack/Email)')
     parser.add_argument('--quiet', action='store_true', help='Modo silencioso (menos output)')
     parser.add_argument('--quick', action='store_true', help='Apenas fases críticas 1-4 (sem rede)')
+    parser.add_argument('--jobs', type=int, default=DEFAULT_JOBS,
+                        help=f'Fases executadas em paralelo (padrão: {DEFAULT_JOBS}; 1 = em série)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Reexecuta todas as fases, ignorando o cache por hash de entradas')
+    parser.add_argument('--subprocess', action='store_true',
+                        help='Executa também as fases sem rede em processo isolado '
+                             '(sem dataset compartilhado; as de rede já rodam assim)')
+    parser.add_argument('--trace', type=Path, metavar='ARQUIVO',
+                        help='Exporta as fases em Chrome trace-event JSON (chrome://tracing, Perfetto)')
+    parser.add_argument('--profile-memory', action='store_true',
+                        help='Mede o pico de alocação in-process com tracemalloc (mais lento)')
+    parser.add_argument('--trend', action='store_true',
+                        help='Mostra p50/p95 por fase do histórico local e sai (não valida)')
+    parser.add_argument('--trend-window', type=int, default=TREND_WINDOW,
+                        help=f'Execuções consideradas em --trend (padrão: {TREND_WINDOW})')
+    parser.add_argument('--regression-threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help='Fração acima da mediana que conta como regressão '
+                             f'(padrão: {REGRESSION_THRESHOLD})')
+    parser.add_argument('--no-history', action='store_true',
+                        help=f'Não registra esta execução em {HISTORY_FILE.name}')
 
     args = parser.parse_args()
 
+    if args.trend:
+        entries = load_history(limit=args.trend_window)
+        print_trend(compute_trend(entries, threshold=args.regression_threshold), len(entries))
+        sys.exit(0)
+
     validator = MasterValidator(
         auto_fix=args.fix,
         notify=args.notify,
-        verbose=not args.quiet
+        verbose=not args.quiet,
+        jobs=args.jobs,
+        use_subprocess=args.subprocess,
+        use_cache=not args.no_cache,
+        profile_memory=args.profile_memory,
+        history_file=None if args.no_history else HISTORY_FILE
     )
 
     # Executar validações
@@ -626,10 +1238,16 @@ Variáveis de ambiente:
 
     # Gerar relatório
     report = validator.generate_report()
+    if args.trace:
+        validator.log(f"🧭 Trace salvo em: {validator.write_trace(args.trace)}")
+
+    validator.append_history()
 
-    # Enviar notificações
+    # Enviar notificações (falhas + regressões frente ao histórico)
     if args.notify:
-        validator.send_notifications(report)
+        trend = compute_trend(load_history(limit=args.trend_window),
+                              threshold=args.regression_threshold)
+        validator.send_notifications(report, trend)
 
     # Exit code: 0 se tudo OK, 1 se houve falhas
     sys.exit(0 if passed == total else 1)
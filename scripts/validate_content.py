@@ -13,15 +13,22 @@ Valida:
 - Padrões de código
 - Análise semântica de conteúdo
 
+Os checks sobre data/direitos.json registram handlers num DataWalker
+(scripts/data_walker.py): o documento é percorrido uma única vez e cada
+seção imprime depois, na ordem de sempre, o que seus handlers coletaram.
+
 Uso:
     python3 scripts/validate_content.py
 """
 
 import json
 import sys
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 
+from data_walker import DataWalker
+
 # Configurar encoding UTF-8 para saída (Windows compatibility)
 if hasattr(sys.stdout, 'reconfigure'):
     sys.stdout.reconfigure(encoding='utf-8')
@@ -30,21 +37,53 @@ elif hasattr(sys.stdout, 'buffer'):
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 
+def index_keywords_by_category(keyword_map):
+    """Índice invertido categoria → keywords do matching engine, numa passada.
+
+    Retorna {cat_id: {'keywords': [...], 'weight': soma dos pesos}} na ordem
+    do keyword_map; entradas malformadas (não-dict, sem 'cats') são ignoradas
+    — validate_matching_engine as reporta.
+    """
+    index = {}
+    for keyword, config in keyword_map.items():
+        if not isinstance(config, dict):
+            continue
+        weight = config.get('weight', 0)
+        for cat_id in config.get('cats', []):
+            entry = index.setdefault(cat_id, {'keywords': [], 'weight': 0})
+            entry['keywords'].append(keyword)
+            entry['weight'] += weight
+    return index
+
+
 class ContentValidator:
     """Validador de conteúdo e estrutura"""
 
-    def __init__(self):
+    def __init__(self, data=None, matching=None):
+        """data/matching: JSONs já carregados (modo in-process do validate_all)."""
         self.root = Path(__file__).parent.parent
         self.errors = []
         self.warnings = []
         self.passes = []
 
         # Load data
-        with open(self.root / 'data' / 'direitos.json', 'r', encoding='utf-8') as f:
-            self.data = json.load(f)
-
-        with open(self.root / 'data' / 'matching_engine.json', 'r', encoding='utf-8') as f:
-            self.matching = json.load(f)
+        if data is None:
+            with open(self.root / 'data' / 'direitos.json', 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        self.data = data
+
+        if matching is None:
+            with open(self.root / 'data' / 'matching_engine.json', 'r', encoding='utf-8') as f:
+                matching = json.load(f)
+        self.matching = matching
+
+        # Coletado na travessia única (_scan); cada validate_* consome a sua seção
+        self._scanned = False
+        self._deferred = defaultdict(list)
+        self._cat_ids = []
+        self._isencoes = None
+        self._orgao_ufs = []
+        self._docs = []
 
     def log(self, message, level='PASS'):
         """Log resultado"""
@@ -59,17 +98,153 @@ class ContentValidator:
         else:  # ERROR
             self.errors.append(message)
 
+    def _defer(self, section, message, level='PASS'):
+        """Guarda um log para a seção; entradas chamáveis são resolvidas no flush."""
+        self._deferred[section].append(message if callable(message) else (message, level))
+
+    def _flush(self, section):
+        for entry in self._deferred.pop(section, []):
+            for message, level in (entry() if callable(entry) else [entry]):
+                self.log(message, level)
+
+    def _scan(self):
+        """Travessia única de direitos.json com os handlers de todas as seções."""
+        if self._scanned:
+            return
+        self._scanned = True
+        walker = DataWalker()
+        walker.on("documentos_mestre[*]", self._visit_documento)
+        walker.on("orgaos_estaduais[*]", self._visit_orgao)
+        walker.on("categorias[*]", self._visit_categoria)
+        walker.walk(self.data)
+
+    def _visit_categoria(self, path, cat):
+        self._cat_ids.append(cat['id'])
+        if cat['id'] == 'isencoes_tributarias' and self._isencoes is None:
+            self._isencoes = cat
+
+        cat_id = cat.get('id', 'unknown')
+
+        def defer(message, level='PASS'):
+            self._defer('categories', message, level)
+
+        # 2. Campos obrigatórios por categoria
+        required_fields = ['id', 'titulo', 'icone', 'resumo', 'base_legal',
+                          'requisitos', 'documentos', 'passo_a_passo', 'dicas',
+                          'valor', 'onde', 'links', 'tags']
+
+        # Verificar campos obrigatórios
+        missing_fields = [f for f in required_fields if f not in cat]
+        if missing_fields:
+            defer(f"{cat_id}: campos faltando: {missing_fields}", 'ERROR')
+        else:
+            defer(f"{cat_id}: todos campos obrigatórios presentes ✓", 'PASS')
+
+        # 3. Base legal completa (lei + artigo + link)
+        base_legal = cat.get('base_legal', [])
+        if not base_legal:
+            defer(f"{cat_id}: base_legal vazia", 'ERROR')
+        else:
+            for bl in base_legal:
+                if 'lei' not in bl or 'artigo' not in bl:
+                    defer(f"{cat_id}: base_legal incompleta (falta lei ou artigo)", 'WARN')
+                if 'url' in bl or 'link' in bl:
+                    url = bl.get('url') or bl.get('link')
+                    if not url.startswith('https://'):
+                        defer(f"{cat_id}: base_legal com URL não-HTTPS: {url}", 'ERROR')
+
+        # 4. Listas não vazias
+        if not cat.get('requisitos'):
+            defer(f"{cat_id}: requisitos vazio", 'WARN')
+        if not cat.get('documentos'):
+            defer(f"{cat_id}: documentos vazio", 'WARN')
+        if not cat.get('passo_a_passo'):
+            defer(f"{cat_id}: passo_a_passo vazio", 'ERROR')
+        if not cat.get('dicas'):
+            defer(f"{cat_id}: dicas vazio", 'WARN')
+        if not cat.get('links'):
+            defer(f"{cat_id}: links vazio", 'ERROR')
+        if not cat.get('tags'):
+            defer(f"{cat_id}: tags vazio", 'WARN')
+
+        # 5. Links externos válidos
+        for link in cat.get('links', []):
+            url = link.get('url', '')
+            # Aceitar tel:, mailto:, e HTTPS
+            if not (url.startswith('https://') or url.startswith('tel:') or url.startswith('mailto:')):
+                defer(f"{cat_id}: link não-HTTPS: {url}", 'ERROR')
+            if 'titulo' not in link:
+                defer(f"{cat_id}: link sem título", 'WARN')
+
+        # Semântica: resumos informativos (>30 chars), dicas úteis (>20 chars)
+        # e valores monetários declarados — cada uma é um bloco da seção
+        resumo = cat.get('resumo', '')
+        if len(resumo) < 30:
+            self._defer('semantic_resumo', f"{cat['id']}: resumo muito curto ({len(resumo)} chars)", 'WARN')
+        for i, dica in enumerate(cat.get('dicas', [])):
+            if len(dica) < 20:
+                self._defer('semantic_dicas', f"{cat['id']}: dica {i+1} muito curta", 'WARN')
+        valor = cat.get('valor', '')
+        if 'R$' in valor or 'salário' in valor.lower():
+            # OK - tem valor monetário
+            self._defer('semantic_valor', f"{cat['id']}: valor declarado ✓", 'PASS')
+
+    def _visit_orgao(self, path, o):
+        self._orgao_ufs.append(o['uf'])
+        uf = o.get('uf', '?')
+        for campo in ['nome', 'url', 'sefaz', 'detran']:
+            if campo not in o or not o[campo]:
+                self._defer('orgaos', f"Órgão {uf}: campo '{campo}' ausente ou vazio", 'ERROR')
+
+        # 3. URLs HTTPS
+        for url_field in ['url', 'sefaz', 'detran']:
+            url = o.get(url_field, '')
+            if url and not url.startswith('https://'):
+                self._defer('orgaos', f"Órgão {uf}: {url_field} não-HTTPS: {url}", 'ERROR')
+
+        # 4. Benefícios destaque
+        beneficios = o.get('beneficios_destaque', [])
+        if len(beneficios) < 1:
+            self._defer('orgaos', f"Órgão {uf}: sem benefícios destaque", 'WARN')
+
+    def _visit_documento(self, path, doc):
+        self._docs.append(doc)
+        doc_id = doc.get('id', 'unknown')
+
+        def campos():
+            # Resolvido no flush: `categorias` vem depois de documentos_mestre
+            # no JSON, então as referências só são checadas após a travessia
+            out = []
+            if 'nome' not in doc:
+                out.append((f"Documento '{doc_id}': campo 'nome' faltando", 'ERROR'))
+            if 'descricao' not in doc:
+                out.append((f"Documento '{doc_id}': campo 'descricao' faltando", 'ERROR'))
+            if 'categorias' not in doc or not doc['categorias']:
+                out.append((f"Documento '{doc_id}': campo 'categorias' vazio", 'ERROR'))
+            else:
+                for cat in doc['categorias']:
+                    if cat not in self._cat_ids:
+                        out.append((f"Documento '{doc_id}': categoria '{cat}' não existe", 'ERROR'))
+            return out
+
+        self._defer('documentos', campos)
+
+        # Relacionamentos bidirecionais implícitos
+        categorias = doc.get('categorias', [])
+        if len(categorias) > 1:
+            self._defer('related', f"Documento '{doc['id']}' relaciona {len(categorias)} categorias", 'PASS')
+
     def validate_categories(self):
         """Validar 42 categorias completas"""
         self.log("=" * 70, 'PASS')
         self.log("VALIDAÇÃO DE CATEGORIAS (36)", 'PASS')
         self.log("=" * 70, 'PASS')
 
-        categorias = self.data.get('categorias', [])
+        self._scan()
 
         # 1. Total de categorias
-        if len(categorias) != 42:
-            self.log(f"Total de categorias: {len(categorias)} (esperado: 42)", 'ERROR')
+        if len(self._cat_ids) != 42:
+            self.log(f"Total de categorias: {len(self._cat_ids)} (esperado: 42)", 'ERROR')
         else:
             self.log(f"Total de categorias: 36 ✓", 'PASS')
 
@@ -89,7 +264,7 @@ class ContentValidator:
             'caa_comunicacao_alternativa', 'curatela_decisao_apoiada'
         ]
 
-        found_ids = [c['id'] for c in categorias]
+        found_ids = self._cat_ids
         missing = set(expected_ids) - set(found_ids)
         extra = set(found_ids) - set(expected_ids)
 
@@ -100,56 +275,8 @@ class ContentValidator:
         if not missing and not extra:
             self.log("Todas 30 categorias presentes ✓", 'PASS')
 
-        # 2. Campos obrigatórios por categoria
-        required_fields = ['id', 'titulo', 'icone', 'resumo', 'base_legal',
-                          'requisitos', 'documentos', 'passo_a_passo', 'dicas',
-                          'valor', 'onde', 'links', 'tags']
-
-        for cat in categorias:
-            cat_id = cat.get('id', 'unknown')
-
-            # Verificar campos obrigatórios
-            missing_fields = [f for f in required_fields if f not in cat]
-            if missing_fields:
-                self.log(f"{cat_id}: campos faltando: {missing_fields}", 'ERROR')
-            else:
-                self.log(f"{cat_id}: todos campos obrigatórios presentes ✓", 'PASS')
-
-            # 3. Base legal completa (lei + artigo + link)
-            base_legal = cat.get('base_legal', [])
-            if not base_legal:
-                self.log(f"{cat_id}: base_legal vazia", 'ERROR')
-            else:
-                for bl in base_legal:
-                    if 'lei' not in bl or 'artigo' not in bl:
-                        self.log(f"{cat_id}: base_legal incompleta (falta lei ou artigo)", 'WARN')
-                    if 'url' in bl or 'link' in bl:
-                        url = bl.get('url') or bl.get('link')
-                        if not url.startswith('https://'):
-                            self.log(f"{cat_id}: base_legal com URL não-HTTPS: {url}", 'ERROR')
-
-            # 4. Listas não vazias
-            if not cat.get('requisitos'):
-                self.log(f"{cat_id}: requisitos vazio", 'WARN')
-            if not cat.get('documentos'):
-                self.log(f"{cat_id}: documentos vazio", 'WARN')
-            if not cat.get('passo_a_passo'):
-                self.log(f"{cat_id}: passo_a_passo vazio", 'ERROR')
-            if not cat.get('dicas'):
-                self.log(f"{cat_id}: dicas vazio", 'WARN')
-            if not cat.get('links'):
-                self.log(f"{cat_id}: links vazio", 'ERROR')
-            if not cat.get('tags'):
-                self.log(f"{cat_id}: tags vazio", 'WARN')
-
-            # 5. Links externos válidos
-            for link in cat.get('links', []):
-                url = link.get('url', '')
-                # Aceitar tel:, mailto:, e HTTPS
-                if not (url.startswith('https://') or url.startswith('tel:') or url.startswith('mailto:')):
-                    self.log(f"{cat_id}: link não-HTTPS: {url}", 'ERROR')
-                if 'titulo' not in link:
-                    self.log(f"{cat_id}: link sem título", 'WARN')
+        # 2-5. Campos, base legal, listas e links por categoria (coletados no _scan)
+        self._flush('categories')
 
     def validate_ipva_dropdown(self):
         """Validar dropdown IPVA com 27 estados"""
@@ -157,7 +284,8 @@ class ContentValidator:
         self.log("VALIDAÇÃO DROPDOWN IPVA (27 ESTADOS)", 'PASS')
         self.log("=" * 70, 'PASS')
 
-        isencoes = next((c for c in self.data['categorias'] if c['id'] == 'isencoes_tributarias'), None)
+        self._scan()
+        isencoes = self._isencoes
 
         if not isencoes:
             self.log("Categoria 'isencoes_tributarias' não encontrada", 'ERROR')
@@ -222,33 +350,18 @@ class ContentValidator:
             'RJ', 'RN', 'RS', 'RO', 'RR', 'SC', 'SP', 'SE', 'TO'
         ])
 
-        orgaos = self.data.get('orgaos_estaduais', [])
+        self._scan()
 
         # 1. Total de estados
-        found_ufs = sorted([o['uf'] for o in orgaos])
+        found_ufs = sorted(self._orgao_ufs)
         if found_ufs != expected_ufs:
             missing = set(expected_ufs) - set(found_ufs)
             self.log(f"Órgãos estaduais: faltando UFs {missing}", 'ERROR')
         else:
             self.log(f"Órgãos estaduais: 27 UFs presentes ✓", 'PASS')
 
-        # 2. Campos obrigatórios
-        for o in orgaos:
-            uf = o.get('uf', '?')
-            for campo in ['nome', 'url', 'sefaz', 'detran']:
-                if campo not in o or not o[campo]:
-                    self.log(f"Órgão {uf}: campo '{campo}' ausente ou vazio", 'ERROR')
-
-            # 3. URLs HTTPS
-            for url_field in ['url', 'sefaz', 'detran']:
-                url = o.get(url_field, '')
-                if url and not url.startswith('https://'):
-                    self.log(f"Órgão {uf}: {url_field} não-HTTPS: {url}", 'ERROR')
-
-            # 4. Benefícios destaque
-            beneficios = o.get('beneficios_destaque', [])
-            if len(beneficios) < 1:
-                self.log(f"Órgão {uf}: sem benefícios destaque", 'WARN')
+        # 2-4. Campos, URLs HTTPS e benefícios por UF (coletados no _scan)
+        self._flush('orgaos')
 
         self.log("Validação de órgãos estaduais concluída ✓", 'PASS')
 
@@ -272,8 +385,9 @@ class ContentValidator:
         self.log(f"Total de keywords no keyword_map: {len(keyword_map)}", 'PASS')
 
         # 2. Validar estrutura: cada keyword deve ter "cats" e "weight"
-        cat_ids = [c['id'] for c in self.data['categorias']]
-        categories_found = set()
+        self._scan()
+        cat_ids = self._cat_ids
+        known_ids = set(cat_ids)
 
         for keyword, config in keyword_map.items():
             if not isinstance(config, dict):
@@ -289,8 +403,7 @@ class ContentValidator:
 
             # Validar categorias referenciadas
             for cat_id in config['cats']:
-                categories_found.add(cat_id)
-                if cat_id not in cat_ids:
+                if cat_id not in known_ids:
                     self.log(f"keyword_map['{keyword}']: categoria '{cat_id}' não existe em direitos.json", 'ERROR')
 
             # Keyword deve ser lowercase
@@ -298,16 +411,19 @@ class ContentValidator:
                 self.log(f"keyword_map: keyword não lowercase: '{keyword}'", 'WARN')
 
         # 3. Verificar se todas categorias têm pelo menos 3 keywords
+        #    (índice invertido: uma passada no keyword_map, não uma por categoria)
+        index = index_keywords_by_category(keyword_map)
         for cat_id in cat_ids:
-            keywords_for_cat = [k for k, c in keyword_map.items() if cat_id in c.get('cats', [])]
-            num_keywords = len(keywords_for_cat)
+            coverage = index.get(cat_id, {'keywords': [], 'weight': 0})
+            num_keywords = len(coverage['keywords'])
 
             if num_keywords == 0:
                 self.log(f"Categoria '{cat_id}' sem keywords no keyword_map", 'WARN')
             elif num_keywords < 3:
                 self.log(f"Categoria '{cat_id}' com poucas keywords ({num_keywords})", 'WARN')
             else:
-                self.log(f"Categoria '{cat_id}': {num_keywords} keywords ✓", 'PASS')
+                self.log(f"Categoria '{cat_id}': {num_keywords} keywords, peso total "
+                         f"{coverage['weight']:g} ✓", 'PASS')
 
     def validate_documentos_mestre(self):
         """Validar documentos_mestre"""
@@ -315,7 +431,8 @@ class ContentValidator:
         self.log("VALIDAÇÃO DOCUMENTOS_MESTRE", 'PASS')
         self.log("=" * 70, 'PASS')
 
-        docs = self.data.get('documentos_mestre', [])
+        self._scan()
+        docs = self._docs
 
         if not docs:
             self.log("documentos_mestre vazio", 'ERROR')
@@ -337,23 +454,8 @@ class ContentValidator:
         if missing_docs:
             self.log(f"Documentos faltando: {missing_docs}", 'WARN')
 
-        # Verificar campos obrigatórios
-        cat_ids = [c['id'] for c in self.data['categorias']]
-
-        for doc in docs:
-            doc_id = doc.get('id', 'unknown')
-
-            if 'nome' not in doc:
-                self.log(f"Documento '{doc_id}': campo 'nome' faltando", 'ERROR')
-            if 'descricao' not in doc:
-                self.log(f"Documento '{doc_id}': campo 'descricao' faltando", 'ERROR')
-            if 'categorias' not in doc or not doc['categorias']:
-                self.log(f"Documento '{doc_id}': campo 'categorias' vazio", 'ERROR')
-            else:
-                # Verificar se categorias referenciadas existem
-                for cat in doc['categorias']:
-                    if cat not in cat_ids:
-                        self.log(f"Documento '{doc_id}': categoria '{cat}' não existe", 'ERROR')
+        # Campos obrigatórios e categorias referenciadas (coletados no _scan)
+        self._flush('documentos')
 
     def validate_related_categories(self):
         """Validar categorias relacionadas"""
@@ -362,16 +464,9 @@ class ContentValidator:
         self.log("=" * 70, 'PASS')
 
         # Verificar se documentos_mestre cria relacionamentos válidos
-        docs = self.data.get('documentos_mestre', [])
-
-        total_relations = 0
-        for doc in docs:
-            categorias = doc.get('categorias', [])
-            total_relations += len(categorias)
-
-            # Verificar relacionamentos bidirecionais implícitos
-            if len(categorias) > 1:
-                self.log(f"Documento '{doc['id']}' relaciona {len(categorias)} categorias", 'PASS')
+        self._scan()
+        total_relations = sum(len(doc.get('categorias', [])) for doc in self._docs)
+        self._flush('related')
 
         self.log(f"Total de relacionamentos via documentos: {total_relations}", 'PASS')
 
@@ -425,25 +520,11 @@ class ContentValidator:
         self.log("VALIDAÇÃO SEMÂNTICA DE CONTEÚDO", 'PASS')
         self.log("=" * 70, 'PASS')
 
-        # 1. Verificar se resumos são informativos (>30 chars)
-        for cat in self.data['categorias']:
-            resumo = cat.get('resumo', '')
-            if len(resumo) < 30:
-                self.log(f"{cat['id']}: resumo muito curto ({len(resumo)} chars)", 'WARN')
-
-        # 2. Verificar se dicas são úteis (>20 chars cada)
-        for cat in self.data['categorias']:
-            dicas = cat.get('dicas', [])
-            for i, dica in enumerate(dicas):
-                if len(dica) < 20:
-                    self.log(f"{cat['id']}: dica {i+1} muito curta", 'WARN')
-
-        # 3. Verificar valores monetários atualizados (ano corrente)
-        for cat in self.data['categorias']:
-            valor = cat.get('valor', '')
-            if 'R$' in valor or 'salário' in valor.lower():
-                # OK - tem valor monetário
-                self.log(f"{cat['id']}: valor declarado ✓", 'PASS')
+        # 1-3. Resumos, dicas e valores monetários (coletados no _scan)
+        self._scan()
+        self._flush('semantic_resumo')
+        self._flush('semantic_dicas')
+        self._flush('semantic_valor')
 
         # 4. Verificar se disclaimer está presente
         aviso = self.data.get('aviso', '')
@@ -11,11 +11,19 @@ Objetivos:
    - governamental
    - estadual_municipal
    - internacional
+4. Conferir se os artigos citados (base_legal[].artigo) existem no índice
+   Art./§/inciso das leis já presentes no acervo local (.cache/legal_corpus,
+   preenchido pelo validate_legal_sources) — sem acesso à rede.
+
+As URLs das fontes são checadas em paralelo (pool de threads + sessão HTTP
+compartilhada), com teto de requests simultâneos por camada: a camada
+federal é quase toda planalto.gov.br, que bloqueia rajadas.
 
 Uso:
     python scripts/validate_legal_compliance.py
     python scripts/validate_legal_compliance.py --category bpc
     python scripts/validate_legal_compliance.py --quick
+    python scripts/validate_legal_compliance.py --workers 1   # sequencial
 """
 
 from __future__ import annotations
@@ -24,46 +32,33 @@ import argparse
 import json
 import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
+import oficial_hosts
+from law_index import format_ref, parse_reference
+from legal_corpus import LegalCorpus
+from round_robin import interleave
+
 try:
     import requests
+    from requests.adapters import HTTPAdapter
 
     HAS_REQUESTS = True
 except ImportError:
     HAS_REQUESTS = False
 
-UF_CODES = {
-    "ac",
-    "al",
-    "ap",
-    "am",
-    "ba",
-    "ce",
-    "df",
-    "es",
-    "go",
-    "ma",
-    "mt",
-    "ms",
-    "mg",
-    "pa",
-    "pb",
-    "pr",
-    "pe",
-    "pi",
-    "rj",
-    "rn",
-    "rs",
-    "ro",
-    "rr",
-    "sc",
-    "sp",
-    "se",
-    "to",
+# Checagens de URL simultâneas (teto global) e por camada
+MAX_WORKERS = 8
+LAYER_LIMITS = {
+    "federal": 2,
+    "governamental": 4,
+    "estadual_municipal": 2,
+    "internacional": 2,
 }
 
 
@@ -88,37 +83,48 @@ def extract_law_number(value: str) -> Optional[Tuple[str, str]]:
 
 
 def classify_layer(url: str, orgao: str, tipo: str, nome: str) -> str:
+    """Camada da fonte, a partir das entradas da allowlist que casam com o host.
+
+    Usa o mesmo matcher (oficial_hosts) do G1 e do validate_sources, para as
+    três classificações não divergirem. Hosts estaduais/municipais são os
+    `*.<uf>.gov.br` da categoria executivo-estadual-municipal.
+    """
     host = (urlparse(url).hostname or "").lower()
     orgao_norm = normalize_text(orgao)
     tipo_norm = normalize_text(tipo)
     nome_norm = normalize_text(nome)
+    categorias = {d.categoria for d in oficial_hosts.default().matches(host)}
 
-    if host.endswith("who.int") or "oms" in nome_norm:
+    if "saude-internacional" in categorias or "oms" in nome_norm:
         return "internacional"
 
     # Ex.: capital.sp.gov.br, prefeitura.rio.rj.gov.br
-    for uf in UF_CODES:
-        if host.endswith(f".{uf}.gov.br"):
-            return "estadual_municipal"
+    if "executivo-estadual-municipal" in categorias:
+        return "estadual_municipal"
 
     if any(token in orgao_norm for token in ["prefeitura", "governo do estado", "detran", "sefaz", "secretaria de estado"]):
         return "estadual_municipal"
 
     if tipo_norm == "legislacao" and (
-        "planalto.gov.br" in host or "presidência da república" in orgao_norm
+        "legislacao-federal" in categorias or "presidência da república" in orgao_norm
     ):
         return "federal"
 
-    if host.endswith("gov.br") or host.endswith("leg.br") or host.endswith("jus.br") or host.endswith("mp.br") or host.endswith("def.br"):
-        return "governamental"
-
     return "governamental"
 
 
 class LegalComplianceValidator:
-    def __init__(self, root: Path):
+    def __init__(self, root: Path, data: Optional[Dict[str, Any]] = None,
+                 corpus: Optional[LegalCorpus] = None, workers: int = MAX_WORKERS):
         self.root = root
         self.direitos_path = root / "data" / "direitos.json"
+        self._data = data  # direitos.json já carregado (modo in-process)
+        self.corpus = corpus if corpus is not None else LegalCorpus()
+        self.workers = max(1, workers)
+        self._layer_slots = {
+            layer: threading.BoundedSemaphore(limit) for layer, limit in LAYER_LIMITS.items()
+        }
+        self._session = None
         self.report: Dict[str, Any] = {
             "timestamp": datetime.now().isoformat(),
             "schema_version": "v1.19+",
@@ -138,11 +144,14 @@ class LegalComplianceValidator:
                 "internacional": {"total": 0, "valid": 0, "invalid": 0, "warnings": 0},
             },
             "details": [],
+            "article_checks": {"checked": 0, "not_in_corpus": 0, "not_found": []},
             "unmapped_base_legal": [],
             "errors": [],
         }
 
     def load_data(self) -> Dict[str, Any]:
+        if self._data is not None:
+            return self._data
         if not self.direitos_path.exists():
             raise FileNotFoundError(
                 f"Arquivo não encontrado: {self.direitos_path}")
@@ -188,6 +197,8 @@ class LegalComplianceValidator:
                             "category": cat_id,
                             "lei": lei,
                             "artigo": artigo,
+                            # endereço da própria lei citada (`link` em direitos.json)
+                            "url": item.get("link") or item.get("url", ""),
                             "source": source,
                         }
                     )
@@ -204,20 +215,99 @@ class LegalComplianceValidator:
                     )
         return mapped
 
+    def _check_articles(self, mapped: List[Dict[str, Any]]) -> None:
+        """Confere os artigos citados no índice das leis do acervo local."""
+        checks = self.report["article_checks"]
+        for item in mapped:
+            refs = parse_reference(item["artigo"])
+            if not refs:
+                continue
+            index = None
+            for url in (item["url"], item["source"].get("url", "")):
+                index = self.corpus.index(url) if url else None
+                if index:
+                    break
+            if not index:
+                checks["not_in_corpus"] += 1
+                continue
+            checks["checked"] += 1
+            missing = [format_ref(ref) for ref in refs if not index.has(*ref)]
+            if missing:
+                checks["not_found"].append(
+                    {
+                        "category": item["category"],
+                        "lei": item["lei"],
+                        "artigo": item["artigo"],
+                        "missing": missing,
+                    }
+                )
+
+    def _http(self) -> "requests.Session":
+        """Sessão compartilhada pelos workers (pool de conexões por host)."""
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.workers, pool_maxsize=self.workers)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
     def _validate_url(self, url: str, timeout: int) -> Tuple[str, Optional[int], Optional[str]]:
         if not HAS_REQUESTS:
             return ("warning", None, "requests não instalado")
         try:
             # GET é mais robusto para portais gov.br que bloqueiam HEAD.
-            resp = requests.get(url, timeout=timeout, allow_redirects=True)
-            if resp.status_code < 400:
-                return ("valid", resp.status_code, None)
-            return ("invalid", resp.status_code, f"HTTP {resp.status_code}")
+            # stream=True: só o status interessa — o corpo (páginas de lei
+            # com vários MB) nunca é baixado; a resposta fecha em seguida.
+            with self._http().get(url, timeout=timeout, allow_redirects=True, stream=True) as resp:
+                status_code = resp.status_code
+            if status_code < 400:
+                return ("valid", status_code, None)
+            return ("invalid", status_code, f"HTTP {status_code}")
         except requests.exceptions.Timeout:
             return ("warning", None, f"timeout após {timeout}s")
         except requests.exceptions.RequestException as ex:
             return ("warning", None, str(ex))
 
+    def _validate_in_layer(self, url: str, layer: str, timeout: int) -> Tuple[str, Optional[int], Optional[str]]:
+        with self._layer_slots[layer]:
+            return self._validate_url(url, timeout)
+
+    def _record_source(self, url: str, src: Dict[str, Any], layer: str, status: str,
+                       status_code: Optional[int], error: Optional[str]) -> None:
+        nome = src.get("nome", "Unknown")
+        orgao = src.get("orgao", "")
+        tipo = src.get("tipo", "")
+
+        self.report["summary"]["validated_sources"] += 1
+        self.report["layers"][layer]["total"] += 1
+
+        if status == "valid":
+            self.report["summary"]["valid"] += 1
+            self.report["layers"][layer]["valid"] += 1
+            print(f"   ✅ [{layer}] {nome}")
+        elif status == "invalid":
+            self.report["summary"]["invalid"] += 1
+            self.report["layers"][layer]["invalid"] += 1
+            print(f"   ❌ [{layer}] {nome}: {error}")
+        else:
+            self.report["summary"]["warnings"] += 1
+            self.report["layers"][layer]["warnings"] += 1
+            print(f"   ⚠️ [{layer}] {nome}: {error}")
+
+        self.report["details"].append(
+            {
+                "name": nome,
+                "type": tipo,
+                "organization": orgao,
+                "url": url,
+                "layer": layer,
+                "status": status,
+                "status_code": status_code,
+                "error": error,
+            }
+        )
+
     def run(self, category: Optional[str], quick: bool) -> bool:
         data = self.load_data()
         categorias = data.get("categorias", [])
@@ -226,6 +316,7 @@ class LegalComplianceValidator:
         by_number, by_name = self._index_legal_sources(fontes)
         mapped_items = self._map_base_legal(
             categorias, category, by_number, by_name)
+        self._check_articles(mapped_items)
 
         # Deduplicar fontes a validar por URL para evitar custo/rede desnecessário.
         sources_to_validate: Dict[str, Dict[str, Any]] = {}
@@ -247,42 +338,28 @@ class LegalComplianceValidator:
         print(f"⚡ Modo rápido: {'sim' if quick else 'não'}")
         print()
 
-        print("📚 Validando fontes legais mapeadas...")
-        for url, src in sorted(sources_to_validate.items()):
-            nome = src.get("nome", "Unknown")
-            orgao = src.get("orgao", "")
-            tipo = src.get("tipo", "")
-            layer = classify_layer(url, orgao, tipo, nome)
-
-            self.report["summary"]["validated_sources"] += 1
-            self.report["layers"][layer]["total"] += 1
-
-            status, status_code, error = self._validate_url(url, timeout)
-            if status == "valid":
-                self.report["summary"]["valid"] += 1
-                self.report["layers"][layer]["valid"] += 1
-                print(f"   ✅ [{layer}] {nome}")
-            elif status == "invalid":
-                self.report["summary"]["invalid"] += 1
-                self.report["layers"][layer]["invalid"] += 1
-                print(f"   ❌ [{layer}] {nome}: {error}")
-            else:
-                self.report["summary"]["warnings"] += 1
-                self.report["layers"][layer]["warnings"] += 1
-                print(f"   ⚠️ [{layer}] {nome}: {error}")
-
-            self.report["details"].append(
-                {
-                    "name": nome,
-                    "type": tipo,
-                    "organization": orgao,
-                    "url": url,
-                    "layer": layer,
-                    "status": status,
-                    "status_code": status_code,
-                    "error": error,
+        print(f"📚 Validando fontes legais mapeadas ({self.workers} workers)...")
+        sources = [
+            (url, src, classify_layer(url, src.get("orgao", ""), src.get("tipo", ""),
+                                      src.get("nome", "Unknown")))
+            for url, src in sorted(sources_to_validate.items())
+        ]
+        # Submissão intercalada por camada — em ordem de URL quase tudo é
+        # planalto.gov.br (federal) e os workers ficariam presos no semáforo
+        # federal. Saída e relatório continuam em ordem de URL, independente
+        # de qual checagem termina primeiro.
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                futures = {
+                    url: pool.submit(self._validate_in_layer, url, layer, timeout)
+                    for url, _, layer in interleave(sources, key=lambda source: source[2])
                 }
-            )
+                for url, src, layer in sources:
+                    self._record_source(url, src, layer, *futures[url].result())
+        finally:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
 
         report_path = self.root / "validation_legal_report.json"
         with open(report_path, "w", encoding="utf-8") as f:
@@ -300,6 +377,14 @@ class LegalComplianceValidator:
             f"Fontes validadas: {self.report['summary']['validated_sources']} "
             f"(✅ {self.report['summary']['valid']} | ❌ {self.report['summary']['invalid']} | ⚠️ {self.report['summary']['warnings']})"
         )
+        checks = self.report["article_checks"]
+        print(
+            f"Artigos citados conferidos: {checks['checked']} "
+            f"(⚠️ {len(checks['not_found'])} não encontrados | "
+            f"{checks['not_in_corpus']} sem texto no acervo local)"
+        )
+        for miss in checks["not_found"]:
+            print(f"   ⚠️ [{miss['category']}] {miss['lei']}: {', '.join(miss['missing'])}")
         print()
         print("Camadas:")
         for layer in ["federal", "governamental", "estadual_municipal", "internacional"]:
@@ -336,10 +421,16 @@ def main() -> int:
         action="store_true",
         help="Modo rápido com timeout reduzido",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=MAX_WORKERS,
+        help=f"Checagens de URL simultâneas (padrão: {MAX_WORKERS}; 1 = sequencial)",
+    )
     args = parser.parse_args()
 
     root = Path(__file__).parent.parent
-    validator = LegalComplianceValidator(root)
+    validator = LegalComplianceValidator(root, workers=args.workers)
     ok = validator.run(category=args.category, quick=args.quick)
     return 0 if ok else 1
 
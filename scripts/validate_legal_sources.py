@@ -9,50 +9,69 @@ Valida base_legal em direitos.json:
 - Sugere artigos corretos baseados no conteúdo real da lei
 - NUNCA usa dados genéricos - SEMPRE da fonte oficial
 
+Textos de leis ficam no acervo local (.cache/legal_corpus, ver
+legal_corpus.py): cada URL é baixada uma vez por execução e, entre
+execuções, só é rebaixada após o TTL e se o servidor não responder 304.
+Junto do texto fica o índice Art./§/inciso da lei (law_index.py), usado
+para conferir artigos já citados em base_legal[].artigo e para sugerir o
+artigo que contém as palavras-chave.
+
 Uso:
     python3 scripts/validate_legal_sources.py
-    python3 scripts/validate_legal_sources.py --fix  # Aplica correções
+    python3 scripts/validate_legal_sources.py --fix       # Aplica correções
+    python3 scripts/validate_legal_sources.py --no-cache  # Ignora o acervo local
+    python3 scripts/validate_legal_sources.py --verify-articles  # Baixa leis para conferir artigos citados
+    python3 scripts/validate_legal_sources.py --stop-early  # Para o download ao achar todas as palavras-chave
 """
 
+import codecs
+import contextlib
 import json
 import re
 import sys
 import time
+import urllib.error
 import urllib.request
+from bisect import bisect_left, bisect_right
 from datetime import datetime
-from html.parser import HTMLParser
 from pathlib import Path
 
+from keyword_automaton import KeywordAutomaton
+from law_index import LawTextParser, format_ref, parse_reference
+from legal_corpus import LegalCorpus
 
-class LegalTextParser(HTMLParser):
-    """Parser HTML para extrair texto de leis do Planalto"""
-
-    def __init__(self):
-        super().__init__()
-        self.text = []
-        self.in_body = False
-
-    def handle_starttag(self, tag, attrs):
-        if tag in ['body', 'div', 'p']:
-            self.in_body = True
-
-    def handle_data(self, data):
-        if self.in_body:
-            self.text.append(data)
+# Pausa após cada request ao servidor oficial (não sobrecarregar)
+FETCH_DELAY = 1
+# Tamanho de cada leitura do corpo da resposta (download em streaming)
+READ_CHUNK = 64 * 1024
 
-    def get_text(self):
-        return ' '.join(self.text)
+# Menções a artigos ("Art. 5º", "art. 20-A", "artigo 3") e a janela de
+# contexto em torno de cada palavra-chave onde elas contam como relevantes
+ARTICLE_PATTERN = re.compile(r'(art\.?\s*\d+[º°]?(?:-[A-Z])?|artigo\s+\d+[º°]?)', re.IGNORECASE)
+CONTEXT_CHARS = 500
 
 
 class LegalSourceValidator:
     """Validador de fontes legais com busca em fontes oficiais"""
 
-    def __init__(self, fix_mode=False):
+    def __init__(self, fix_mode=False, data=None, corpus=None, use_cache=True,
+                 verify_articles=False, stop_early=False):
         self.root = Path(__file__).parent.parent
         self.fix_mode = fix_mode
+        # Conferir artigos citados: sempre com o que já está no acervo;
+        # com verify_articles, baixando as leis que faltam
+        self.verify_articles = verify_articles
+        # Parar o download quando todas as palavras-chave já apareceram
+        self.stop_early = stop_early
         self.issues = []
         self.fixes = []
 
+        # Acervo local de textos (entre execuções) + memo por URL (nesta execução)
+        self.corpus = corpus if corpus is not None else (LegalCorpus() if use_cache else None)
+        self._fetched = {}
+        self._automata = {}
+        self.articles_checked = 0
+
         # Palavras-chave para identificar artigos relevantes
         self.keywords = [
             'pessoa com deficiência', 'pessoa portadora de deficiência',
@@ -64,8 +83,11 @@ class LegalSourceValidator:
             'reserva de vagas', 'cotas', 'atendimento prioritário'
         ]
 
-        with open(self.root / 'data' / 'direitos.json', 'r', encoding='utf-8') as f:
-            self.data = json.load(f)
+        # data: direitos.json já carregado (modo in-process do validate_all)
+        if data is None:
+            with open(self.root / 'data' / 'direitos.json', 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        self.data = data
 
     def log(self, message, level='INFO'):
         """Log com timestamp"""
@@ -84,11 +106,44 @@ class LegalSourceValidator:
         ]
         return any(domain in url for domain in official_domains)
 
-    def fetch_law_content(self, url, retries=3):
-        """Busca conteúdo da lei de fonte oficial com retry"""
+    def fetch_law(self, url, retries=3):
+        """Busca a lei de fonte oficial com retry; devolve o resumo da leitura
+
+        A mesma URL (ex.: LBI citada em dezenas de categorias) é buscada uma
+        única vez por execução; entre execuções o texto vem do acervo local.
+        O resumo não guarda o texto (ele fica no acervo), só o que a
+        validação usa: {'chars', 'hits' (offsets de palavras-chave),
+        'index' (LawIndex), 'partial', 'text' (só sem acervo)}.
+        """
         if not self.is_official_source(url):
             return None
 
+        if url not in self._fetched:
+            path = self.corpus.fresh_path(url, allow_partial=self.stop_early) if self.corpus else None
+            if path is not None:
+                self.log(f"Acervo local: {url[:80]}", 'INFO')
+                law = self._scan_stored(url, path)
+            else:
+                law = self._download_law(url, retries)
+            self._fetched[url] = law
+        return self._fetched[url]
+
+    def fetch_law_content(self, url, retries=3):
+        """Texto extraído da lei (do acervo local ou da memória, sem acervo)"""
+        law = self.fetch_law(url, retries)
+        if law is None:
+            return None
+        if law['text'] is not None:
+            return law['text']
+        return self.corpus.text(url)
+
+    def _download_law(self, url, retries):
+        """Baixa e extrai o texto; revalida condicionalmente o que já está no acervo"""
+        entry = self.corpus.get(url) if self.corpus else None
+        usable = entry is not None and (self.stop_early or not entry.get('partial'))
+        cached = self.corpus.text_path(url) if usable else None
+        conditional = self.corpus.conditional_headers(url) if cached is not None else {}
+
         for attempt in range(retries):
             try:
                 if attempt > 0:
@@ -104,7 +159,8 @@ class LegalSourceValidator:
                         'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
                         'Accept': 'text/html,application/xhtml+xml',
                         'Accept-Language': 'pt-BR,pt;q=0.9',
-                        'Connection': 'keep-alive'
+                        'Connection': 'keep-alive',
+                        **conditional
                     }
                 )
 
@@ -112,17 +168,24 @@ class LegalSourceValidator:
                     if response.status != 200:
                         continue
 
-                    html = response.read().decode('utf-8', errors='ignore')
-
-                    # Parse HTML
-                    parser = LegalTextParser()
-                    parser.feed(html)
-                    content = parser.get_text()
+                    law = self._stream_law(url, response)
 
                     # Delay para não sobrecarregar servidor
-                    time.sleep(1)
-
-                    return content
+                    time.sleep(FETCH_DELAY)
+
+                    return law
+
+            except urllib.error.HTTPError as e:
+                # 304 Not Modified: o texto do acervo continua válido
+                if e.code == 304 and cached is not None:
+                    self.corpus.touch(url)
+                    self.corpus.save()
+                    self.log(f"Inalterada (304): {url[:80]}", 'INFO')
+                    time.sleep(FETCH_DELAY)
+                    return self._scan_stored(url, cached)
+                if attempt == retries - 1:
+                    self.log(f"Erro após {retries} tentativas: HTTP {e.code}", 'WARN')
+                continue
 
             except Exception as e:
                 if attempt == retries - 1:
@@ -131,40 +194,148 @@ class LegalSourceValidator:
 
         return None
 
+    def _stream_law(self, url, response):
+        """Lê a resposta em blocos: decodifica, extrai e grava no acervo em fluxo
+
+        Memória por lei limitada ao bloco em trânsito (READ_CHUNK) — nem o
+        HTML nem o texto inteiro ficam em memória. Com `stop_early`, a
+        leitura para assim que todas as palavras-chave apareceram e o texto
+        fica marcado como parcial.
+        """
+        charset = response.headers.get_content_charset() or 'utf-8'
+        try:
+            decoder = codecs.getincrementaldecoder(charset)(errors='ignore')
+        except LookupError:
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+
+        scanner = self._automaton(self.keywords).scanner()
+        hits = []
+        pieces = None if self.corpus else []
+        out = (self.corpus.writer(url, etag=response.headers.get('ETag'),
+                                  last_modified=response.headers.get('Last-Modified'))
+               if self.corpus else None)
+
+        def sink(piece):
+            if out is not None:
+                out.write(piece)
+            else:
+                pieces.append(piece)
+            hits.extend(pos for pos, _ in scanner.feed(piece.lower()))
+
+        parser = LawTextParser(sink=sink)
+        partial = False
+        with out if out is not None else contextlib.nullcontext():
+            while True:
+                chunk = response.read(READ_CHUNK)
+                if not chunk:
+                    parser.feed(decoder.decode(b'', final=True))
+                    break
+                parser.feed(decoder.decode(chunk))
+                if self.stop_early and scanner.found_all:
+                    partial = True
+                    self.log(f"Todas as palavras-chave encontradas — leitura interrompida "
+                             f"em {parser.length} caracteres", 'INFO')
+                    break
+            parser.close()
+            index = parser.index()
+            if out is not None:
+                out.commit(index=index, partial=partial)
+                self.corpus.save()
+
+        return {'chars': parser.length, 'hits': hits, 'index': index, 'partial': partial,
+                'text': ''.join(pieces) if pieces is not None else None}
+
+    def _scan_stored(self, url, path):
+        """Resumo de uma lei já no acervo: percorre o arquivo em blocos"""
+        scanner = self._automaton(self.keywords).scanner()
+        hits = []
+        with open(path, encoding='utf-8') as f:
+            for chunk in iter(lambda: f.read(READ_CHUNK), ''):
+                hits.extend(pos for pos, _ in scanner.feed(chunk.lower()))
+        entry = self.corpus.get(url) or {}
+        return {'chars': scanner.offset, 'hits': hits, 'index': self.corpus.index(url),
+                'partial': bool(entry.get('partial')), 'text': None}
+
+    def law_index(self, url, fetch=True):
+        """Índice Art./§/inciso completo da lei (None se indisponível ou parcial)
+
+        Sem `fetch`, só consulta o que já foi baixado ou está no acervo.
+        """
+        law = self.fetch_law(url) if fetch else self._fetched.get(url)
+        if law is not None:
+            index, partial = law['index'], law['partial']
+        elif self.corpus:
+            index, partial = self.corpus.index(url), (self.corpus.get(url) or {}).get('partial')
+        else:
+            return None
+        return index if index and not partial else None
+
+    def articles_near_keywords(self, index, hits):
+        """Artigos (em ordem da lei) que contêm alguma palavra-chave"""
+        found = {}
+        for pos in hits:
+            label = index.article_at(pos)
+            if label is not None:
+                found.setdefault(label, index.find(label)[0])
+        return [format_ref((label, None, None))
+                for label, _ in sorted(found.items(), key=lambda item: item[1])]
+
+    def _automaton(self, keywords):
+        automaton = self._automata.get(tuple(keywords))
+        if automaton is None:
+            automaton = KeywordAutomaton(k.lower() for k in keywords)
+            self._automata[tuple(keywords)] = automaton
+        return automaton
+
     def extract_articles(self, content, keywords):
-        """Extrai artigos relevantes do conteúdo da lei"""
+        """Extrai artigos relevantes do conteúdo da lei
+
+        Artigo relevante = menção a artigo a até CONTEXT_CHARS de uma
+        palavra-chave. As palavras-chave são achadas numa única passada
+        (Aho-Corasick) e as menções a artigos são indexadas uma vez por
+        posição; cada ocorrência resolve seus artigos por busca binária.
+        """
         if not content:
             return []
 
         # Normalizar texto
         content_lower = content.lower()
 
-        # Padrões de artigos
-        article_pattern = r'(art\.?\s*\d+[º°]?(?:-[A-Z])?|artigo\s+\d+[º°]?)'
-
+        automaton = self._automaton(keywords)
+        starts, ends, articles = self._article_offsets(content)
+        text_len = len(content)
+        spans = []  # faixas [lo, hi) de menções inteiras dentro de alguma janela
         relevant_articles = set()
 
-        # Buscar menções a keywords próximas a artigos
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
-            pos = 0
-
-            while (pos := content_lower.find(keyword_lower, pos)) != -1:
-                # Buscar artigo nos 500 caracteres antes e depois
-                context_start = max(0, pos - 500)
-                context_end = min(len(content), pos + 500)
-                context = content[context_start:context_end]
-
-                # Encontrar artigos no contexto
-                matches = re.findall(article_pattern, context, re.IGNORECASE)
-                for match in matches:
-                    # Normalizar formato (Art. X°)
-                    article = self.normalize_article(match)
-                    relevant_articles.add(article)
-
-                pos += 1
-
-        return sorted(list(relevant_articles))
+        for pos, _ in automaton.iter_matches(content_lower):
+            window_start = max(0, pos - CONTEXT_CHARS)
+            window_end = min(text_len, pos + CONTEXT_CHARS)
+            lo = bisect_left(starts, window_start)
+            hi = bisect_right(ends, window_end, lo)
+            if lo < hi:
+                spans.append((lo, hi))
+            # Menção cortada pelo fim da janela: vale o trecho que ainda casa
+            if hi < len(starts) and starts[hi] < window_end:
+                cut = ARTICLE_PATTERN.match(content, starts[hi], window_end)
+                if cut:
+                    relevant_articles.add(self.normalize_article(cut.group()))
+
+        covered = 0
+        for lo, hi in sorted(spans):
+            for i in range(max(lo, covered), hi):
+                relevant_articles.add(articles[i])
+            covered = max(covered, hi)
+
+        return sorted(relevant_articles)
+
+    def _article_offsets(self, content):
+        """Menções a artigos em ordem de posição: (inícios, fins, normalizadas)"""
+        starts, ends, articles = [], [], []
+        for match in ARTICLE_PATTERN.finditer(content):
+            starts.append(match.start())
+            ends.append(match.end())
+            articles.append(self.normalize_article(match.group()))
+        return starts, ends, articles
 
     def normalize_article(self, article):
         """Normaliza formato de artigo"""
@@ -201,10 +372,12 @@ class LegalSourceValidator:
         for i, entry in enumerate(base_legal_list):
             lei = entry.get('lei', '')
             artigo = entry.get('artigo')
-            url = entry.get('url', '')
+            # direitos.json guarda o endereço da lei em `link` (`url` é legado)
+            url = entry.get('link') or entry.get('url', '')
 
-            # Se já tem artigo, verificar se é válido
+            # Se já tem artigo, verificar se existe na lei
             if artigo and artigo.strip() and artigo != 'AUSENTE':
+                self.check_cited_article(categoria_id, i, entry)
                 continue
 
             # Se não tem URL oficial, sugerir artigo padrão
@@ -232,9 +405,9 @@ class LegalSourceValidator:
 
             # Buscar conteúdo da lei
             self.log(f"Validando: {categoria_id} - {lei}", 'INFO')
-            content = self.fetch_law_content(url)
+            law = self.fetch_law(url)
 
-            if not content:
+            if not law or not law['chars']:
                 self.issues.append({
                     'categoria': categoria_id,
                     'index': i,
@@ -244,8 +417,12 @@ class LegalSourceValidator:
                 })
                 continue
 
-            # Extrair artigos relevantes
-            relevant_articles = self.extract_articles(content, self.keywords)
+            # Extrair artigos relevantes: pelo índice da lei (artigo que contém
+            # a palavra-chave) ou, sem estrutura reconhecida, por proximidade
+            if law['index']:
+                relevant_articles = self.articles_near_keywords(law['index'], law['hits'])
+            else:
+                relevant_articles = self.extract_articles(self.fetch_law_content(url), self.keywords)
 
             if relevant_articles:
                 suggestion = relevant_articles[0] if len(relevant_articles) == 1 else f"{relevant_articles[0]} e outros"
@@ -285,6 +462,27 @@ class LegalSourceValidator:
                     })
                     self.log(f"FIX: {categoria_id}[{i}] → Lei completa", 'FIX')
 
+    def check_cited_article(self, categoria_id, i, entry):
+        """Confere se os dispositivos de `artigo` existem no índice da lei"""
+        url = entry.get('link') or entry.get('url', '')
+        refs = parse_reference(entry.get('artigo', ''))
+        if not refs or not url or not self.is_official_source(url):
+            return
+        index = self.law_index(url, fetch=self.verify_articles)
+        if index is None:
+            return
+        self.articles_checked += 1
+        missing = [format_ref(ref) for ref in refs if not index.has(*ref)]
+        if missing:
+            self.issues.append({
+                'categoria': categoria_id,
+                'index': i,
+                'lei': entry.get('lei', ''),
+                'problema': f"Artigo citado não encontrado na lei: {', '.join(missing)}",
+                'url': url,
+                'artigo': entry['artigo']
+            })
+
     def apply_fixes(self):
         """Aplica correções ao direitos.json"""
         if not self.fix_mode or not self.fixes:
@@ -366,6 +564,14 @@ class LegalSourceValidator:
             if base_legal:
                 self.validate_base_legal(cat_id, base_legal)
 
+        if self.corpus:
+            stats = self.corpus.stats
+            self.log(f"Acervo de leis: {len(self._fetched)} URLs distintas — "
+                     f"{stats['fresh']} do acervo, {stats['not_modified']} inalteradas (304), "
+                     f"{stats['stored']} baixadas", 'INFO')
+        if self.articles_checked:
+            self.log(f"Artigos citados conferidos no índice das leis: {self.articles_checked}", 'INFO')
+
         # Aplicar correções se modo fix
         if self.fix_mode:
             self.apply_fixes()
@@ -379,12 +585,16 @@ class LegalSourceValidator:
 if __name__ == '__main__':
     sys.stdout.reconfigure(encoding='utf-8')
     fix_mode = '--fix' in sys.argv
+    use_cache = '--no-cache' not in sys.argv
+    verify_articles = '--verify-articles' in sys.argv
+    stop_early = '--stop-early' in sys.argv
 
     if fix_mode:
         print("⚠️  MODO FIX ATIVADO - Alterações serão aplicadas em direitos.json")
         print("⚠️  Recomendamos fazer backup antes: cp data/direitos.json data/direitos.json.backup")
         print("")
 
-    validator = LegalSourceValidator(fix_mode=fix_mode)
+    validator = LegalSourceValidator(fix_mode=fix_mode, use_cache=use_cache,
+                                     verify_articles=verify_articles, stop_early=stop_early)
     exit_code = validator.run()
     sys.exit(exit_code)
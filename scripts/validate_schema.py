@@ -7,6 +7,15 @@ Valida data/direitos.json contra schemas/direitos.schema.json.
 Também valida que todas as URLs externas em data/direitos.json pertencem à
 allowlist de fontes oficiais declarada em data/fontes_oficiais.json (G1).
 
+G1 e G2 registram handlers num DataWalker (scripts/data_walker.py): o
+documento é percorrido uma única vez para os dois checks.
+
+Os demais arquivos de data/ (dicionário, matching engine, allowlist,
+municípios e o array orgaos_estaduais) são validados contra seus schemas
+no mesmo processo. Cada schema é compilado uma vez por hash (SchemaRegistry)
+e arquivos inalterados desde a última validação OK são pulados (cache em
+.cache/validate_schema/).
+
 PRIORIDADE: P1 (alto - prevenir estrutura divergente)
 ESFORÇO: 6h (já implementado!)
 FREQUÊNCIA: Sempre que modificar dados
@@ -15,23 +24,109 @@ USO:
     python scripts/validate_schema.py              # Validação completa
     python scripts/validate_schema.py --verbose    # Modo detalhado
     python scripts/validate_schema.py --skip-allowlist  # Pula G1
+    python scripts/validate_schema.py --no-cache   # Revalida todos os arquivos
 """
 
 import argparse
+import hashlib
 import json
-import re
+import os
 import sys
+import time
 from pathlib import Path
 from urllib.parse import urlparse
 
+import oficial_hosts
+from data_walker import DataWalker, format_path
+
 try:
     from jsonschema import Draft7Validator
     HAS_JSONSCHEMA = True
 except ImportError:
     HAS_JSONSCHEMA = False
 
+ROOT = Path(__file__).parent.parent
+CACHE_FILE = ROOT / ".cache" / "validate_schema" / "results.json"
+
+# (rótulo, arquivo em data/, seção do JSON ou None, schema em schemas/)
+# direitos.json inteiro é a validação principal (validate_json_schema)
+DATA_SCHEMAS = [
+    ("dicionario_pcd.json", "dicionario_pcd.json", None, "dicionario_pcd.schema.json"),
+    ("matching_engine.json", "matching_engine.json", None, "matching_engine.schema.json"),
+    ("fontes_oficiais.json", "fontes_oficiais.json", None, "fontes_oficiais.schema.json"),
+    ("municipios_br.json", "municipios_br.json", None, "municipios_br.schema.json"),
+    ("direitos.json#orgaos_estaduais", "direitos.json", "orgaos_estaduais",
+     "orgaos_estaduais.schema.json"),
+]
+
+
+def _sha256(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+
+class SchemaRegistry:
+    """Validators Draft 7 compilados uma vez por conteúdo de schema.
+
+    A chave é o sha256 do arquivo: editar o schema gera um validator novo;
+    validações seguintes no mesmo processo (validate_all in-process, vários
+    arquivos com o mesmo schema) reaproveitam o já compilado.
+    """
+
+    def __init__(self):
+        self._validators = {}
+
+    def get(self, schema_path: Path):
+        """Retorna (validator, sha256 do schema)."""
+        raw = schema_path.read_bytes()
+        key = _sha256(raw)
+        validator = self._validators.get(key)
+        if validator is None:
+            schema = json.loads(raw)
+            Draft7Validator.check_schema(schema)
+            validator = self._validators[key] = Draft7Validator(schema)
+        return validator, key
+
+
+REGISTRY = SchemaRegistry()
+
+
+def _load_results_cache(path: Path) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_results_cache(path: Path, entries: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".part")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(entries, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def _print_errors(errors, verbose: bool) -> None:
+    """Erros agrupados por caminho do campo."""
+    errors_by_path = {}
+    for error in errors:
+        path = ".".join(str(p) for p in error.path) or "root"
+        errors_by_path.setdefault(path, []).append(error)
+
+    print(f"📊 Resumo: {len(errors_by_path)} campo(s) com problemas")
+    print()
+    for i, (path, path_errors) in enumerate(errors_by_path.items(), 1):
+        print(f"{i}. Campo: {path}")
+        for error in path_errors:
+            print(f"   ❌ {error.message}")
+            if verbose:
+                print(f"      Validator: {error.validator}")
+                print(f"      Schema path: {'.'.join(str(p) for p in error.schema_path)}")
+        print()
+
 
-def validate_json_schema(data_path: Path, schema_path: Path, verbose: bool = False) -> bool:
+def validate_json_schema(data_path: Path, schema_path: Path, verbose: bool = False,
+                         data: dict | None = None) -> bool:
     """
     Valida JSON contra schema
 
@@ -39,6 +134,7 @@ def validate_json_schema(data_path: Path, schema_path: Path, verbose: bool = Fal
         data_path: Path para data/direitos.json
         schema_path: Path para schemas/direitos.schema.json
         verbose: Mostrar erros detalhados
+        data: direitos.json já carregado (evita reler o arquivo)
 
     Returns:
         True se válido, False caso contrário
@@ -59,23 +155,23 @@ def validate_json_schema(data_path: Path, schema_path: Path, verbose: bool = Fal
 
     # Carregar dados
     print(f"📄 Carregando dados: {data_path.name}")
-    with open(data_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    if data is None:
+        with open(data_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
 
-    # Carregar schema
+    # Schema compilado uma vez por hash (SchemaRegistry)
     print(f"📋 Carregando schema: {schema_path.name}")
-    with open(schema_path, 'r', encoding='utf-8') as f:
-        schema = json.load(f)
+    validator, _ = REGISTRY.get(schema_path)
 
     print()
     print("🔍 Validando...")
     print()
 
-    # Criar validador
-    validator = Draft7Validator(schema)
-
     # Validar
+    started = time.perf_counter()
     errors = list(validator.iter_errors(data))
+    print(f"⏱️ {data_path.name}: {(time.perf_counter() - started) * 1000:.0f} ms")
+    print()
 
     if not errors:
         print("=" * 80)
@@ -97,27 +193,7 @@ def validate_json_schema(data_path: Path, schema_path: Path, verbose: bool = Fal
         print("=" * 80)
         print()
 
-        # Agrupar erros por tipo
-        errors_by_path = {}
-        for error in errors:
-            path = ".".join(str(p) for p in error.path) or "root"
-            if path not in errors_by_path:
-                errors_by_path[path] = []
-            errors_by_path[path].append(error)
-
-        # Mostrar resumo
-        print(f"📊 Resumo: {len(errors_by_path)} campo(s) com problemas")
-        print()
-
-        # Mostrar erros
-        for i, (path, path_errors) in enumerate(errors_by_path.items(), 1):
-            print(f"{i}. Campo: {path}")
-            for error in path_errors:
-                print(f"   ❌ {error.message}")
-                if verbose:
-                    print(f"      Validator: {error.validator}")
-                    print(f"      Schema path: {'.'.join(str(p) for p in error.schema_path)}")
-            print()
+        _print_errors(errors, verbose)
 
         if not verbose:
             print("💡 Use --verbose para ver detalhes completos")
@@ -126,6 +202,67 @@ def validate_json_schema(data_path: Path, schema_path: Path, verbose: bool = Fal
         return False
 
 
+def validate_data_files(root: Path = ROOT, verbose: bool = False, datasets: dict | None = None,
+                        cache_path: Path | None = CACHE_FILE) -> bool:
+    """Valida os demais arquivos de data/ contra seus schemas (DATA_SCHEMAS).
+
+    `datasets` (nome do arquivo → JSON já carregado) evita reler arquivos no
+    modo in-process. Com `cache_path`, um par (hash do arquivo, hash do
+    schema) já validado com sucesso é pulado. Imprime o tempo por arquivo.
+    """
+    print()
+    print("=" * 80)
+    print("📚 Schemas dos demais arquivos de dados")
+    print("=" * 80)
+    print()
+    if not HAS_JSONSCHEMA:
+        print("❌ ERRO: Biblioteca 'jsonschema' não instalada")
+        return False
+
+    datasets = dict(datasets or {})
+    cache = _load_results_cache(cache_path) if cache_path else {}
+    all_ok = True
+    total = time.perf_counter()
+    for label, data_name, section, schema_name in DATA_SCHEMAS:
+        data_path = root / "data" / data_name
+        schema_path = root / "schemas" / schema_name
+        if not data_path.exists() or not schema_path.exists():
+            print(f"   ⚠️ {label}: {data_path.name if not data_path.exists() else schema_name} não encontrado")
+            continue
+
+        started = time.perf_counter()
+        validator, schema_key = REGISTRY.get(schema_path)
+        data_key = _sha256(data_path.read_bytes())
+        if cache.get(label) == {"data": data_key, "schema": schema_key}:
+            print(f"   ♻️ {label:<32} → {schema_name:<30} OK (inalterado)")
+            continue
+
+        if data_name not in datasets:
+            with open(data_path, "r", encoding="utf-8") as f:
+                datasets[data_name] = json.load(f)
+        document = datasets[data_name]
+        if section is not None:
+            document = document.get(section, [])
+        errors = list(validator.iter_errors(document))
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        if errors:
+            all_ok = False
+            cache.pop(label, None)
+            print(f"   ❌ {label:<32} → {schema_name:<30} {len(errors)} erro(s) ({elapsed_ms:.0f} ms)")
+            print()
+            _print_errors(errors, verbose)
+        else:
+            cache[label] = {"data": data_key, "schema": schema_key}
+            print(f"   ✅ {label:<32} → {schema_name:<30} OK ({elapsed_ms:.0f} ms)")
+
+    if cache_path:
+        _save_results_cache(cache_path, cache)
+    print()
+    print(f"⏱️ Total: {(time.perf_counter() - total) * 1000:.0f} ms")
+    return all_ok
+
+
 # ──────────────────────────────────────────────────────────────────────────
 # G1: URL allowlist validator (consome data/fontes_oficiais.json)
 # ──────────────────────────────────────────────────────────────────────────
@@ -135,39 +272,48 @@ URL_FIELD_HINTS = ("link", "url", "sefaz", "fonte")
 _SKIP_SCHEMES = {"mailto", "tel", "sms", "javascript", ""}
 
 
-def _walk_urls(node, path=""):
-    """Generator: produz (json_path, url) para todo valor string que pareça URL externa."""
-    if isinstance(node, dict):
-        for key, value in node.items():
-            sub_path = f"{path}.{key}" if path else key
-            if isinstance(value, str) and any(h in key.lower() for h in URL_FIELD_HINTS):
-                if value.startswith(("http://", "https://")):
-                    yield sub_path, value
-            else:
-                yield from _walk_urls(value, sub_path)
-    elif isinstance(node, list):
-        for idx, item in enumerate(node):
-            yield from _walk_urls(item, f"{path}[{idx}]")
-
-
-def _compile_allowlist(allowlist_path: Path):
-    """Lê data/fontes_oficiais.json e retorna lista de regex compilados para host."""
-    with open(allowlist_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    patterns = []
-    for entry in data.get("dominios", []):
-        padrao = entry["padrao"].strip().lower()
-        if padrao.startswith("*."):
-            # qualquer subdomínio (ou o próprio domínio raiz)
-            tail = re.escape(padrao[2:])
-            patterns.append(re.compile(rf"^([a-z0-9-]+\.)*{tail}$"))
-        else:
-            patterns.append(re.compile(rf"^{re.escape(padrao)}$"))
-    return patterns
+class _AllowlistCheck:
+    """G1 como handler do DataWalker: todo campo string com nome de URL."""
+
+    def __init__(self, hosts: oficial_hosts.OficialHosts):
+        self.hosts = hosts
+        self.violations = []
+        self.seen_hosts = set()
+
+    def register(self, walker: DataWalker) -> None:
+        walker.on("**", self.visit)
+
+    def visit(self, path, node):
+        key = path[-1] if path else None
+        if not isinstance(node, str) or not isinstance(key, str):
+            return
+        if not any(h in key.lower() for h in URL_FIELD_HINTS):
+            return
+        if not node.startswith(("http://", "https://")):
+            return
+        try:
+            host = (urlparse(node).hostname or "").lower()
+        except ValueError:
+            self.violations.append((format_path(path), node, "URL inválida"))
+            return
+        if not host or urlparse(node).scheme in _SKIP_SCHEMES:
+            return
+        self.seen_hosts.add(host)
+        if self.hosts.match(host) is None:
+            self.violations.append((format_path(path), node, host))
+
 
+def _compile_allowlist(allowlist_path: Path) -> oficial_hosts.OficialHosts:
+    """Lê data/fontes_oficiais.json e retorna o matcher (trie de sufixos) de hosts."""
+    return oficial_hosts.load(allowlist_path)
 
-def validate_url_allowlist(data_path: Path, allowlist_path: Path, verbose: bool = False) -> bool:
-    """G1: valida que todo URL externo em direitos.json casa com a allowlist."""
+
+def validate_url_allowlist(data_path: Path, allowlist_path: Path, verbose: bool = False,
+                           data: dict | None = None, check: _AllowlistCheck | None = None) -> bool:
+    """G1: valida que todo URL externo em direitos.json casa com a allowlist.
+
+    `check` já percorrido (passada única de `run`) dispensa nova travessia.
+    """
     print()
     print("=" * 80)
     print("🔒 G1 — Validação de Allowlist de Fontes Oficiais")
@@ -177,27 +323,18 @@ def validate_url_allowlist(data_path: Path, allowlist_path: Path, verbose: bool
         print(f"❌ ERRO: {allowlist_path} não encontrado")
         return False
 
-    patterns = _compile_allowlist(allowlist_path)
-    print(f"📋 Allowlist: {allowlist_path.name} ({len(patterns)} padrões)")
+    if check is None:
+        check = _AllowlistCheck(_compile_allowlist(allowlist_path))
+        if data is None:
+            with open(data_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        walker = DataWalker()
+        check.register(walker)
+        walker.walk(data)
+    print(f"📋 Allowlist: {allowlist_path.name} ({len(check.hosts)} padrões)")
 
-    with open(data_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    violations = []
-    seen_urls = set()
-    for json_path, url in _walk_urls(data):
-        try:
-            host = (urlparse(url).hostname or "").lower()
-        except ValueError:
-            violations.append((json_path, url, "URL inválida"))
-            continue
-        if not host or urlparse(url).scheme in _SKIP_SCHEMES:
-            continue
-        seen_urls.add(host)
-        if not any(p.match(host) for p in patterns):
-            violations.append((json_path, url, host))
-
-    print(f"🌐 URLs externas únicas encontradas: {len(seen_urls)} hosts")
+    violations = check.violations
+    print(f"🌐 URLs externas únicas encontradas: {len(check.seen_hosts)} hosts")
 
     if not violations:
         print("✅ Todas as URLs estão dentro da allowlist (.gov.br/.jus.br/.def.br/.leg.br/.mp.br/icd.who.int/...)")
@@ -257,32 +394,29 @@ _APLICAB_RULES = {
 }
 
 
-def validate_aplicabilidade_coherence(data_path: Path, verbose: bool = False) -> bool:
-    """G2: valida coerência semântica do enum `aplicabilidade` com cids+flag universal."""
-    print()
-    print("=" * 80)
-    print("🧭 G2 — Coerência `aplicabilidade` × `cids_relacionados` × `aplicavel_a_todas_deficiencias`")
-    print("=" * 80)
-    print()
+class _AplicabilidadeCheck:
+    """G2 como handler do DataWalker: cada categoria (lista ou objeto por slug)."""
 
-    with open(data_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    def __init__(self):
+        self.violations = []
+        self.inspected = 0
 
-    cats = data.get("categorias") or data
-    items = list(cats.items()) if isinstance(cats, dict) else [
-        (c.get("id") or c.get("slug") or "?", c) for c in cats
-    ]
+    def register(self, walker: DataWalker) -> None:
+        walker.on("categorias[*]", lambda path, cat: self.visit(
+            cat.get("id") or cat.get("slug") or "?", cat))
+        walker.on("categorias.*", lambda path, cat: self.visit(path[-1], cat))
 
-    violations = []
-    for slug, cat in items:
+    def visit(self, slug, cat):
+        self.inspected += 1
+        violations = self.violations
         apl = cat.get("aplicabilidade")
         if apl is None:
             violations.append((slug, "aplicabilidade ausente — rode scripts/classify_aplicabilidade.py"))
-            continue
+            return
         rule = _APLICAB_RULES.get(apl)
         if rule is None:
             violations.append((slug, f"aplicabilidade='{apl}' fora do enum (válidos: {list(_APLICAB_RULES)})"))
-            continue
+            return
 
         cids = cat.get("cids_relacionados") or []
         todas = cat.get("aplicavel_a_todas_deficiencias")
@@ -297,7 +431,34 @@ def validate_aplicabilidade_coherence(data_path: Path, verbose: bool = False) ->
                 f"aplicabilidade='{apl}' exige `aplicavel_a_todas_deficiencias`={rule['todas_must_be']} (atual: {todas})",
             ))
 
-    print(f"📊 Categorias inspecionadas: {len(items)}")
+
+def validate_aplicabilidade_coherence(data_path: Path, verbose: bool = False,
+                                      data: dict | None = None,
+                                      check: _AplicabilidadeCheck | None = None) -> bool:
+    """G2: valida coerência semântica do enum `aplicabilidade` com cids+flag universal."""
+    print()
+    print("=" * 80)
+    print("🧭 G2 — Coerência `aplicabilidade` × `cids_relacionados` × `aplicavel_a_todas_deficiencias`")
+    print("=" * 80)
+    print()
+
+    if data is None:
+        with open(data_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+    if not data.get("categorias"):
+        # Formato legado: o próprio documento é o mapa slug → categoria
+        check = _AplicabilidadeCheck()
+        for slug, cat in data.items():
+            check.visit(slug, cat)
+    elif check is None:
+        check = _AplicabilidadeCheck()
+        walker = DataWalker()
+        check.register(walker)
+        walker.walk(data)
+
+    violations = check.violations
+    print(f"📊 Categorias inspecionadas: {check.inspected}")
 
     if not violations:
         print("✅ Todas as categorias são coerentes com o enum `aplicabilidade`.")
@@ -339,11 +500,33 @@ def main():
         action="store_true",
         help="Pula a validação G2 de coerência do enum `aplicabilidade`"
     )
+    parser.add_argument(
+        "--skip-data-files",
+        action="store_true",
+        help="Valida só direitos.json (pula dicionário, matching engine, allowlist, municípios)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Revalida todos os arquivos, ignorando o cache de resultados por hash"
+    )
 
     args = parser.parse_args()
+    return run(verbose=args.verbose, skip_allowlist=args.skip_allowlist,
+               skip_aplicabilidade=args.skip_aplicabilidade,
+               skip_data_files=args.skip_data_files, use_cache=not args.no_cache)
 
+
+def run(data: dict | None = None, verbose: bool = False, skip_allowlist: bool = False,
+        skip_aplicabilidade: bool = False, skip_data_files: bool = False,
+        datasets: dict | None = None, use_cache: bool = True) -> int:
+    """Executa schema + G1 + G2 + demais arquivos. Retorna o exit code (0 = OK).
+
+    `data` é o direitos.json já carregado e `datasets` os demais JSONs por
+    nome de arquivo (modo in-process do validate_all).
+    """
     # Paths
-    root = Path(__file__).parent.parent
+    root = ROOT
     data_path = root / "data" / "direitos.json"
     schema_path = root / "schemas" / "direitos.schema.json"
     allowlist_path = root / "data" / "fontes_oficiais.json"
@@ -358,18 +541,41 @@ def main():
         print("   Crie o schema primeiro!")
         return 1
 
+    if data is None:
+        with open(data_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+    # G1 + G2 numa única travessia do documento
+    walker = DataWalker()
+    allowlist_check = aplicab_check = None
+    if not skip_allowlist and allowlist_path.exists():
+        allowlist_check = _AllowlistCheck(_compile_allowlist(allowlist_path))
+        allowlist_check.register(walker)
+    if not skip_aplicabilidade:
+        aplicab_check = _AplicabilidadeCheck()
+        aplicab_check.register(walker)
+    walker.walk(data)
+
     # Validar
-    schema_ok = validate_json_schema(data_path, schema_path, verbose=args.verbose)
+    schema_ok = validate_json_schema(data_path, schema_path, verbose=verbose, data=data)
 
     allowlist_ok = True
-    if not args.skip_allowlist:
-        allowlist_ok = validate_url_allowlist(data_path, allowlist_path, verbose=args.verbose)
+    if not skip_allowlist:
+        allowlist_ok = validate_url_allowlist(data_path, allowlist_path, verbose=verbose, data=data,
+                                              check=allowlist_check)
 
     aplicab_ok = True
-    if not args.skip_aplicabilidade:
-        aplicab_ok = validate_aplicabilidade_coherence(data_path, verbose=args.verbose)
+    if not skip_aplicabilidade:
+        aplicab_ok = validate_aplicabilidade_coherence(data_path, verbose=verbose, data=data,
+                                                       check=aplicab_check)
+
+    files_ok = True
+    if not skip_data_files:
+        files_ok = validate_data_files(root, verbose=verbose,
+                                       datasets={"direitos.json": data, **(datasets or {})},
+                                       cache_path=CACHE_FILE if use_cache else None)
 
-    return 0 if (schema_ok and allowlist_ok and aplicab_ok) else 1
+    return 0 if (schema_ok and allowlist_ok and aplicab_ok and files_ok) else 1
 
 
 if __name__ == "__main__":
@@ -17,6 +17,11 @@ Uso:
     python scripts/validate_sources.py --cid             # Só CID (ICD API — requer credenciais)
     python scripts/validate_sources.py --update-dates    # Atualiza consultado_em das fontes válidas
     python scripts/validate_sources.py --json            # Saída em JSON
+    python scripts/validate_sources.py --ndjson          # Saída NDJSON em streaming
+    python scripts/validate_sources.py --workers 8       # Checagens de URL simultâneas
+    python scripts/validate_sources.py --no-cache        # Sem cache ETag/Last-Modified
+    python scripts/validate_sources.py --urls --incremental  # Só URLs novas/alteradas + rotação
+    python scripts/validate_sources.py --json --shard 1/4  # Shard 1 de 4 (URLs por host)
 
 Credenciais ICD API (para --cid):
     Crie um arquivo .env na raiz do projeto com:
@@ -31,19 +36,29 @@ Licença: MIT
 
 from __future__ import annotations
 
+import hashlib
 import http.client
 import json
 import os
 import re
 import ssl
 import sys
+import threading
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
+import zlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import date
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
+from typing import Callable, NamedTuple
+
+import oficial_hosts
+from round_robin import interleave
 
 # ─── Constantes ─────────────────────────────────────────────────────
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -71,6 +86,32 @@ def _load_dotenv() -> None:
 
 _load_dotenv()
 DATA_JSON = PROJECT_ROOT / "data" / "direitos.json"
+DICIONARIO_JSON = PROJECT_ROOT / "data" / "dicionario_pcd.json"
+
+# Estado local entre execuções (não versionado — ver .gitignore)
+CACHE_DIR = PROJECT_ROOT / ".cache" / "validate_sources"
+URL_CACHE_FILE = CACHE_DIR / "url_cache.json"
+URL_MANIFEST_FILE = CACHE_DIR / "url_manifest.json"
+ICD_TOKEN_FILE = CACHE_DIR / "icd_token.json"
+CID_INDEX_FILE = CACHE_DIR / "cid_index.json"
+NORM_CACHE_FILE = CACHE_DIR / "norm_cache.json"
+
+# --quick pula URLs checadas com sucesso há menos de N horas (0 = nunca pula)
+QUICK_CACHE_TTL_HOURS = 24
+
+# --incremental: janela (em execuções/dias) para revisitar todas as URLs
+INCREMENTAL_WINDOW_DAYS = 7
+
+# Situação de normas no Senado: reconsulta só entradas mais velhas que isso
+NORM_CACHE_TTL_DAYS = 7
+
+# --ndjson: intervalo mínimo entre eventos "progress" (segundos)
+NDJSON_PROGRESS_INTERVAL = 5.0
+
+# Índice local de CIDs: códigos consultados há menos disso não voltam à API
+CID_INDEX_TTL_DAYS = 30
+# Token OAuth da ICD API é renovado com essa folga antes de expirar
+ICD_TOKEN_MARGIN = 60  # segundos
 
 # APIs oficiais
 SENADO_API = "https://legis.senado.leg.br/dadosabertos"
@@ -81,12 +122,28 @@ ICD_API_BASE = "https://id.who.int/icd"
 HTTP_TIMEOUT = 15
 
 # Rate limiting
-RATE_LIMIT_DELAY = 0.3  # segundos entre requests
+RATE_LIMIT_DELAY = 0.3  # segundos entre requests (no mesmo host)
+
+# Concorrência da checagem de URLs: teto global de workers + politeness por
+# host (portais gov.br estaduais derrubam/bloqueiam rajadas do mesmo IP).
+MAX_WORKERS = 16
+PER_HOST_LIMIT = 2
 
 # Retry para erros transitórios de conexão (timeout, reset, unreachable)
 MAX_RETRIES = 3
 RETRY_BACKOFF = 2  # segundos (multiplicado pelo número da tentativa)
 
+# Circuit breaker por host: após N URLs seguidas sem conexão no mesmo host
+# (geo-fence de portal estadual), as demais URLs do host vão direto para o
+# caminho `ci_blocked` sem pagar timeout × retries de novo.
+CIRCUIT_BREAKER_THRESHOLD = 2
+
+# Timeout adaptativo por host: fator × p95 das latências observadas, limitado
+# a [ADAPTIVE_TIMEOUT_MIN, HTTP_TIMEOUT]; antes de ter amostras usa HTTP_TIMEOUT.
+ADAPTIVE_TIMEOUT_MIN = 3
+ADAPTIVE_TIMEOUT_FACTOR = 4
+ADAPTIVE_MIN_SAMPLES = 3
+
 # User-Agent mais compatível (planalto.gov.br bloqueia bots)
 BROWSER_UA = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -110,13 +167,16 @@ SSL_EXCEPTION_DOMAINS = [
 #   - timeout/unreachable em gov/jus/leg → `warning ci_blocked` (geo-fence)
 #   - 4xx em domínio NÃO oficial → `error`
 #   - 5xx em qualquer → `warning` (temporário)
-OFICIAL_BR_SUFFIXES = (".gov.br", ".jus.br", ".leg.br", ".mp.br", ".def.br")
+#
+# "Oficial BR" = padrão da allowlist (data/fontes_oficiais.json) de categoria
+# de poder público — mesma trie usada pelo G1 e pelo validate_legal_compliance
+# (ver oficial_hosts.PODER_PUBLICO_BR).
 
 
 def _is_oficial_br(url: str) -> bool:
-    """True se o domínio termina em sufixo oficial brasileiro."""
+    """True se o domínio casa com um padrão de poder público BR da allowlist."""
     host = (urllib.parse.urlparse(url).hostname or "").lower()
-    return any(host.endswith(s) for s in OFICIAL_BR_SUFFIXES)
+    return oficial_hosts.default().is_poder_publico_br(host)
 
 
 def classify_url_result(url: str, status: int, err_msg: str = "") -> tuple[str, str, bool]:
@@ -178,6 +238,50 @@ class ValidationResult:
     url: str = ""
     http_code: int = 0
     ci_blocked: bool = False  # True quando warning é falso-positivo do CI (anti-bot/geo-fence)
+    from_cache: bool = False  # True quando reaproveitado do cache de checagens (TTL)
+
+    def to_dict(self) -> dict:
+        return {
+            "source": self.source,
+            "item": self.item,
+            "status": self.status,
+            "message": self.message,
+            "url": self.url,
+            "http_code": self.http_code,
+            "ci_blocked": self.ci_blocked,
+            "from_cache": self.from_cache,
+        }
+
+
+class NdjsonSink:
+    """Saída NDJSON: um evento JSON por linha, com flush imediato.
+
+    Eventos: `start`, `result` (um por ValidationResult, assim que conclui),
+    `progress` (periódico durante a checagem de URLs), `phase` (tempo de cada
+    fase) e `summary` (contagens finais). Um processo morto no meio (ex.:
+    timeout do validate_all) deixa no arquivo tudo o que já concluiu.
+    """
+
+    def __init__(self, stream, progress_interval: float = NDJSON_PROGRESS_INTERVAL):
+        self.stream = stream
+        self.progress_interval = progress_interval
+        self._lock = threading.Lock()
+        self._last_progress = 0.0
+
+    def emit(self, event: str, **fields) -> None:
+        line = json.dumps({"event": event, **fields}, ensure_ascii=False)
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+    def progress(self, phase: str, done: int, total: int, started: float) -> None:
+        """Emite `progress` no máximo a cada `progress_interval` s (e no fim)."""
+        now = time.monotonic()
+        if done < total and now - self._last_progress < self.progress_interval:
+            return
+        self._last_progress = now
+        self.emit("progress", phase=phase, done=done, total=total,
+                  elapsed_s=round(now - started, 2))
 
 
 @dataclass
@@ -185,6 +289,9 @@ class ValidationReport:
     """Relatório agregado de validação."""
     timestamp: str = field(default_factory=lambda: date.today().isoformat())
     results: list[ValidationResult] = field(default_factory=list)
+    stats: dict = field(default_factory=dict)  # métricas de execução (pool HTTP etc.)
+    shard: dict | None = None  # {"index": i, "total": N} quando rodado com --shard
+    sink: NdjsonSink | None = field(default=None, repr=False, compare=False)  # --ndjson
 
     @property
     def ok_count(self) -> int:
@@ -198,29 +305,34 @@ class ValidationReport:
     def error_count(self) -> int:
         return sum(1 for r in self.results if r.status == "error")
 
-    def add(self, result: ValidationResult) -> None:
+    def add(self, result: ValidationResult, stream: bool = True) -> None:
         self.results.append(result)
+        if stream:
+            self.stream(result)
+
+    def stream(self, result: ValidationResult) -> None:
+        """Emite o resultado no sink NDJSON (se houver) sem esperar o fim da fase."""
+        if self.sink is not None:
+            self.sink.emit("result", **result.to_dict())
+
+    def progress(self, phase: str, done: int, total: int, started: float) -> None:
+        if self.sink is not None:
+            self.sink.progress(phase, done, total, started)
 
     def to_dict(self) -> dict:
-        return {
+        data = {
             "timestamp": self.timestamp,
             "total": len(self.results),
             "ok": self.ok_count,
             "warnings": self.warning_count,
             "errors": self.error_count,
-            "results": [
-                {
-                    "source": r.source,
-                    "item": r.item,
-                    "status": r.status,
-                    "message": r.message,
-                    "url": r.url,
-                    "http_code": r.http_code,
-                    "ci_blocked": r.ci_blocked,
-                }
-                for r in self.results
-            ],
+            "results": [r.to_dict() for r in self.results],
         }
+        if self.shard:
+            data["shard"] = self.shard
+        if self.stats:
+            data["stats"] = self.stats
+        return data
 
 
 # ─── Helpers ────────────────────────────────────────────────────────
@@ -234,6 +346,16 @@ def load_json() -> dict:
         sys.exit(1)
 
 
+def load_dicionario() -> dict:
+    """Carrega o dicionario_pcd.json (vazio se ausente — só amplia a checagem de CID)."""
+    try:
+        with open(DICIONARIO_JSON, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        print(f"⚠️  {DICIONARIO_JSON.name} indisponível: {e}")
+        return {}
+
+
 def save_json(data: dict) -> None:
     """Salva direitos.json com formatação brasileira."""
     with open(DATA_JSON, "w", encoding="utf-8") as f:
@@ -241,69 +363,333 @@ def save_json(data: dict) -> None:
     print(f"💾 {DATA_JSON.name} atualizado.")
 
 
-def _make_request(url: str, method: str = "GET", headers: dict | None = None,
-                  data: bytes | None = None, timeout: int = HTTP_TIMEOUT) -> tuple[int, str]:
-    """Faz request HTTP e retorna (status_code, body)."""
-    ctx = ssl.create_default_context()
+# ─── Pool HTTP (keep-alive por host) ───────────────────────────────
+# Fallback GET "status-only" da checagem de URLs: lê só o início do corpo e
+# fecha a conexão. Range: bytes=0-0 não é usado porque portais gov.br/WAFs
+# respondem 416 ou ignoram o header, o que mudaria a classificação.
+STATUS_PROBE_BYTES = 16 * 1024
+
+# Códigos de redirect seguidos pelo pool — mesma política e mesmo limite do
+# urllib.request.HTTPRedirectHandler, para não mudar o status final observado.
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 10
+
+# Erros típicos de conexão keep-alive que o servidor fechou enquanto ociosa.
+_STALE_CONN_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError,
+                      BrokenPipeError, http.client.BadStatusLine)
+
+
+class _PooledResponse:
+    """Resposta HTTP que devolve a conexão ao pool ao sair do `with`.
+
+    Só reaproveita a conexão quando o corpo foi lido até o fim e o servidor
+    não pediu `Connection: close`; caso contrário a conexão é descartada.
+    """
+
+    def __init__(self, pool: HTTPPool, key: tuple, conn: http.client.HTTPConnection,
+                 resp: http.client.HTTPResponse, url: str):
+        self._pool = pool
+        self._key = key
+        self._conn = conn
+        self._resp = resp
+        self.url = url
+        self.status = resp.status
+        self.reason = resp.reason
+        self.headers = resp.headers
+
+    def getcode(self) -> int:
+        return self.status
+
+    def read(self, amt: int | None = None) -> bytes:
+        data = self._resp.read(amt)
+        self._pool._count_bytes(len(data))
+        return data
+
+    def close(self) -> None:
+        if self._conn is None:
+            return
+        reusable = self._resp.isclosed() and not self._resp.will_close
+        self._resp.close()
+        self._pool._release(self._key, self._conn, reusable)
+        self._conn = None
+
+    def __enter__(self) -> _PooledResponse:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class HTTPPool:
+    """Cliente HTTP com conexões persistentes por host e contextos TLS reusados.
+
+    Substitui `urllib.request.urlopen` no validador mantendo o mesmo contrato
+    de erros — `HTTPError` para status fora de 2xx (após seguir redirects),
+    `URLError` para falhas ao conectar/enviar — para que a política
+    HEAD→GET e o fallback SSL continuem idênticos. Thread-safe: cada conexão
+    é usada por uma única thread por vez.
+
+    Com proxy configurado no ambiente (HTTPS_PROXY etc.), delega ao urllib
+    sem pooling.
+    """
+
+    def __init__(self, max_idle_per_host: int = PER_HOST_LIMIT):
+        self.max_idle_per_host = max(1, max_idle_per_host)
+        self._ctx = ssl.create_default_context()
+        self._ctx_noverify = ssl.create_default_context()
+        self._ctx_noverify.check_hostname = False
+        self._ctx_noverify.verify_mode = ssl.CERT_NONE
+        self._proxies = urllib.request.getproxies()
+        self._idle: dict[tuple, list[http.client.HTTPConnection]] = defaultdict(list)
+        self._lock = threading.Lock()
+        self.hits = 0    # request servido por conexão já aberta (sem handshake)
+        self.misses = 0  # conexão nova (TCP + TLS handshake)
+        self.bytes_in = 0  # bytes de corpo efetivamente lidos
+
+    # -- conexões -----------------------------------------------------
+    def _acquire(self, key: tuple, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                conn = idle.pop()
+                self.hits += 1
+                reused = True
+            else:
+                conn = None
+                self.misses += 1
+                reused = False
+        if conn is None:
+            scheme, host, port, insecure = key
+            if scheme == "https":
+                ctx = self._ctx_noverify if insecure else self._ctx
+                conn = http.client.HTTPSConnection(host, port, timeout=timeout, context=ctx)
+            else:
+                conn = http.client.HTTPConnection(host, port, timeout=timeout)
+        else:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+        return conn, reused
+
+    def _release(self, key: tuple, conn: http.client.HTTPConnection, reusable: bool) -> None:
+        if reusable and conn.sock is not None:
+            with self._lock:
+                idle = self._idle[key]
+                if len(idle) < self.max_idle_per_host:
+                    idle.append(conn)
+                    return
+        conn.close()
+
+    def _count_bytes(self, n: int) -> None:
+        with self._lock:
+            self.bytes_in += n
+
+    def close_all(self) -> None:
+        """Fecha todas as conexões ociosas (fim da execução)."""
+        with self._lock:
+            conns = [c for idle in self._idle.values() for c in idle]
+            self._idle.clear()
+        for conn in conns:
+            conn.close()
+
+    def stats(self) -> dict:
+        """Contadores de reuso — `misses` = handshakes efetivamente pagos."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "reuse_pct": round(self.hits / total * 100, 1) if total else 0.0,
+            "bytes_in": self.bytes_in,
+        }
+
+    # -- requests -----------------------------------------------------
+    def _uses_proxy(self, scheme: str, host: str) -> bool:
+        return scheme in self._proxies and not urllib.request.proxy_bypass(host)
+
+    def _send(self, method: str, url: str, headers: dict, data: bytes | None,
+              timeout: float, insecure: bool) -> _PooledResponse:
+        parts = urllib.parse.urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https") or not parts.hostname:
+            raise urllib.error.URLError(f"unknown url type: {url}")
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname.lower(), port, insecure and scheme == "https")
+        selector = urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+
+        for attempt in range(2):
+            conn, reused = self._acquire(key, timeout)
+            retry_stale = reused and attempt == 0  # keep-alive expirada no servidor
+            try:
+                conn.request(method, selector, body=data, headers=headers)
+            except OSError as err:
+                conn.close()
+                if retry_stale:
+                    continue
+                raise urllib.error.URLError(err)
+            try:
+                resp = conn.getresponse()
+            except _STALE_CONN_ERRORS:
+                conn.close()
+                if retry_stale:
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            return _PooledResponse(self, key, conn, resp, url)
+        raise AssertionError("unreachable")
+
+    def urlopen(self, req: urllib.request.Request, timeout: float = HTTP_TIMEOUT,
+                insecure: bool = False) -> _PooledResponse:
+        """Equivalente a `urllib.request.urlopen(req, timeout, context)`."""
+        parts = urllib.parse.urlsplit(req.full_url)
+        if self._uses_proxy(parts.scheme.lower(), parts.hostname or ""):
+            ctx = self._ctx_noverify if insecure else self._ctx
+            return urllib.request.urlopen(req, timeout=timeout, context=ctx)
+
+        method = req.get_method()
+        url = req.full_url
+        data = req.data
+        headers = dict(req.header_items())
+        if data is not None and not any(k.lower() == "content-type" for k in headers):
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+
+        for _ in range(MAX_REDIRECTS + 1):
+            resp = self._send(method, url, headers, data, timeout, insecure)
+            location = resp.headers.get("Location") or resp.headers.get("URI")
+            if resp.status in _REDIRECT_CODES and location:
+                resp.read(STATUS_PROBE_BYTES)  # corpo maior que isso: conexão descartada
+                resp.close()
+                if not (method in ("GET", "HEAD") or (resp.status in (301, 302, 303) and method == "POST")):
+                    raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+                url = urllib.parse.urljoin(url, location)
+                if method != "HEAD":
+                    method = "GET"
+                data = None
+                headers = {k: v for k, v in headers.items()
+                           if k.lower() not in ("content-length", "content-type")}
+                continue
+            if not 200 <= resp.status < 300:
+                try:
+                    resp.read(STATUS_PROBE_BYTES)
+                except (http.client.HTTPException, OSError):
+                    pass
+                resp.close()
+                raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+            return resp
+        raise urllib.error.HTTPError(url, resp.status, "redirect loop", resp.headers, None)
+
+
+_POOL = HTTPPool()
+
+
+class HttpResult(NamedTuple):
+    """Resultado bruto de um request: status, corpo (ou erro), headers e hash."""
+    status: int
+    body: str = ""          # corpo decodificado; mensagem de erro quando status == 0
+    headers: dict = {}      # headers da resposta (chaves em minúsculas)
+    content_hash: str = ""  # sha256 do corpo recebido (apenas GET; no modo
+                            # "status", do prefixo de até STATUS_PROBE_BYTES)
+
+
+def _response_headers(headers) -> dict:
+    return {k.lower(): v for k, v in (headers or {}).items()}
+
+
+def _read_body(resp, body_mode: str = "full") -> tuple[str, str]:
+    """Lê o corpo e retorna (texto, sha256 dos bytes).
+
+    body_mode="full" lê e decodifica o corpo inteiro; "status" lê no máximo
+    STATUS_PROBE_BYTES (o suficiente para o status e um hash de mudança),
+    não decodifica e deixa o pool descartar a conexão se sobrou corpo.
+    """
+    try:
+        raw = resp.read(STATUS_PROBE_BYTES) if body_mode == "status" else resp.read()
+    except http.client.IncompleteRead as ir:
+        raw = ir.partial
+    digest = hashlib.sha256(raw).hexdigest()
+    if body_mode == "status":
+        return "", digest
+    return raw.decode("utf-8", errors="replace"), digest
+
+
+def _fetch(url: str, method: str = "GET", headers: dict | None = None,
+           data: bytes | None = None, timeout: float = HTTP_TIMEOUT,
+           body_mode: str = "full") -> HttpResult:
+    """Faz request HTTP (via pool keep-alive) e retorna um `HttpResult`.
+
+    body_mode="status" é o modo da checagem de links: só o status importa,
+    então o corpo não é baixado inteiro (ver `_read_body`). "full" (padrão)
+    é o usado por validate_legislacao/validate_cid, que parseiam o corpo.
+    """
     req = urllib.request.Request(url, method=method, headers=headers or {}, data=data)
     if "User-Agent" not in (headers or {}):
         req.add_header("User-Agent", BROWSER_UA)
     req.add_header("Accept", "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8")
     req.add_header("Accept-Language", "pt-BR,pt;q=0.9,en;q=0.8")
     try:
-        with urllib.request.urlopen(req, timeout=timeout, context=ctx) as resp:
-            try:
-                body = resp.read().decode("utf-8", errors="replace")
-            except http.client.IncompleteRead as ir:
-                body = ir.partial.decode("utf-8", errors="replace")
-            return resp.status, body
+        with _POOL.urlopen(req, timeout=timeout) as resp:
+            body, digest = _read_body(resp, body_mode)
+            return HttpResult(resp.status, body, _response_headers(resp.headers), digest)
     except urllib.error.HTTPError as e:
-        return e.code, ""
+        return HttpResult(e.code, "", _response_headers(e.headers))
     except urllib.error.URLError as url_err:
         # SSL certificate error: retry sem verificação SSL se domínio estiver na whitelist
         if "CERTIFICATE_VERIFY_FAILED" in str(url_err):
             parsed = urllib.parse.urlparse(url)
             if parsed.hostname in SSL_EXCEPTION_DOMAINS:
                 # Retry com SSL verification desabilitado (apenas domínios whitelisted)
-                ctx_noverify = ssl.create_default_context()
-                ctx_noverify.check_hostname = False
-                ctx_noverify.verify_mode = ssl.CERT_NONE
                 try:
                     req2 = urllib.request.Request(url, method=method, headers=headers or {}, data=data)
                     if "User-Agent" not in (headers or {}):
                         req2.add_header("User-Agent", BROWSER_UA)
                     req2.add_header("Accept", "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8")
                     req2.add_header("Accept-Language", "pt-BR,pt;q=0.9,en;q=0.8")
-                    with urllib.request.urlopen(req2, timeout=timeout, context=ctx_noverify) as resp:
-                        try:
-                            body = resp.read().decode("utf-8", errors="replace")
-                        except http.client.IncompleteRead as ir:
-                            body = ir.partial.decode("utf-8", errors="replace")
-                        return resp.status, body
+                    with _POOL.urlopen(req2, timeout=timeout, insecure=True) as resp:
+                        body, digest = _read_body(resp, body_mode)
+                        return HttpResult(resp.status, body, _response_headers(resp.headers), digest)
                 except Exception:
                     pass  # Fallback para erro original
-        return 0, str(url_err)
+        return HttpResult(0, str(url_err))
     except (TimeoutError, OSError, http.client.IncompleteRead) as e:
-        return 0, str(e)
+        return HttpResult(0, str(e))
 
 
-def _http_head(url: str, timeout: int = HTTP_TIMEOUT) -> tuple[int, str]:
+def _make_request(url: str, method: str = "GET", headers: dict | None = None,
+                  data: bytes | None = None, timeout: int = HTTP_TIMEOUT) -> tuple[int, str]:
+    """Faz request HTTP (via pool keep-alive) e retorna (status_code, body)."""
+    result = _fetch(url, method=method, headers=headers, data=data, timeout=timeout)
+    return result.status, result.body
+
+
+def _http_head(url: str, timeout: float = HTTP_TIMEOUT,
+               headers: dict | None = None,
+               should_abort: Callable[[], bool] | None = None) -> HttpResult:
     """HEAD request — mais rápido para checar se URL existe.
 
     Inclui retry com backoff para erros transitórios de conexão
     (timeout, connection reset, network unreachable) comuns em
     portais gov.br estaduais.
+
+    `headers` extras (ex.: If-None-Match/If-Modified-Since do cache de
+    checagens) são enviados tanto no HEAD quanto no fallback GET; um 304
+    cai no caminho normal de 3xx → ok.
+
+    `should_abort` é consultado antes de cada nova tentativa após falha de
+    conexão: se o host já foi dado como inacessível (circuit breaker), os
+    retries restantes e o fallback GET são pulados.
     """
-    ctx = ssl.create_default_context()
+    extra = dict(headers or {})
     last_err: str = ""
     for attempt in range(1, MAX_RETRIES + 1):
-        req = urllib.request.Request(url, method="HEAD")
+        req = urllib.request.Request(url, method="HEAD", headers=extra)
         req.add_header("User-Agent", BROWSER_UA)
         req.add_header("Accept", "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8")
         req.add_header("Accept-Language", "pt-BR,pt;q=0.9,en;q=0.8")
         try:
-            with urllib.request.urlopen(req, timeout=timeout, context=ctx) as resp:
-                return resp.status, ""
+            with _POOL.urlopen(req, timeout=timeout) as resp:
+                resp.read()  # HEAD: b"" — marca a resposta como lida e libera a conexão ao pool
+                return HttpResult(resp.status, "", _response_headers(resp.headers))
         except urllib.error.HTTPError as e:
             # HEAD não é confiável em portais gov.br / WAFs — quase qualquer 4xx/5xx
             # pode ser falsa-negativa onde GET retorna 200. Faz fallback para GET
@@ -314,28 +700,213 @@ def _http_head(url: str, timeout: int = HTTP_TIMEOUT) -> tuple[int, str]:
             # 410/451 e códigos sem padrão conhecido continuam sem fallback (são
             # sinalizações explícitas do servidor que devem ser respeitadas).
             if e.code in (403, 404, 405, 406, 500, 502, 503):
-                return _make_request(url, timeout=timeout)
-            return e.code, ""
+                return _fetch(url, headers=extra, timeout=timeout, body_mode="status")
+            return HttpResult(e.code, "", _response_headers(e.headers))
         except urllib.error.URLError as url_err:
             # SSL certificate error: retry com GET (que tem fallback SSL integrado)
             if "CERTIFICATE_VERIFY_FAILED" in str(url_err):
-                return _make_request(url, timeout=timeout)
+                return _fetch(url, headers=extra, timeout=timeout, body_mode="status")
             # Connection reset — retry com GET (planalto.gov.br bloqueia HEAD)
             if "Connection reset" in str(url_err) or "Errno 54" in str(url_err):
-                return _make_request(url, timeout=timeout)
+                return _fetch(url, headers=extra, timeout=timeout, body_mode="status")
             last_err = str(url_err)
+            if should_abort and should_abort():
+                break
             if attempt < MAX_RETRIES:
                 time.sleep(RETRY_BACKOFF * attempt)
                 continue
             # Última tentativa: fallback para GET (alguns servidores aceitam GET mas não HEAD)
-            return _make_request(url, timeout=timeout)
+            return _fetch(url, headers=extra, timeout=timeout, body_mode="status")
         except (TimeoutError, OSError) as e:
             last_err = str(e)
+            if should_abort and should_abort():
+                break
             if attempt < MAX_RETRIES:
                 time.sleep(RETRY_BACKOFF * attempt)
                 continue
-            return _make_request(url, timeout=timeout)
-    return 0, last_err
+            return _fetch(url, headers=extra, timeout=timeout, body_mode="status")
+    return HttpResult(0, last_err)
+
+
+# ─── Estado persistido entre execuções ─────────────────────────────
+class _JsonStore:
+    """Arquivo JSON versionado `{"version", "entries"}` com escrita atômica.
+
+    Base dos estados locais do validador (cache de checagens, manifesto
+    incremental). Versão diferente ou arquivo corrompido → começa vazio.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path | None = None, entries: dict | None = None):
+        self.path = path
+        self.entries: dict[str, dict] = entries or {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == cls.VERSION:
+                return cls(path, data.get("entries", {}))
+        except (FileNotFoundError, json.JSONDecodeError, AttributeError):
+            pass
+        return cls(path)
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".part")
+        with self._lock:
+            payload = {"version": self.VERSION, "entries": self.entries}
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
+
+
+# ─── Cache de checagens (ETag / Last-Modified) ─────────────────────
+class UrlCache(_JsonStore):
+    """Metadados persistidos da última checagem de cada URL.
+
+    Guarda ETag, Last-Modified, status, hash do conteúdo e instante da
+    checagem em `.cache/validate_sources/url_cache.json` (fora do git).
+    Permite requests condicionais (If-None-Match / If-Modified-Since → 304)
+    e, com TTL, pular URLs checadas há pouco com sucesso.
+    """
+
+    def __init__(self, path: Path | None = None, entries: dict | None = None):
+        super().__init__(path, entries)
+        self.not_modified = 0  # respostas 304 (corpo não retransmitido)
+        self.skipped = 0       # URLs reaproveitadas do cache por TTL
+
+    def get(self, url: str) -> dict | None:
+        with self._lock:
+            entry = self.entries.get(url)
+            return dict(entry) if entry else None
+
+    def conditional_headers(self, url: str) -> dict:
+        """Headers If-None-Match / If-Modified-Since para a URL (se houver)."""
+        entry = self.get(url) or {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def fresh(self, url: str, ttl_hours: float) -> dict | None:
+        """Entrada OK checada há menos de `ttl_hours` (None se expirada/falha)."""
+        if ttl_hours <= 0:
+            return None
+        entry = self.get(url)
+        if not entry or not 200 <= entry.get("status", 0) < 400:
+            return None
+        try:
+            checked = datetime.fromisoformat(entry["checked_at"])
+        except (KeyError, ValueError):
+            return None
+        if datetime.now(timezone.utc) - checked > timedelta(hours=ttl_hours):
+            return None
+        return entry
+
+    def record(self, url: str, result: HttpResult) -> None:
+        """Atualiza a entrada da URL com o resultado de uma checagem."""
+        with self._lock:
+            previous = self.entries.get(url, {})
+            entry = {
+                "status": result.status,
+                "checked_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            }
+            if result.status == 304:
+                self.not_modified += 1
+                entry.update({k: previous[k] for k in ("etag", "last_modified", "content_hash")
+                              if previous.get(k)})
+            elif 200 <= result.status < 400:
+                if result.headers.get("etag"):
+                    entry["etag"] = result.headers["etag"]
+                if result.headers.get("last-modified"):
+                    entry["last_modified"] = result.headers["last-modified"]
+                content_hash = result.content_hash or previous.get("content_hash")
+                if content_hash:
+                    entry["content_hash"] = content_hash
+            # Falhas não guardam validadores: a próxima checagem é completa.
+            self.entries[url] = entry
+
+    def stats(self) -> dict:
+        return {"entries": len(self.entries), "not_modified": self.not_modified,
+                "skipped_ttl": self.skipped}
+
+
+# ─── Manifesto incremental (URL → seção, último resultado) ─────────
+class UrlManifest(_JsonStore):
+    """Manifesto das URLs checadas: seção, nome, último resultado e data.
+
+    Base do modo `--incremental`: compara a saída atual de
+    `extract_all_urls` com o manifesto e checa só o que é novo, mudou de
+    contexto ou falhou na última vez, mais uma fatia rotativa das entradas
+    mais antigas — de forma que `window_days` execuções cubram o conjunto
+    inteiro.
+    """
+
+    def __init__(self, path: Path | None = None, entries: dict | None = None,
+                 window_days: int = INCREMENTAL_WINDOW_DAYS):
+        super().__init__(path, entries)
+        self.window_days = max(1, window_days)
+
+    def select(self, items: list[dict], rotate: int | None = None) -> tuple[list[dict], dict]:
+        """Escolhe as URLs a checar. Retorna (selecionadas, contagem por motivo).
+
+        Args:
+            rotate: Tamanho da fatia rotativa de URLs inalteradas (None =
+                ceil(total / window_days); 0 = só novas/alteradas/falhas)
+        """
+        if rotate is None:
+            rotate = -(-len(items) // self.window_days)
+        selected: list[dict] = []
+        reasons = {"new": 0, "changed": 0, "failing": 0, "rotation": 0, "unchanged": 0}
+        stale: list[tuple[str, str, dict]] = []
+        with self._lock:
+            for item in items:
+                entry = self.entries.get(item["url"])
+                if entry is None:
+                    reason = "new"
+                elif (entry.get("section"), entry.get("name")) != (item.get("section"), item.get("name")):
+                    reason = "changed"
+                elif entry.get("status") != "ok":
+                    reason = "failing"
+                else:
+                    stale.append((entry.get("checked_at", ""), item["url"], item))
+                    continue
+                reasons[reason] += 1
+                selected.append(item)
+        stale.sort(key=lambda t: (t[0], t[1]))
+        rotation = [item for _, _, item in stale[:max(0, rotate)]]
+        reasons["rotation"] = len(rotation)
+        reasons["unchanged"] = len(stale) - len(rotation)
+        chosen = {item["url"] for item in selected + rotation}
+        # Mantém a ordem de extract_all_urls
+        return [item for item in items if item["url"] in chosen], reasons
+
+    def record(self, item: dict, result: ValidationResult) -> None:
+        with self._lock:
+            self.entries[item["url"]] = {
+                "section": item.get("section", ""),
+                "name": item.get("name", ""),
+                "status": result.status,
+                "http_code": result.http_code,
+                "checked_at": date.today().isoformat(),
+            }
+
+    def prune(self, items: list[dict]) -> int:
+        """Remove URLs que saíram do direitos.json. Retorna quantas."""
+        current = {item["url"] for item in items}
+        with self._lock:
+            gone = [url for url in self.entries if url not in current]
+            for url in gone:
+                del self.entries[url]
+        return len(gone)
 
 
 # ─── Extração de URLs ──────────────────────────────────────────────
@@ -404,14 +975,201 @@ def extract_all_urls(json_data: dict) -> list[dict]:
     return deduped
 
 
+# ─── Particionamento (--shard i/N) ─────────────────────────────────
+def parse_shard(spec: str) -> tuple[int, int]:
+    """Converte "i/N" (1-based) em (i, N). Levanta ValueError se inválido."""
+    try:
+        index, total = (int(part) for part in spec.split("/", 1))
+    except ValueError:
+        raise ValueError(f"shard inválido: {spec!r} (esperado i/N, ex.: 2/4)") from None
+    if total < 1 or not 1 <= index <= total:
+        raise ValueError(f"shard inválido: {spec!r} (esperado 1 <= i <= N)")
+    return index, total
+
+
+def shard_of(url: str, total: int) -> int:
+    """Shard (1-based) de uma URL — hash estável do host.
+
+    Todas as URLs de um host caem no mesmo shard, então a politeness por
+    host (`HostThrottle`) continua valendo dentro de cada runner.
+    """
+    host = _url_host(url).encode("utf-8")
+    return zlib.crc32(host) % total + 1
+
+
+def filter_shard(items: list[dict], shard: tuple[int, int] | None) -> list[dict]:
+    """Mantém só as URLs do shard (ordem preservada). None = todas."""
+    if shard is None:
+        return items
+    index, total = shard
+    return [item for item in items if shard_of(item["url"], total) == index]
+
+
 # ─── 1. Validar URLs (HTTP HEAD) ───────────────────────────────────
-def validate_urls(report: ValidationReport, json_data: dict, quick: bool = False) -> None:
-    """Testa todas as URLs com HTTP HEAD/GET.
+class HostThrottle:
+    """Politeness por host para checagens concorrentes.
+
+    Garante no máximo `limit` requests simultâneos por host e um intervalo
+    mínimo de `delay` segundos entre inícios de requests no mesmo host —
+    o mesmo ritmo que o loop sequencial impunha, mas sem serializar hosts
+    diferentes entre si.
+    """
+
+    def __init__(self, limit: int = PER_HOST_LIMIT, delay: float = RATE_LIMIT_DELAY):
+        self.limit = max(1, limit)
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._next_start: dict[str, float] = defaultdict(float)
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            sem = self._semaphores.get(host)
+            if sem is None:
+                sem = self._semaphores[host] = threading.BoundedSemaphore(self.limit)
+            return sem
+
+    @contextmanager
+    def slot(self, host: str):
+        """Bloqueia até haver vaga para `host` respeitando o intervalo mínimo."""
+        sem = self._semaphore(host)
+        with sem:
+            with self._lock:
+                now = time.monotonic()
+                start_at = max(now, self._next_start[host])
+                self._next_start[host] = start_at + self.delay
+            wait = start_at - now
+            if wait > 0:
+                time.sleep(wait)
+            yield
+
+
+def _url_host(url: str) -> str:
+    return (urllib.parse.urlparse(url).hostname or "").lower()
+
+
+class HostHealth:
+    """Saúde por host durante uma execução: circuit breaker + timeout adaptativo.
+
+    - Após `threshold` URLs seguidas com falha de conexão (status 0) no mesmo
+      host, o circuito abre e as URLs restantes do host são curto-circuitadas
+      para status 0 (→ `ci_blocked` em domínio oficial, via
+      `classify_url_result`).
+    - O timeout por host passa a ser `ADAPTIVE_TIMEOUT_FACTOR` × p95 das
+      latências observadas (limitado a [ADAPTIVE_TIMEOUT_MIN, base_timeout]).
+    """
+
+    def __init__(self, threshold: int = CIRCUIT_BREAKER_THRESHOLD,
+                 base_timeout: float = HTTP_TIMEOUT):
+        self.threshold = threshold
+        self.base_timeout = base_timeout
+        self._lock = threading.Lock()
+        self._failures: dict[str, int] = defaultdict(int)
+        self._last_error: dict[str, str] = {}
+        self._latencies: dict[str, list[float]] = defaultdict(list)
+        self._open: set[str] = set()
+        self.short_circuited = 0
+
+    def is_open(self, host: str) -> bool:
+        if self.threshold <= 0:
+            return False
+        with self._lock:
+            return host in self._open
+
+    def timeout_for(self, host: str) -> float:
+        with self._lock:
+            samples = sorted(self._latencies.get(host, ()))
+        if len(samples) < ADAPTIVE_MIN_SAMPLES:
+            return self.base_timeout
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+        return min(self.base_timeout, max(ADAPTIVE_TIMEOUT_MIN, p95 * ADAPTIVE_TIMEOUT_FACTOR))
+
+    def record(self, host: str, result: HttpResult, elapsed: float) -> None:
+        with self._lock:
+            if result.status == 0:
+                self._failures[host] += 1
+                self._last_error[host] = result.body
+                if self.threshold > 0 and self._failures[host] >= self.threshold:
+                    self._open.add(host)
+            else:
+                self._failures[host] = 0
+                self._latencies[host].append(elapsed)
+
+    def short_circuit(self, host: str) -> HttpResult:
+        with self._lock:
+            self.short_circuited += 1
+            last = self._last_error.get(host, "")
+            failures = self._failures[host]
+        return HttpResult(0, f"circuito aberto após {failures} falhas de conexão em {host}: {last}")
+
+    def stats(self) -> dict:
+        with self._lock:
+            hosts = sorted(self._latencies)
+        return {
+            "open_hosts": sorted(self._open),
+            "short_circuited": self.short_circuited,
+            "timeouts": {h: round(self.timeout_for(h), 1) for h in hosts
+                         if self.timeout_for(h) < self.base_timeout},
+        }
+
+
+def _check_url(url: str, throttle: HostThrottle, cache: UrlCache | None = None,
+               health: HostHealth | None = None) -> HttpResult:
+    """Checa uma URL (HEAD→GET) dentro da vaga de politeness do host.
+
+    Com `cache`, envia os validadores da última checagem (304 = inalterada)
+    e registra o novo resultado. Com `health`, usa o timeout adaptativo do
+    host e respeita o circuit breaker.
+    """
+    host = _url_host(url)
+    headers = cache.conditional_headers(url) if cache else None
+    with throttle.slot(host):
+        if health is not None and health.is_open(host):
+            return health.short_circuit(host)
+        timeout = health.timeout_for(host) if health else HTTP_TIMEOUT
+        abort = (lambda: health.is_open(host)) if health else None
+        started = time.monotonic()
+        result = _http_head(url, timeout=timeout, headers=headers, should_abort=abort)
+    if health is not None:
+        health.record(host, result, time.monotonic() - started)
+    if cache is not None:
+        cache.record(url, result)
+    return result
+
+
+def validate_urls(report: ValidationReport, json_data: dict, quick: bool = False,
+                  workers: int = MAX_WORKERS, cache: UrlCache | None = None,
+                  cache_ttl_hours: float = 0,
+                  breaker_threshold: int = CIRCUIT_BREAKER_THRESHOLD,
+                  manifest: UrlManifest | None = None,
+                  rotate: int | None = None,
+                  shard: tuple[int, int] | None = None) -> None:
+    """Testa todas as URLs com HTTP HEAD/GET em paralelo.
+
+    A checagem roda num pool de threads limitado a `workers` com politeness
+    por host (`HostThrottle`). A política HEAD→GET, o fallback SSL e a
+    classificação (`classify_url_result`) são os mesmos do modo sequencial,
+    e os resultados entram no relatório na ordem de `extract_all_urls`.
 
     Args:
         quick: Se True, valida apenas amostra de 5 URLs (fast check)
+        workers: Teto global de checagens simultâneas (1 = sequencial)
+        cache: Cache de checagens (requests condicionais ETag/Last-Modified)
+        cache_ttl_hours: URLs OK checadas há menos disso não são refeitas
+        breaker_threshold: Falhas de conexão seguidas que abrem o circuito
+            de um host (0 = desliga o circuit breaker)
+        manifest: Modo incremental — checa só URLs novas, alteradas ou com
+            falha no manifesto, mais uma fatia rotativa das mais antigas
+        rotate: Tamanho da fatia rotativa (None = total / janela do manifesto)
+        shard: (i, N) — checa só as URLs cujo host cai no shard i de N
     """
-    all_urls = extract_all_urls(json_data)
+    all_urls = filter_shard(extract_all_urls(json_data), shard)
+    if shard is not None:
+        print(f"\n🧩 Shard {shard[0]}/{shard[1]}: {len(all_urls)} URLs deste runner")
+    # Prune contra a lista completa: com --quick, URLs fora da amostra
+    # continuam no direitos.json e não podem sair do manifesto
+    pruned = manifest.prune([item for item in all_urls if item["url"].startswith("http")]) \
+        if manifest is not None else 0
 
     if quick:
         # Amostra: primeira e última de cada tipo
@@ -421,35 +1179,88 @@ def validate_urls(report: ValidationReport, json_data: dict, quick: bool = False
         all_urls = random.sample(all_urls, sample_size)
         print(f"\n🔗 Validação rápida: {len(all_urls)} URLs (amostra)...")
     else:
-        print(f"\n🔗 Validando {len(all_urls)} URLs...")
+        print(f"\n🔗 Validando {len(all_urls)} URLs ({max(1, workers)} workers)...")
     print("-" * 60)
 
-    for i, item in enumerate(all_urls, 1):
-        url = item["url"]
-        name = item["name"][:50]
-
-        # Skip tel: e mailto:
-        if not url.startswith("http"):
+    # Skip tel: e mailto:
+    all_urls = [item for item in all_urls if item["url"].startswith("http")]
+    if manifest is not None:
+        all_urls, reasons = manifest.select(all_urls, rotate)
+        print(f"  🧭 Incremental: {reasons['new']} novas, {reasons['changed']} alteradas, "
+              f"{reasons['failing']} com falha, {reasons['rotation']} em rotação "
+              f"({reasons['unchanged']} inalteradas puladas, {pruned} removidas do manifesto)")
+        report.stats["incremental"] = {**reasons, "pruned": pruned}
+    total = len(all_urls)
+    throttle = HostThrottle(PER_HOST_LIMIT, RATE_LIMIT_DELAY)
+    health = HostHealth(breaker_threshold)
+    results: dict[str, ValidationResult] = {}
+    started = time.monotonic()
+
+    pending = []
+    for item in all_urls:
+        entry = cache.fresh(item["url"], cache_ttl_hours) if cache else None
+        if entry is None:
+            pending.append(item)
             continue
+        cache.skipped += 1
+        status_label, message, ci_blocked = classify_url_result(item["url"], entry["status"])
+        results[item["url"]] = ValidationResult(
+            source="url", item=item["name"][:50], status=status_label,
+            message=f"{message} (cache de {entry['checked_at']})", url=item["url"],
+            http_code=entry["status"], ci_blocked=ci_blocked, from_cache=True,
+        )
+        report.stream(results[item["url"]])
+    if cache is not None and cache.skipped:
+        print(f"  ♻️  {cache.skipped} URLs checadas há menos de {cache_ttl_hours:g}h (cache)")
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {
+            pool.submit(_check_url, item["url"], throttle, cache, health): item
+            # round-robin por host: os workers não ficam todos presos esperando
+            # a vaga do mesmo host (ex.: planalto.gov.br)
+            for item in interleave(pending, key=lambda item: _url_host(item["url"]))
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            item = futures[future]
+            url = item["url"]
+            name = item["name"][:50]
+
+            result = future.result()
+            status, err = result.status, result.body
+            status_label, message, ci_blocked = classify_url_result(url, status, err)
+
+            results[url] = ValidationResult(
+                source="url", item=name, status=status_label,
+                message=message, url=url, http_code=status,
+                ci_blocked=ci_blocked,
+            )
+            report.stream(results[url])
+            report.progress("url", done, len(pending), started)
+
+            if status_label == "ok":
+                icon = "✅"
+            elif status_label == "warning":
+                icon = "🟡" if ci_blocked else "⚠️"
+            else:
+                icon = "❌"
 
-        status, err = _http_head(url)
-        status_label, message, ci_blocked = classify_url_result(url, status, err)
-
-        report.add(ValidationResult(
-            source="url", item=name, status=status_label,
-            message=message, url=url, http_code=status,
-            ci_blocked=ci_blocked,
-        ))
+            print(f"  [{done:3d}/{len(pending)}] {icon} {name:<50} → HTTP {status or 'FAIL'}")
 
-        if status_label == "ok":
-            icon = "✅"
-        elif status_label == "warning":
-            icon = "🟡" if ci_blocked else "⚠️"
-        else:
-            icon = "❌"
+    # Ordem determinística no relatório (independente da ordem de conclusão);
+    # no modo --ndjson os resultados já foram emitidos conforme concluíram.
+    for item in all_urls:
+        result = results[item["url"]]
+        report.add(result, stream=False)
+        if manifest is not None and not result.from_cache:
+            manifest.record(item, result)
 
-        print(f"  [{i:3d}/{len(all_urls)}] {icon} {name:<50} → HTTP {status or 'FAIL'}")
-        time.sleep(RATE_LIMIT_DELAY)
+    print(f"  ⏱️  {total} URLs em {time.monotonic() - started:.1f}s")
+    health_stats = health.stats()
+    if health_stats["open_hosts"]:
+        print(f"  🔌 Circuito aberto em {len(health_stats['open_hosts'])} host(s): "
+              f"{', '.join(health_stats['open_hosts'])} "
+              f"({health_stats['short_circuited']} URLs sem nova tentativa)")
+    report.stats["host_health"] = health_stats
 
 
 # ─── 2. Validar Legislação (Senado Dados Abertos) ──────────────────
@@ -483,95 +1294,203 @@ def _parse_lei_number(nome: str) -> tuple[str, str, str] | None:
     return tipo, numero, ano
 
 
-def validate_legislacao(report: ValidationReport, json_data: dict) -> None:
-    """Valida leis no Senado Federal Dados Abertos."""
-    fontes = json_data.get("fontes", [])
-    leis = [f for f in fontes if f.get("tipo") == "legislacao"]
+class NormStore(_JsonStore):
+    """Situação de normas consultadas no Senado, chave (tipo, número, ano).
 
-    print(f"\n⚖️  Validando {len(leis)} leis no Senado Federal Dados Abertos...")
-    print("-" * 60)
+    Guarda situação, ementa, status HTTP e data da consulta em
+    `.cache/validate_sources/norm_cache.json`. Entradas mais novas que o TTL
+    dispensam a API; só respostas definitivas (200/404) são guardadas.
+    """
 
-    for i, fonte in enumerate(leis, 1):
-        nome = fonte.get("nome", "")[:60]
+    @staticmethod
+    def key(tipo: str, numero: str, ano: str) -> str:
+        return f"{tipo}/{numero}/{ano}"
 
-        # ── Caso especial: Constituição Federal ──────────────
-        if "constitui" in fonte.get("nome", "").lower():
-            cf_url = "https://www.planalto.gov.br/ccivil_03/Constituicao/Constituicao.htm"
-            cf_status, _ = _make_request(cf_url)
-            if cf_status and 200 <= cf_status < 400:
-                report.add(ValidationResult(
-                    source="legislacao", item=nome, status="ok",
-                    message="Constituição Federal vigente — verificada via planalto.gov.br",
-                    url=cf_url, http_code=cf_status,
-                ))
-                print(f"  [{i:3d}/{len(leis)}] ✅ {nome:<60} → CF/88 vigente (planalto.gov.br)")
-            else:
-                report.add(ValidationResult(
-                    source="legislacao", item=nome, status="warning",
-                    message=f"Planalto retornou HTTP {cf_status} — verifique manualmente",
-                    url=cf_url, http_code=cf_status,
-                ))
-                print(f"  [{i:3d}/{len(leis)}] ⚠️  {nome:<60} → HTTP {cf_status}")
-            time.sleep(RATE_LIMIT_DELAY)
-            continue
+    def fresh(self, key: str, ttl_days: float) -> dict | None:
+        entry = self.entries.get(key)
+        if not entry:
+            return None
+        try:
+            fetched = date.fromisoformat(entry["fetched_at"])
+        except (KeyError, ValueError):
+            return None
+        if (date.today() - fetched).days >= ttl_days:
+            return None
+        return entry
+
+    def record(self, key: str, entry: dict) -> None:
+        if entry.get("status") not in (200, 404):
+            return
+        with self._lock:
+            self.entries[key] = {**entry, "fetched_at": date.today().isoformat()}
+
+
+def collect_norm_refs(json_data: dict, dicionario: dict | None = None) -> list[dict]:
+    """Normas referenciadas, deduplicadas por (tipo, número, ano).
+
+    Ordem: `fontes` (tipo legislacao), `categorias[].base_legal[].lei` e
+    `dicionario_pcd.leis`. Fontes sem número extraível continuam no relatório
+    (aviso); nas demais seções elas são ignoradas. A Constituição Federal
+    vira uma única referência especial (`key == "CF"`).
+    """
+    refs: list[dict] = []
+    seen: set[str] = set()
+
+    def add(nome: str, warn_unparsed: bool) -> None:
+        if "constitui" in nome.lower():
+            key, parsed = "CF", None
+        else:
+            parsed = _parse_lei_number(nome)
+            if parsed is None:
+                if warn_unparsed:
+                    refs.append({"item": nome[:60], "key": None, "parsed": None})
+                return
+            key = NormStore.key(*parsed)
+        if key not in seen:
+            seen.add(key)
+            refs.append({"item": nome[:60], "key": key, "parsed": parsed})
+
+    for fonte in json_data.get("fontes", []):
+        if fonte.get("tipo") == "legislacao":
+            add(fonte.get("nome", ""), warn_unparsed=True)
+    for cat in json_data.get("categorias", []):
+        for bl in cat.get("base_legal", []):
+            add(bl.get("lei", ""), warn_unparsed=False)
+    for lei in (dicionario or {}).get("leis", []):
+        if lei.get("tipo") == "constituicao":
+            add(lei.get("nome", ""), warn_unparsed=False)
+        else:
+            add(lei.get("numero", ""), warn_unparsed=False)
+    return refs
+
+
+def _fetch_norm(tipo: str, numero: str, ano: str, throttle: HostThrottle) -> dict:
+    """Consulta uma norma no Senado. Retorna {status, situacao, ementa, padrao}."""
+    api_url = f"{SENADO_API}/legislacao/{tipo}/{numero}/{ano}.json"
+    with throttle.slot(_url_host(api_url)):
+        status, body = _make_request(api_url, headers={"Accept": "application/json"})
+    entry = {"status": status, "situacao": "", "ementa": "", "padrao": True}
+    if status == 200 and body:
+        try:
+            data = json.loads(body)
+            # O Senado retorna uma estrutura com DetalheNormaJuridica
+            norma = (data.get("DetalheNormaJuridica", {})
+                     .get("Norma", {}))
+            entry["situacao"] = norma.get("SituacaoNorma", {}).get("DescricaoSituacao", "")
+            entry["ementa"] = norma.get("EmentaNorma", "")[:300]
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+            entry["padrao"] = False
+    return entry
+
+
+def _validate_cf(report: ValidationReport, nome: str, prefix: str) -> None:
+    """Caso especial: Constituição Federal (não consultada no Senado)."""
+    cf_url = "https://www.planalto.gov.br/ccivil_03/Constituicao/Constituicao.htm"
+    cf_status, _ = _make_request(cf_url)
+    if cf_status and 200 <= cf_status < 400:
+        report.add(ValidationResult(
+            source="legislacao", item=nome, status="ok",
+            message="Constituição Federal vigente — verificada via planalto.gov.br",
+            url=cf_url, http_code=cf_status,
+        ))
+        print(f"  {prefix} ✅ {nome:<60} → CF/88 vigente (planalto.gov.br)")
+    else:
+        report.add(ValidationResult(
+            source="legislacao", item=nome, status="warning",
+            message=f"Planalto retornou HTTP {cf_status} — verifique manualmente",
+            url=cf_url, http_code=cf_status,
+        ))
+        print(f"  {prefix} ⚠️  {nome:<60} → HTTP {cf_status}")
+
+
+def validate_legislacao(report: ValidationReport, json_data: dict, dicionario: dict | None = None,
+                        store: NormStore | None = None, ttl_days: float = NORM_CACHE_TTL_DAYS,
+                        workers: int = PER_HOST_LIMIT) -> None:
+    """Valida leis no Senado Federal Dados Abertos.
 
-        parsed = _parse_lei_number(fonte.get("nome", ""))
+    Cada norma é consultada uma vez, mesmo que apareça em `fontes`,
+    `base_legal` e `dicionario_pcd.leis`. Situações guardadas no `NormStore`
+    há menos de `ttl_days` não voltam à API; as expiradas são renovadas em
+    paralelo com a politeness por host.
+    """
+    refs = collect_norm_refs(json_data, dicionario)
+    store = store if store is not None else NormStore()
+    expired = [
+        ref for ref in refs
+        if ref["parsed"] and store.fresh(ref["key"], ttl_days) is None
+    ]
+
+    print(f"\n⚖️  Validando {len(refs)} leis no Senado Federal Dados Abertos "
+          f"({len(expired)} consultas, demais do cache local)...")
+    print("-" * 60)
+
+    fetched: dict[str, dict] = {}
+    throttle = HostThrottle(PER_HOST_LIMIT, RATE_LIMIT_DELAY)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(_fetch_norm, *ref["parsed"], throttle): ref for ref in expired}
+        for future in as_completed(futures):
+            key = futures[future]["key"]
+            fetched[key] = future.result()
+            store.record(key, fetched[key])
+
+    for i, ref in enumerate(refs, 1):
+        nome = ref["item"]
+        prefix = f"[{i:3d}/{len(refs)}]"
+
+        if ref["key"] == "CF":
+            _validate_cf(report, nome, prefix)
+            continue
 
-        if not parsed:
+        if not ref["parsed"]:
             report.add(ValidationResult(
                 source="legislacao", item=nome, status="warning",
                 message="Não foi possível extrair tipo/número/ano para consultar API",
             ))
-            print(f"  [{i:3d}/{len(leis)}] ⏭️  {nome:<60} (sem número extraível)")
+            print(f"  {prefix} ⏭️  {nome:<60} (sem número extraível)")
             continue
 
-        tipo, numero, ano = parsed
+        tipo, numero, ano = ref["parsed"]
         api_url = f"{SENADO_API}/legislacao/{tipo}/{numero}/{ano}.json"
+        from_cache = ref["key"] not in fetched
+        entry = store.fresh(ref["key"], ttl_days) if from_cache else fetched[ref["key"]]
+        status = entry["status"]
 
-        status, body = _make_request(api_url, headers={"Accept": "application/json"})
-
-        if status == 200 and body:
-            try:
-                data = json.loads(body)
-                # O Senado retorna uma estrutura com DetalheNormaJuridica
-                norma = (data.get("DetalheNormaJuridica", {})
-                         .get("Norma", {}))
-                situacao = norma.get("SituacaoNorma", {}).get("DescricaoSituacao", "")
-                ementa = norma.get("EmentaNorma", "")[:80]
-
-                if situacao.lower() in ("em vigor", "vigente", ""):
-                    report.add(ValidationResult(
-                        source="legislacao", item=nome, status="ok",
-                        message=f"Encontrada no Senado — {situacao or 'vigente'}. {ementa}",
-                        url=api_url, http_code=200,
-                    ))
-                    icon = "✅"
-                elif "revogad" in situacao.lower():
-                    report.add(ValidationResult(
-                        source="legislacao", item=nome, status="error",
-                        message=f"⚠️ LEI REVOGADA — {situacao}. Atualize o direitos.json!",
-                        url=api_url, http_code=200,
-                    ))
-                    icon = "🚨"
-                else:
-                    report.add(ValidationResult(
-                        source="legislacao", item=nome, status="warning",
-                        message=f"Situação: {situacao}. Verifique manualmente.",
-                        url=api_url, http_code=200,
-                    ))
-                    icon = "⚠️"
-            except (json.JSONDecodeError, KeyError, TypeError):
+        if status == 200 and not entry.get("padrao", True):
+            report.add(ValidationResult(
+                source="legislacao", item=nome, status="ok",
+                message="Encontrada na API (resposta não-padrão — verificar manualmente)",
+                url=api_url, http_code=200, from_cache=from_cache,
+            ))
+            icon = "✅"
+        elif status == 200:
+            situacao = entry.get("situacao", "")
+            ementa = entry.get("ementa", "")[:80]
+            if situacao.lower() in ("em vigor", "vigente", ""):
                 report.add(ValidationResult(
                     source="legislacao", item=nome, status="ok",
-                    message="Encontrada na API (resposta não-padrão — verificar manualmente)",
-                    url=api_url, http_code=200,
+                    message=f"Encontrada no Senado — {situacao or 'vigente'}. {ementa}",
+                    url=api_url, http_code=200, from_cache=from_cache,
                 ))
                 icon = "✅"
+            elif "revogad" in situacao.lower():
+                report.add(ValidationResult(
+                    source="legislacao", item=nome, status="error",
+                    message=f"⚠️ LEI REVOGADA — {situacao}. Atualize o direitos.json!",
+                    url=api_url, http_code=200, from_cache=from_cache,
+                ))
+                icon = "🚨"
+            else:
+                report.add(ValidationResult(
+                    source="legislacao", item=nome, status="warning",
+                    message=f"Situação: {situacao}. Verifique manualmente.",
+                    url=api_url, http_code=200, from_cache=from_cache,
+                ))
+                icon = "⚠️"
         elif status == 404:
             report.add(ValidationResult(
                 source="legislacao", item=nome, status="warning",
                 message=f"Não encontrada na API do Senado ({tipo} {numero}/{ano}) — pode ser nomenclatura diferente",
-                url=api_url, http_code=404,
+                url=api_url, http_code=404, from_cache=from_cache,
             ))
             icon = "⚠️"
         else:
@@ -582,19 +1501,44 @@ def validate_legislacao(report: ValidationReport, json_data: dict) -> None:
             ))
             icon = "⚠️"
 
-        print(f"  [{i:3d}/{len(leis)}] {icon} {nome:<60} → {tipo} {numero}/{ano}")
-        time.sleep(RATE_LIMIT_DELAY)
+        origin = "💾" if from_cache else "🌐"
+        print(f"  {prefix} {icon} {origin} {nome:<60} → {tipo} {numero}/{ano}")
+
+    report.stats["norm_cache"] = {"entries": len(store.entries), "fetched": len(fetched),
+                                  "cached": sum(1 for r in refs if r["parsed"]) - len(fetched)}
 
 
 # ─── 3. Validar CID (OMS ICD API) ──────────────────────────────────
-def _get_icd_token() -> str | None:
-    """Obtém token OAuth2 da ICD API."""
+# CID-10: letra + 2 dígitos (+ subcategoria). CID-11 (MMS): capítulo
+# alfanumérico + letra + dígito + alfanumérico (6A02, AB0Z, LD40.0, MG30.01).
+_CID10_RE = re.compile(r"\b[A-Z]\d{2}(?:\.\d+)?\b")
+_CID11_RE = re.compile(r"\b[0-9A-Z][A-Z]\d[0-9A-Z](?:\.[0-9A-Z]+)?\b")
+
+
+def _get_icd_token(cache_path: Path | None = None) -> str | None:
+    """Obtém token OAuth2 da ICD API, reaproveitando o cache até expirar.
+
+    O token fica em `cache_path` (padrão: ICD_TOKEN_FILE, resolvido na chamada),
+    com permissão 0600 e associado a um hash do client_id — trocar de
+    credencial invalida o cache.
+    """
+    cache_path = cache_path if cache_path is not None else ICD_TOKEN_FILE
     client_id = os.environ.get("ICD_CLIENT_ID", "")
     client_secret = os.environ.get("ICD_CLIENT_SECRET", "")
 
     if not client_id or not client_secret:
         return None
 
+    client = hashlib.sha256(client_id.encode("utf-8")).hexdigest()[:16]
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cached = json.load(f)
+        if (cached.get("client") == client
+                and cached.get("expires_at", 0) - ICD_TOKEN_MARGIN > time.time()):
+            return cached["access_token"]
+    except (FileNotFoundError, json.JSONDecodeError, KeyError, AttributeError):
+        pass
+
     payload = urllib.parse.urlencode({
         "client_id": client_id,
         "client_secret": client_secret,
@@ -611,14 +1555,43 @@ def _get_icd_token() -> str | None:
 
     if status == 200 and body:
         try:
-            return json.loads(body).get("access_token")
+            data = json.loads(body)
+            token = data["access_token"]
         except (json.JSONDecodeError, KeyError):
-            pass
+            return None
+        _save_icd_token(cache_path, {
+            "client": client,
+            "access_token": token,
+            "expires_at": time.time() + float(data.get("expires_in", 3600)),
+        })
+        return token
+    return None
+
+
+def _save_icd_token(path: Path, payload: dict) -> None:
+    """Grava o token com permissão 0600 (credencial — só o dono lê)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".part")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(payload, f)
+    os.replace(tmp, path)
+
+
+def _cid_version(code: str) -> str | None:
+    """Versão ("10" ou "11") de um código CID isolado, ou None."""
+    if _CID10_RE.fullmatch(code):
+        return "10"
+    if _CID11_RE.fullmatch(code):
+        return "11"
     return None
 
 
 def _extract_cid_codes(classificacoes: list[dict]) -> list[dict]:
-    """Extrai códigos CID individuais das classificações."""
+    """Extrai códigos CID individuais das classificações.
+
+    Ranges ("F70 a F79", "Q71-Q73") contribuem com os códigos das pontas.
+    """
     codes = []
     for cls in classificacoes:
         tipo = cls.get("tipo", "")
@@ -629,29 +1602,137 @@ def _extract_cid_codes(classificacoes: list[dict]) -> list[dict]:
         if cid10_raw in ("Combinação", "Variados") or cid11_raw in ("Combinação", "Variados"):
             continue
 
-        # CID-10: extrair primeiro código de ranges como "F70 a F79"
-        cid10_codes = re.findall(r"[A-Z]\d{2}(?:\.\d)?", cid10_raw)
-        for code in cid10_codes[:2]:  # limitar a 2 códigos por tipo
+        for code in _CID10_RE.findall(cid10_raw):
             codes.append({"tipo": tipo, "version": "10", "code": code})
-
-        # CID-11: extrair códigos como "6A02", "9B50"
-        cid11_codes = re.findall(r"\d[A-Z0-9]{2,4}", cid11_raw)
-        for code in cid11_codes[:2]:
+        for code in _CID11_RE.findall(cid11_raw):
             codes.append({"tipo": tipo, "version": "11", "code": code})
 
     return codes
 
 
-def validate_cid(report: ValidationReport, json_data: dict) -> None:
-    """Valida códigos CID contra a ICD API da OMS."""
-    classificacoes = json_data.get("classificacao_deficiencia", [])
-    codes = _extract_cid_codes(classificacoes)
+def collect_cid_codes(json_data: dict, dicionario: dict | None = None) -> list[dict]:
+    """Todos os códigos CID referenciados, deduplicados por (versão, código).
+
+    Fontes: `classificacao_deficiencia`, `categorias[].cids_relacionados`
+    (CID-10 e CID-11 misturados) e `dicionario_pcd.deficiencias[].cid10/cid11`.
+    O `tipo` é o do primeiro lugar em que o código aparece.
+    """
+    codes = _extract_cid_codes(json_data.get("classificacao_deficiencia", []))
+
+    for cat in json_data.get("categorias", []):
+        for raw in cat.get("cids_relacionados", []):
+            for code in _CID10_RE.findall(raw) + _CID11_RE.findall(raw):
+                codes.append({"tipo": cat.get("id", ""), "version": _cid_version(code), "code": code})
+
+    for defi in (dicionario or {}).get("deficiencias", []):
+        tipo = defi.get("nome", defi.get("id", ""))
+        for version in ("10", "11"):
+            regex = _CID10_RE if version == "10" else _CID11_RE
+            for raw in defi.get(f"cid{version}", []):
+                for code in regex.findall(raw):
+                    codes.append({"tipo": tipo, "version": version, "code": code})
+
+    seen: set[tuple[str, str]] = set()
+    unique = []
+    for entry in codes:
+        key = (entry["version"], entry["code"])
+        if key not in seen:
+            seen.add(key)
+            unique.append(entry)
+    return unique
+
+
+def _cid_api_url(version: str, code: str) -> str:
+    if version == "11":
+        # CID-11 usa linearization MMS
+        return f"{ICD_API_BASE}/release/11/2024-01/mms/codeinfo/{code}"
+    # CID-10 usa release 2019
+    return f"{ICD_API_BASE}/release/10/2019/{code}"
+
+
+class CidIndex(_JsonStore):
+    """Índice local de códigos CID já consultados na ICD API.
+
+    Chave "<versão>:<código>" → status HTTP (200 = existe, 404 = não existe),
+    título e data da consulta. Construído a partir das respostas da API e
+    renovado aos poucos: só códigos novos ou com consulta mais antiga que o
+    TTL voltam à rede; o resto é validado localmente.
+    """
+
+    @staticmethod
+    def key(version: str, code: str) -> str:
+        return f"{version}:{code}"
+
+    def fresh(self, version: str, code: str, ttl_days: float) -> dict | None:
+        """Entrada consultada há menos de `ttl_days`, ou None."""
+        entry = self.entries.get(self.key(version, code))
+        if not entry:
+            return None
+        try:
+            checked = date.fromisoformat(entry["checked_at"])
+        except (KeyError, ValueError):
+            return None
+        if (date.today() - checked).days >= ttl_days:
+            return None
+        return entry
+
+    def record(self, version: str, code: str, status: int, title: str = "") -> None:
+        """Guarda respostas definitivas (200/404); falhas transitórias não entram."""
+        if status not in (200, 404):
+            return
+        with self._lock:
+            self.entries[self.key(version, code)] = {
+                "status": status,
+                "title": title,
+                "checked_at": date.today().isoformat(),
+            }
+
+
+def _lookup_cid(version: str, code: str, headers: dict, throttle: HostThrottle) -> tuple[int, str]:
+    """Consulta um código na ICD API. Retorna (status HTTP, título)."""
+    api_url = _cid_api_url(version, code)
+    with throttle.slot(_url_host(api_url)):
+        status_code, body = _make_request(api_url, headers=headers)
+    if status_code != 200 or not body:
+        return status_code, ""
+    try:
+        title = json.loads(body).get("title", {})
+    except (json.JSONDecodeError, AttributeError):
+        return status_code, "(resposta ok)"
+    if isinstance(title, dict):
+        return status_code, title.get("@value", code)
+    if isinstance(title, str):
+        return status_code, title
+    return status_code, code
+
+
+def validate_cid(report: ValidationReport, json_data: dict, dicionario: dict | None = None,
+                 index: CidIndex | None = None, ttl_days: float = CID_INDEX_TTL_DAYS,
+                 workers: int = PER_HOST_LIMIT) -> None:
+    """Valida códigos CID contra a ICD API da OMS.
+
+    Códigos presentes no índice local (`CidIndex`) há menos de `ttl_days`
+    são validados sem rede; só os novos/expirados são consultados, em
+    paralelo e com a mesma politeness por host da checagem de URLs.
+    """
+    codes = collect_cid_codes(json_data, dicionario)
+    index = index if index is not None else CidIndex()
+
+    cached = {}
+    stale = []
+    for entry in codes:
+        hit = index.fresh(entry["version"], entry["code"], ttl_days)
+        if hit is not None:
+            cached[(entry["version"], entry["code"])] = hit
+        else:
+            stale.append(entry)
 
-    print(f"\n🏥 Validando {len(codes)} códigos CID na ICD API (OMS)...")
+    print(f"\n🏥 Validando {len(codes)} códigos CID "
+          f"({len(cached)} no índice local, {len(stale)} na ICD API da OMS)...")
     print("-" * 60)
 
-    token = _get_icd_token()
-    if not token:
+    token = _get_icd_token() if stale else None
+    if stale and not token:
         print("  ⚠️  Credenciais ICD API não configuradas.")
         print("  ℹ️  Para validar CID, crie .env na raiz do projeto com:")
         print("      ICD_CLIENT_ID=<seu_client_id>")
@@ -661,66 +1742,62 @@ def validate_cid(report: ValidationReport, json_data: dict) -> None:
         report.add(ValidationResult(
             source="cid", item="ICD API",
             status="warning",
-            message="Credenciais não configuradas — validação CID ignorada. "
-                    "Registre-se em https://icd.who.int/icdapi",
+            message=f"Credenciais não configuradas — {len(stale)} códigos CID fora do índice "
+                    "local não validados. Registre-se em https://icd.who.int/icdapi",
         ))
-        return
-
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/json",
-        "Accept-Language": "pt",
-        "API-Version": "v2",
-    }
+        if not cached:
+            return
+
+    fetched: dict[tuple[str, str], tuple[int, str]] = {}
+    if token:
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/json",
+            "Accept-Language": "pt",
+            "API-Version": "v2",
+        }
+        throttle = HostThrottle(PER_HOST_LIMIT, RATE_LIMIT_DELAY)
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = {
+                pool.submit(_lookup_cid, e["version"], e["code"], headers, throttle): e
+                for e in stale
+            }
+            for future in as_completed(futures):
+                e = futures[future]
+                status_code, title = future.result()
+                fetched[(e["version"], e["code"])] = (status_code, title)
+                index.record(e["version"], e["code"], status_code, title)
 
     for i, entry in enumerate(codes, 1):
         tipo = entry["tipo"][:30]
         version = entry["version"]
         code = entry["code"]
+        key = (version, code)
+        api_url = _cid_api_url(version, code)
 
-        if version == "11":
-            # CID-11 usa linearization MMS
-            api_url = f"{ICD_API_BASE}/release/11/2024-01/mms/codeinfo/{code}"
+        if key in cached:
+            status_code, name, from_cache = cached[key]["status"], cached[key]["title"], True
+        elif key in fetched:
+            (status_code, name), from_cache = fetched[key], False
         else:
-            # CID-10 usa release 2019
-            api_url = f"{ICD_API_BASE}/release/10/2019/{code}"
+            continue  # sem credenciais e fora do índice — já sinalizado acima
 
-        status_code, body = _make_request(api_url, headers=headers)
-
-        if status_code == 200 and body:
-            try:
-                data = json.loads(body)
-                title = data.get("title", {})
-                if isinstance(title, dict):
-                    name = title.get("@value", code)
-                elif isinstance(title, str):
-                    name = title
-                else:
-                    name = code
-
-                report.add(ValidationResult(
-                    source="cid", item=f"{tipo} — CID-{version}: {code}",
-                    status="ok",
-                    message=f"Válido: {name[:60]}",
-                    url=api_url, http_code=200,
-                ))
-                icon = "✅"
-                label = name[:40]
-            except (json.JSONDecodeError, KeyError):
-                report.add(ValidationResult(
-                    source="cid", item=f"{tipo} — CID-{version}: {code}",
-                    status="ok",
-                    message="Encontrado na API (resposta não-padrão)",
-                    url=api_url, http_code=200,
-                ))
-                icon = "✅"
-                label = "(resposta ok)"
+        suffix = f" (índice local de {cached[key]['checked_at']})" if from_cache else ""
+        if status_code == 200:
+            report.add(ValidationResult(
+                source="cid", item=f"{tipo} — CID-{version}: {code}",
+                status="ok",
+                message=f"Válido: {(name or code)[:60]}{suffix}",
+                url=api_url, http_code=200, from_cache=from_cache,
+            ))
+            icon = "✅"
+            label = (name or code)[:40]
         elif status_code == 404:
             report.add(ValidationResult(
                 source="cid", item=f"{tipo} — CID-{version}: {code}",
                 status="error",
-                message=f"Código CID-{version} '{code}' NÃO encontrado na ICD API",
-                url=api_url, http_code=404,
+                message=f"Código CID-{version} '{code}' NÃO encontrado na ICD API{suffix}",
+                url=api_url, http_code=404, from_cache=from_cache,
             ))
             icon = "❌"
             label = "NÃO ENCONTRADO"
@@ -734,8 +1811,10 @@ def validate_cid(report: ValidationReport, json_data: dict) -> None:
             icon = "⚠️"
             label = f"HTTP {status_code}"
 
-        print(f"  [{i:3d}/{len(codes)}] {icon} CID-{version} {code:<8} ({tipo:<30}) → {label}")
-        time.sleep(RATE_LIMIT_DELAY)
+        origin = "💾" if from_cache else "🌐"
+        print(f"  [{i:3d}/{len(codes)}] {icon} {origin} CID-{version} {code:<8} ({tipo:<30}) → {label}")
+
+    report.stats["cid_index"] = {"entries": len(index.entries), "local": len(cached), "fetched": len(fetched)}
 
 
 # ─── 4. Atualizar datas de consulta ────────────────────────────────
@@ -744,7 +1823,8 @@ def update_consultation_dates(json_data: dict, report: ValidationReport) -> dict
     today = date.today().isoformat()
     updated_count = 0
 
-    ok_urls = {r.url for r in report.results if r.source == "url" and r.status == "ok"}
+    ok_urls = {r.url for r in report.results
+               if r.source == "url" and r.status == "ok" and not r.from_cache}
 
     for fonte in json_data.get("fontes", []):
         url = fonte.get("url", "")
@@ -801,6 +1881,26 @@ def format_report(report: ValidationReport) -> str:
                 if r.url:
                     lines.append(f"     🔗 {r.url}")
 
+    pool = report.stats.get("http_pool")
+    if pool:
+        lines.append("")
+        lines.append(
+            f"  ♻️  Pool HTTP: {pool['hits']} reusos / {pool['misses']} conexões novas "
+            f"({pool['reuse_pct']:.1f}% sem handshake), "
+            f"{pool['bytes_in'] / 1024:.0f} KiB de corpo lidos"
+        )
+    incremental = report.stats.get("incremental")
+    if incremental:
+        lines.append(
+            f"  🧭 Incremental: {incremental['unchanged']} URLs inalteradas não checadas nesta execução"
+        )
+    url_cache = report.stats.get("url_cache")
+    if url_cache:
+        lines.append(
+            f"  🗂️  Cache de URLs: {url_cache['not_modified']} não modificadas (304), "
+            f"{url_cache['skipped_ttl']} reaproveitadas por TTL"
+        )
+
     lines.append("")
     score = report.ok_count / max(len(report.results), 1) * 100
     emoji = "🏆" if score >= 90 else "⚠️" if score >= 70 else "❌"
@@ -811,8 +1911,21 @@ def format_report(report: ValidationReport) -> str:
 
 
 # ─── CLI ────────────────────────────────────────────────────────────
-def main() -> None:
-    """Entry point."""
+def _emit_phase(report: ValidationReport, phase: str, started: float) -> None:
+    """Evento NDJSON `phase` com o tempo da fase (no-op sem --ndjson)."""
+    if report.sink is not None:
+        count = sum(1 for r in report.results if r.source == phase)
+        report.sink.emit("phase", phase=phase, results=count,
+                         elapsed_s=round(time.monotonic() - started, 2))
+
+
+def main(argv: list[str] | None = None, json_data: dict | None = None) -> None:
+    """Entry point.
+
+    Args:
+        argv: Argumentos (None = sys.argv)
+        json_data: direitos.json já carregado (modo in-process do validate_all)
+    """
     import argparse
 
     parser = argparse.ArgumentParser(
@@ -827,6 +1940,13 @@ Exemplos:
   python scripts/validate_sources.py --all             # URLs + Legislação + CID
   python scripts/validate_sources.py --update-dates    # Atualiza datas das fontes válidas
   python scripts/validate_sources.py --json            # Saída JSON
+  python scripts/validate_sources.py --urls --workers 4  # URLs com 4 checagens simultâneas
+  python scripts/validate_sources.py --urls --cache-ttl 12  # Pula URLs OK checadas há <12h
+  python scripts/validate_sources.py --urls --incremental --rotate 0  # Pré-merge: só o que mudou
+  python scripts/validate_sources.py --urls --incremental --window-days 7  # Cron: 1/7 das antigas
+  python scripts/validate_sources.py --all --json --shard 2/4  # Runner 2 de 4 (por host)
+  python scripts/validate_sources.py --cid --cid-ttl 0  # Reconsulta todos os CIDs na ICD API
+  python scripts/validate_sources.py --urls --ndjson > urls.ndjson  # Streaming (sobrevive a timeout)
         """,
     )
     parser.add_argument("--urls", action="store_true", help="Validar URLs (HTTP HEAD)")
@@ -836,37 +1956,125 @@ Exemplos:
     parser.add_argument("--quick", action="store_true", help="Validação rápida (amostra de 5 URLs)")
     parser.add_argument("--update-dates", action="store_true", help="Atualizar consultado_em das fontes válidas")
     parser.add_argument("--json", action="store_true", help="Saída em JSON")
-
-    args = parser.parse_args()
+    parser.add_argument("--ndjson", action="store_true",
+                        help="Saída NDJSON em streaming (um resultado por linha, conforme conclui)")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS,
+                        help=f"Checagens de URL simultâneas (padrão: {MAX_WORKERS}; 1 = sequencial)")
+    parser.add_argument("--cache-ttl", type=float, default=None, metavar="HORAS",
+                        help="Pula URLs OK checadas há menos de HORAS "
+                             f"(padrão: {QUICK_CACHE_TTL_HOURS} com --quick, 0 sem)")
+    parser.add_argument("--breaker-threshold", type=int, default=CIRCUIT_BREAKER_THRESHOLD,
+                        metavar="N",
+                        help="Falhas de conexão seguidas que abrem o circuito de um host "
+                             f"(padrão: {CIRCUIT_BREAKER_THRESHOLD}; 0 = desliga)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignora o cache de checagens (sem requests condicionais)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Checa só URLs novas/alteradas/com falha + fatia rotativa das antigas")
+    parser.add_argument("--window-days", type=int, default=INCREMENTAL_WINDOW_DAYS, metavar="N",
+                        help="Execuções para cobrir todas as URLs no modo incremental "
+                             f"(padrão: {INCREMENTAL_WINDOW_DAYS})")
+    parser.add_argument("--rotate", type=int, default=None, metavar="N",
+                        help="URLs inalteradas revisitadas por execução "
+                             "(padrão: total / --window-days; 0 = nenhuma)")
+    parser.add_argument("--manifest", type=Path, default=URL_MANIFEST_FILE, metavar="ARQUIVO",
+                        help="Manifesto do modo incremental (padrão: .cache/validate_sources/url_manifest.json)")
+    parser.add_argument("--norm-cache", type=Path, default=NORM_CACHE_FILE, metavar="ARQUIVO",
+                        help="Cache da situação das normas (padrão: .cache/validate_sources/norm_cache.json)")
+    parser.add_argument("--norm-ttl", type=float, default=NORM_CACHE_TTL_DAYS, metavar="DIAS",
+                        help="Normas consultadas há menos de DIAS não voltam ao Senado "
+                             f"(padrão: {NORM_CACHE_TTL_DAYS}; 0 = reconsulta todas)")
+    parser.add_argument("--cid-index", type=Path, default=CID_INDEX_FILE, metavar="ARQUIVO",
+                        help="Índice local de CIDs (padrão: .cache/validate_sources/cid_index.json)")
+    parser.add_argument("--cid-ttl", type=float, default=CID_INDEX_TTL_DAYS, metavar="DIAS",
+                        help="Códigos consultados há menos de DIAS são validados no índice local "
+                             f"(padrão: {CID_INDEX_TTL_DAYS}; 0 = reconsulta todos)")
+    parser.add_argument("--shard", default=None, metavar="i/N",
+                        help="Checa só as URLs do shard i de N (particionado por host); "
+                             "legislação e CID rodam apenas no shard 1")
+
+    args = parser.parse_args(argv)
+    shard = None
+    if args.shard:
+        try:
+            shard = parse_shard(args.shard)
+        except ValueError as exc:
+            parser.error(str(exc))
 
     # Default: URLs + legislação
     run_urls = args.urls or args.all or (not args.urls and not args.legislacao and not args.cid)
     run_leg = args.legislacao or args.all or (not args.urls and not args.legislacao and not args.cid)
     run_cid = args.cid or args.all
+    if shard is not None and shard[0] != 1:
+        # Legislação e CID não são particionados: só o primeiro shard consulta
+        run_leg = run_cid = False
 
     sys.stdout.reconfigure(encoding='utf-8')
 
-    # When --json, redirect progress output to stderr so stdout is clean JSON
+    # When --json/--ndjson, redirect progress output to stderr so stdout is clean JSON
     _original_stdout = sys.stdout
-    if args.json:
+    if args.json or args.ndjson:
         sys.stderr.reconfigure(encoding='utf-8')
         sys.stdout = sys.stderr
 
-    json_data = load_json()
+    if json_data is None:
+        json_data = load_json()
     report = ValidationReport()
+    if shard is not None:
+        report.shard = {"index": shard[0], "total": shard[1]}
+    if args.ndjson:
+        report.sink = NdjsonSink(_original_stdout)
+        report.sink.emit("start", timestamp=report.timestamp, shard=report.shard,
+                         phases=[name for name, on in (("url", run_urls), ("legislacao", run_leg),
+                                                       ("cid", run_cid)) if on])
 
     print("=" * 70)
     print("  NossoDireito — Validação de Fontes Oficiais")
     print("=" * 70)
 
     if run_urls:
-        validate_urls(report, json_data, quick=args.quick)
+        url_cache = None if args.no_cache else UrlCache.load(URL_CACHE_FILE)
+        cache_ttl = args.cache_ttl
+        if cache_ttl is None:
+            cache_ttl = QUICK_CACHE_TTL_HOURS if args.quick else 0
+        manifest = None
+        if args.incremental:
+            manifest_path = args.manifest
+            if shard is not None and manifest_path == URL_MANIFEST_FILE:
+                # Um manifesto por shard: o prune não apaga URLs dos outros shards
+                manifest_path = manifest_path.with_name(
+                    f"url_manifest.shard-{shard[0]}-of-{shard[1]}.json")
+            manifest = UrlManifest.load(manifest_path)
+            manifest.window_days = max(1, args.window_days)
+        phase_started = time.monotonic()
+        validate_urls(report, json_data, quick=args.quick, workers=args.workers,
+                      cache=url_cache, cache_ttl_hours=cache_ttl,
+                      breaker_threshold=args.breaker_threshold,
+                      manifest=manifest, rotate=args.rotate, shard=shard)
+        if url_cache is not None:
+            url_cache.save()
+            report.stats["url_cache"] = url_cache.stats()
+        if manifest is not None:
+            manifest.save()
+        _emit_phase(report, "url", phase_started)
 
     if run_leg:
-        validate_legislacao(report, json_data)
+        phase_started = time.monotonic()
+        norm_store = NormStore.load(args.norm_cache)
+        validate_legislacao(report, json_data, load_dicionario(), store=norm_store,
+                            ttl_days=args.norm_ttl)
+        norm_store.save()
+        _emit_phase(report, "legislacao", phase_started)
 
     if run_cid:
-        validate_cid(report, json_data)
+        phase_started = time.monotonic()
+        cid_index = CidIndex.load(args.cid_index)
+        validate_cid(report, json_data, load_dicionario(), index=cid_index, ttl_days=args.cid_ttl)
+        cid_index.save()
+        _emit_phase(report, "cid", phase_started)
+
+    report.stats["http_pool"] = _POOL.stats()
+    _POOL.close_all()
 
     # Atualizar datas se solicitado
     if args.update_dates:
@@ -874,7 +2082,11 @@ Exemplos:
         save_json(json_data)
 
     # Output
-    if args.json:
+    if args.ndjson:
+        summary = report.to_dict()
+        del summary["results"]  # já emitidos linha a linha
+        report.sink.emit("summary", **summary)
+    elif args.json:
         sys.stdout = _original_stdout
         print(json.dumps(report.to_dict(), ensure_ascii=False, indent=2))
     else:
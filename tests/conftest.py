@@ -12,6 +12,7 @@ Reduz duplicação e garante carregamento único de arquivos pesados.
 """
 
 import json
+import threading
 from pathlib import Path
 
 import pytest
@@ -79,6 +80,40 @@ def cat_ids(direitos):
     return {c["id"] for c in direitos["categorias"]}
 
 
+# ════════════════════════════════════════════════════════════════
+# SERVIDOR HTTP LOCAL (testes de rede sem rede)
+# ════════════════════════════════════════════════════════════════
+
+@pytest.fixture
+def serve_http():
+    """Fábrica de servidores locais: `serve_http(Handler)` → URL base.
+
+    Cada chamada sobe um ThreadingHTTPServer em porta livre (thread daemon),
+    encerrado no teardown. O log de acesso do handler é silenciado e resets
+    de conexão são ignorados (clientes que leem só o status fecham a
+    resposta no meio do corpo).
+    """
+    from http.server import ThreadingHTTPServer
+
+    class Server(ThreadingHTTPServer):
+        def handle_error(self, request, client_address):
+            pass
+
+    servers = []
+
+    def serve(handler):
+        quiet = type(handler.__name__, (handler,), {"log_message": lambda self, *args: None})
+        server = Server(("127.0.0.1", 0), quiet)
+        threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield serve
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
 # ════════════════════════════════════════════════════════════════
 # FILE-CONTENT FIXTURES
 # ════════════════════════════════════════════════════════════════
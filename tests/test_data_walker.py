@@ -0,0 +1,119 @@
+"""Gate do DataWalker (travessia única compartilhada pelos validadores).
+
+Cobre a gramática de padrões, a ordem de disparo (pré-ordem, registro), a
+poda de subárvores e a equivalência dos checks G1/G2 do validate_schema
+com a travessia recursiva antiga.
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import validate_schema as vsch  # noqa: E402
+import oficial_hosts  # noqa: E402
+from data_walker import DataWalker, format_path, parse_pattern  # noqa: E402
+
+DOC = {
+    "categorias": [
+        {"id": "bpc", "links": [{"url": "https://a.gov.br"}, {"url": "tel:135"}]},
+        {"id": "fgts", "links": [], "base_legal": [{"lei": "x", "link": "https://b.gov.br"}]},
+    ],
+    "orgaos": {"SP": {"url": "https://sp.gov.br"}},
+}
+
+
+def _collect(pattern, doc=DOC):
+    seen = []
+    DataWalker().on(pattern, lambda path, node: seen.append(format_path(path))).walk(doc)
+    return seen
+
+
+class TestPatterns:
+    def test_parse(self):
+        assert parse_pattern("categorias[*].links[0].url") == [
+            "categorias", "[*]", "links", 0, "url"]
+        assert parse_pattern("**.url") == ["**", "url"]
+
+    @pytest.mark.parametrize("pattern, expected", [
+        ("categorias[*]", ["categorias[0]", "categorias[1]"]),
+        ("categorias[1].id", ["categorias[1].id"]),
+        ("categorias[*].links[*].url", ["categorias[0].links[0].url", "categorias[0].links[1].url"]),
+        ("orgaos.*", ["orgaos.SP"]),
+        ("orgaos[*]", []),
+        ("**.url", ["categorias[0].links[0].url", "categorias[0].links[1].url", "orgaos.SP.url"]),
+        ("categorias.**.link", ["categorias[1].base_legal[0].link"]),
+    ])
+    def test_matches(self, pattern, expected):
+        assert _collect(pattern) == expected
+
+    def test_any_depth_includes_root_and_is_preorder(self):
+        seen = _collect("**", {"a": [1, {"b": 2}]})
+        assert seen == ["", "a", "a[0]", "a[1]", "a[1].b"]
+
+
+class TestTraversal:
+    def test_same_node_fires_in_registration_order(self):
+        calls = []
+        walker = DataWalker()
+        walker.on("categorias[*]", lambda p, n: calls.append(("primeiro", n["id"])))
+        walker.on("categorias[*]", lambda p, n: calls.append(("segundo", n["id"])))
+        walker.walk(DOC)
+        assert calls == [("primeiro", "bpc"), ("segundo", "bpc"),
+                         ("primeiro", "fgts"), ("segundo", "fgts")]
+
+    def test_unreachable_subtrees_are_pruned(self):
+        visited = []
+
+        class Spy(list):
+            def __iter__(self):
+                visited.append("orgaos")
+                return super().__iter__()
+
+        doc = {"categorias": [{"id": "x"}], "orgaos": Spy([{"uf": "SP"}])}
+        assert _collect("categorias[*]", doc) == ["categorias[0]"]
+        assert visited == []
+
+
+def _walk_urls_recursivo(node, path=""):
+    """Travessia antiga do G1 (referência para a equivalência)."""
+    if isinstance(node, dict):
+        for key, value in node.items():
+            sub_path = f"{path}.{key}" if path else key
+            if isinstance(value, str) and any(h in key.lower() for h in vsch.URL_FIELD_HINTS):
+                if value.startswith(("http://", "https://")):
+                    yield sub_path, value
+            else:
+                yield from _walk_urls_recursivo(value, sub_path)
+    elif isinstance(node, list):
+        for idx, item in enumerate(node):
+            yield from _walk_urls_recursivo(item, f"{path}[{idx}]")
+
+
+class TestSchemaChecks:
+    def test_allowlist_check_matches_recursive_walk(self, direitos):
+        check = vsch._AllowlistCheck(oficial_hosts.OficialHosts([]))
+        walker = DataWalker()
+        check.register(walker)
+        walker.walk(direitos)
+        expected = [(p, u) for p, u in _walk_urls_recursivo(direitos)]
+        assert [(p, u) for p, u, _ in check.violations] == expected
+
+    def test_single_pass_feeds_both_checks(self, capsys):
+        data = {"categorias": [
+            {"id": "a", "aplicabilidade": "servico_universal", "aplicavel_a_todas_deficiencias": False,
+             "links": [{"url": "https://evil.example.com/x"}]},
+        ]}
+        allowlist = vsch._AllowlistCheck(vsch._compile_allowlist(ROOT / "data" / "fontes_oficiais.json"))
+        aplicab = vsch._AplicabilidadeCheck()
+        walker = DataWalker()
+        allowlist.register(walker)
+        aplicab.register(walker)
+        walker.walk(data)
+        assert [v[2] for v in allowlist.violations] == ["evil.example.com"]
+        assert aplicab.inspected == 1 and len(aplicab.violations) == 1
+        assert not vsch.validate_aplicabilidade_coherence(Path("x"), data=data, check=aplicab)
@@ -0,0 +1,211 @@
+"""Gate do índice estruturado de leis (law_index).
+
+Página no formato do planalto.gov.br → spans Art./§/inciso com offsets no
+texto extraído; persistência por lei no acervo e consultas usadas por
+validate_legal_sources e validate_legal_compliance.
+"""
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import law_index as li  # noqa: E402
+import legal_corpus as lc  # noqa: E402
+import validate_legal_compliance as vlc  # noqa: E402
+import validate_legal_sources as vls  # noqa: E402
+
+PLANALTO_HTML = """<html><head><title>L8742</title></head>
+<body>
+<p align="center"><font face="Arial"><a href="http://www4.planalto.gov.br/legislacao">Presidência da República</a></font></p>
+<p><font face="Arial">Dispõe sobre a organização da Assistência Social e dá outras providências.</font></p>
+<p><font face="Arial"><a name="art1"></a>Art. 1º A assistência social, direito do cidadão e dever do Estado.</font></p>
+<p><font face="Arial"><a name="art2"></a>Art. 2<sup>o</sup> A assistência social tem por objetivos:</font></p>
+<p><font face="Arial">I - a proteção social, que visa à garantia da vida;</font></p>
+<p><font face="Arial">II – a vigilância socioassistencial;</font></p>
+<p><font face="Arial">Parágrafo único. Para o enfrentamento da pobreza.</font></p>
+<p><font face="Arial"><a name="art20"></a>Art. 20.  O benefício de prestação continuada é a garantia de um salário-mínimo
+à pessoa com deficiência e ao idoso.</font></p>
+<p><font face="Arial">§ 1º Para os efeitos do disposto no caput, a família é composta pelo requerente.</font></p>
+<p><font face="Arial">§ 3<sup>o</sup>  Observados os demais critérios de elegibilidade:</font></p>
+<p><font face="Arial">I - renda mensal <i>per capita</i> igual ou inferior a 1/4 do salário-mínimo;</font></p>
+<p><font face="Arial"><strike>Art. 20-A. Em razão do estado de calamidade pública (revogado).</strike></font></p>
+<p><font face="Arial">Art. 1.048. Terão prioridade de tramitação.</font></p>
+<p align="center"><font face="Arial">Brasília, 7 de dezembro de 1993.</font></p>
+</body></html>"""
+
+
+@pytest.fixture(scope="module")
+def parsed():
+    parser = li.LawTextParser()
+    parser.feed(PLANALTO_HTML)
+    parser.close()
+    return parser.get_text(), parser.index()
+
+
+class TestLawTextParser:
+    def test_dispositivos_are_recognized(self, parsed):
+        _, index = parsed
+        assert index.articles() == ["1", "2", "20", "20-A", "1048"]
+        assert index.has("2", None, "I") and index.has("2", None, "II")
+        assert index.has("2", "unico")
+        assert index.has("20", "1") and index.has("20", "3")
+        assert index.has("20", "3", "I")
+        assert not index.has("20", "2")
+        assert not index.has("20", None, "I")  # inciso do § 3º, não do caput
+
+    def test_spans_point_into_the_extracted_text(self, parsed):
+        text, index = parsed
+        start, end = index.find("20", "3")
+        assert text[start:].startswith("§ 3")
+        assert "per capita" in text[start:end]
+        assert "Art. 20-A" not in text[start:end]
+        start, end = index.find("20")
+        assert text[start:].startswith("Art. 20.") and "§ 3" in text[start:end]
+
+    def test_article_at_offset(self, parsed):
+        text, index = parsed
+        assert index.article_at(text.index("salário-mínimo")) == "20"
+        assert index.article_at(text.index("vigilância")) == "2"
+        assert index.article_at(text.index("Dispõe sobre")) is None
+
+    def test_text_matches_flat_extraction(self, parsed):
+        """Mesmo texto do parser anterior: fragmentos do corpo unidos por espaço."""
+        from html.parser import HTMLParser
+
+        class Flat(HTMLParser):
+            def __init__(self):
+                super().__init__()
+                self.text, self.in_body = [], False
+
+            def handle_starttag(self, tag, attrs):
+                if tag in ["body", "div", "p"]:
+                    self.in_body = True
+
+            def handle_data(self, data):
+                if self.in_body:
+                    self.text.append(data)
+
+        flat = Flat()
+        flat.feed(PLANALTO_HTML)
+        assert parsed[0] == " ".join(flat.text)
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_chunked_feed_matches_whole_document(self, parsed, seed):
+        """Download em streaming: pedaços arbitrários dão o mesmo texto e spans."""
+        html = PLANALTO_HTML.replace("</body>", "<p>a < b &amp; c <!-- x --> d</p>"
+                                                "<p>Art. 7º teste &eacute;</p></body>")
+        whole = li.LawTextParser()
+        whole.feed(html)
+        whole.close()
+        rng = random.Random(seed)
+        parser, pos = li.LawTextParser(), 0
+        while pos < len(html):
+            step = rng.randint(1, 120)
+            parser.feed(html[pos:pos + step])
+            pos += step
+        parser.close()
+        assert parser.get_text() == whole.get_text()
+        assert parser.index().spans == whole.index().spans
+
+    def test_persistence_roundtrip(self, parsed, tmp_path):
+        _, index = parsed
+        index.save(tmp_path / "lei.json")
+        loaded = li.LawIndex.load(tmp_path / "lei.json")
+        assert loaded.spans == index.spans and loaded.has("20", "3", "I")
+        (tmp_path / "bad.json").write_text("{", encoding="utf-8")
+        assert li.LawIndex.load(tmp_path / "bad.json") is None
+
+
+@pytest.mark.parametrize("artigo, refs", [
+    ("Art. 20, § 3º", [("20", "3", None)]),
+    ("Art. 203, V", [("203", None, "V")]),
+    ("Arts. 1º a 20", [("1", None, None), ("20", None, None)]),
+    ("Art. 1º, § 8º e § 10", [("1", "8", None), ("1", "10", None)]),
+    ("Art. 26 e 26-A", [("26", None, None), ("26-A", None, None)]),
+    ("Art. 1.048", [("1048", None, None)]),
+    ("Art. 98 §2º (servidor PcD) e §3º (servidor)", [("98", "2", None), ("98", "3", None)]),
+    ("Art. 93 — reserva de 2% a 5% para PcD", [("93", None, None)]),
+    ("Art. 20, incisos XI (neoplasia), XIII (HIV)", [("20", None, "XI"), ("20", None, "XIII")]),
+    ("Art. 2º, parágrafo único", [("2", "unico", None)]),
+    ("Lei completa", []),
+    ("Cláusulas primeira e segunda", []),
+])
+def test_parse_reference(artigo, refs):
+    assert li.parse_reference(artigo) == refs
+
+
+def test_format_ref():
+    assert li.format_ref(("20", "3", "I")) == "Art. 20, § 3º, I"
+    assert li.format_ref(("3-A", "unico", None)) == "Art. 3º-A, parágrafo único"
+
+
+@pytest.fixture
+def corpus(parsed, tmp_path):
+    text, index = parsed
+    corpus = lc.LegalCorpus(tmp_path)
+    corpus.store("https://www.planalto.gov.br/ccivil_03/leis/l8742.htm", text, index=index)
+    corpus.save()
+    return lc.LegalCorpus(tmp_path)
+
+
+class TestCitedArticles:
+    URL = "https://www.planalto.gov.br/ccivil_03/leis/l8742.htm"
+
+    def test_corpus_persists_index_per_law(self, corpus):
+        index = corpus.index(self.URL)
+        assert index is not None and index.has("20", "3")
+        assert corpus.index("https://www.planalto.gov.br/outra.htm") is None
+
+    def test_legal_sources_flags_missing_articles(self, corpus, capsys):
+        data = {"categorias": [{"id": "bpc", "base_legal": [
+            {"lei": "Lei 8.742/1993", "artigo": "Art. 20, § 3º", "link": self.URL},
+            {"lei": "Lei 8.742/1993", "artigo": "Art. 20, § 2º e Art. 21", "link": self.URL},
+        ]}]}
+        validator = vls.LegalSourceValidator(data=data, corpus=corpus)
+        assert validator.run() == 1
+        assert validator.articles_checked == 2
+        [issue] = validator.issues
+        assert issue["index"] == 1
+        assert "Art. 20, § 2º, Art. 21" in issue["problema"]
+
+    def test_real_dataset_links_reach_the_article_check(self, parsed, monkeypatch, capsys):
+        """base_legal real guarda o endereço em `link`: os artigos têm de ser conferidos."""
+        import json
+        data = json.loads((ROOT / "data" / "direitos.json").read_text(encoding="utf-8"))
+        requested = []
+        validator = vls.LegalSourceValidator(data=data, use_cache=False, verify_articles=True)
+        monkeypatch.setattr(validator, "law_index", lambda url, fetch=True: requested.append(url) or parsed[1])
+        for categoria in data["categorias"]:
+            for i, entry in enumerate(categoria.get("base_legal", [])):
+                if entry.get("artigo"):
+                    validator.check_cited_article(categoria["id"], i, entry)
+        assert requested and validator.articles_checked == len(requested)
+
+    def test_suggestion_uses_the_article_containing_keywords(self, corpus, capsys):
+        validator = vls.LegalSourceValidator(data={"categorias": []}, corpus=corpus)
+        validator.validate_base_legal("bpc", [{"lei": "Lei 8.742/1993", "link": self.URL}])
+        assert validator.issues[0]["sugestao"] == "Art. 20"
+
+    def test_compliance_checks_articles_without_network(self, corpus):
+        data = {
+            # A fonte aponta para outra página: o índice vem do `link` da própria base_legal
+            "fontes": [{"nome": "Lei 8.742/1993 — LOAS", "tipo": "legislacao",
+                        "url": "https://www.planalto.gov.br/ccivil_03/leis/l8742compilado.htm"}],
+            "categorias": [{"id": "bpc", "base_legal": [
+                {"lei": "Lei 8.742/1993", "artigo": "Art. 20, § 3º", "link": self.URL},
+                {"lei": "Lei 8.742/1993", "artigo": "Art. 20, § 9º", "link": self.URL},
+                {"lei": "Lei 8.742/1993", "artigo": "Lei completa", "link": self.URL},
+            ]}],
+        }
+        validator = vlc.LegalComplianceValidator(ROOT, data=data, corpus=corpus)
+        validator._check_articles(validator._map_base_legal(
+            data["categorias"], None, *validator._index_legal_sources(data["fontes"])))
+        checks = validator.report["article_checks"]
+        assert checks["checked"] == 2 and checks["not_in_corpus"] == 0
+        assert [m["missing"] for m in checks["not_found"]] == [["Art. 20, § 9º"]]
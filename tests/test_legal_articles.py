@@ -0,0 +1,102 @@
+"""Gate da extração de artigos de textos de leis (validate_legal_sources).
+
+`extract_articles` usa Aho-Corasick + índice de menções a artigos; o
+resultado tem de ser idêntico ao da busca ingênua original (find por
+palavra-chave + regex numa janela de ±500 caracteres).
+"""
+from __future__ import annotations
+
+import random
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import validate_legal_sources as vls  # noqa: E402
+from keyword_automaton import KeywordAutomaton  # noqa: E402
+
+
+def naive_extract_articles(validator, content, keywords):
+    """Implementação original de extract_articles (referência)."""
+    if not content:
+        return []
+    content_lower = content.lower()
+    article_pattern = r'(art\.?\s*\d+[º°]?(?:-[A-Z])?|artigo\s+\d+[º°]?)'
+    relevant_articles = set()
+    for keyword in keywords:
+        keyword_lower = keyword.lower()
+        pos = 0
+        while (pos := content_lower.find(keyword_lower, pos)) != -1:
+            context = content[max(0, pos - 500):min(len(content), pos + 500)]
+            for match in re.findall(article_pattern, context, re.IGNORECASE):
+                relevant_articles.add(validator.normalize_article(match))
+            pos += 1
+    return sorted(relevant_articles)
+
+
+@pytest.fixture(scope="module")
+def validator():
+    return vls.LegalSourceValidator(data={"categorias": []}, use_cache=False)
+
+
+def _random_law(rng, size):
+    pieces = ["Art. 5º", "art. 12", "Art. 123", "Art. 20-A", "artigo 7", "ARTIGO 3º",
+              "art.45°", "Art. 9-b", "pessoa com deficiência", "deficiência",
+              "autismo", "tea", "acessibilidade", "inclusão", "cotas", "§ 1º", "inciso II",
+              "reserva de vagas", "atendimento prioritário", "Lei nº 13.146"]
+    out, length = [], 0
+    while length < size:
+        piece = rng.choice(pieces) if rng.random() < 0.3 else "x" * rng.randint(1, 400)
+        out.append(piece)
+        length += len(piece) + 1
+    return " ".join(out)
+
+
+class TestKeywordAutomaton:
+    def test_overlapping_and_nested_matches(self):
+        automaton = KeywordAutomaton(["deficiência", "pessoa com deficiência", "a", "aa"])
+        found = sorted(automaton.iter_matches("pessoa com deficiência aa"))
+        assert (0, "pessoa com deficiência") in found
+        assert (11, "deficiência") in found
+        assert [p for p, k in found if k == "a"] == [5, 21, 23, 24]
+        assert [p for p, k in found if k == "aa"] == [23]
+
+    def test_matches_every_str_find_occurrence(self):
+        rng = random.Random(7)
+        keywords = ["tea", "te", "eat", "ate", "a", "teat"]
+        text = "".join(rng.choice("teax") for _ in range(2000))
+        expected = set()
+        for keyword in keywords:
+            pos = 0
+            while (pos := text.find(keyword, pos)) != -1:
+                expected.add((pos, keyword))
+                pos += 1
+        assert set(KeywordAutomaton(keywords).iter_matches(text)) == expected
+
+
+class TestExtractArticles:
+    def test_real_fragment(self, validator):
+        text = ("Art. 1º É instituída a Lei Brasileira de Inclusão da Pessoa com Deficiência. "
+                + "x" * 600 + " Art. 99 Revoga-se.")
+        assert validator.extract_articles(text, validator.keywords) == ["Art. 1º"]
+
+    def test_mention_cut_by_the_window_keeps_naive_semantics(self, validator):
+        # "Art. 123" começa dentro da janela e termina fora: vale "Art. 12"
+        text = "autismo" + " " * 486 + "Art. 123"
+        assert validator.extract_articles(text, ["autismo"]) == ["Art. 12"]
+        assert naive_extract_articles(validator, text, ["autismo"]) == ["Art. 12"]
+
+    @pytest.mark.parametrize("seed", range(25))
+    def test_equivalent_to_naive_implementation(self, validator, seed):
+        rng = random.Random(seed)
+        text = _random_law(rng, rng.choice([300, 3000, 30000]))
+        assert (validator.extract_articles(text, validator.keywords)
+                == naive_extract_articles(validator, text, validator.keywords))
+
+    def test_empty_content(self, validator):
+        assert validator.extract_articles("", validator.keywords) == []
+        assert validator.extract_articles(None, validator.keywords) == []
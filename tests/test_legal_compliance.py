@@ -0,0 +1,127 @@
+"""Gate da checagem de URLs do validate_legal_compliance.
+
+As fontes mapeadas são checadas em paralelo com sessão HTTP compartilhada,
+respeitando o teto por camada; o relatório continua em ordem de URL e o
+corpo das páginas não é baixado (só o status).
+"""
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import legal_corpus as lc  # noqa: E402
+import validate_legal_compliance as vlc  # noqa: E402
+
+pytest.importorskip("requests")
+
+BIG_BODY = b"<html><body>" + b"x" * (2 * 1024 * 1024) + b"</body></html>"
+
+
+@pytest.fixture
+def law_server(serve_http):
+    """Servidor local lento; registra o pico de requests simultâneos e bytes enviados."""
+    from http.server import BaseHTTPRequestHandler
+
+    state = {"inflight": 0, "peak": 0, "sent": 0, "arrivals": []}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            with lock:
+                state["inflight"] += 1
+                state["peak"] = max(state["peak"], state["inflight"])
+                state["arrivals"].append(self.path)
+            try:
+                time.sleep(0.2)
+                body = b"" if self.path == "/revogada" else BIG_BODY
+                self.send_response(404 if self.path == "/revogada" else 200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+            finally:
+                with lock:
+                    state["inflight"] -= 1
+            try:
+                for i in range(0, len(body), 16384):
+                    self.wfile.write(body[i:i + 16384])
+                    with lock:
+                        state["sent"] += 16384
+                    time.sleep(0.005)
+            except OSError:
+                pass  # cliente fechou a resposta após o status (esperado)
+
+    return serve_http(Handler), state
+
+
+def _data(base, paths):
+    fontes, base_legal = [], []
+    for n, path in enumerate(paths, 1):
+        fontes.append({"nome": f"Lei {n}/2000", "tipo": "legislacao", "url": f"{base}/{path}"})
+        base_legal.append({"lei": f"Lei {n}/2000", "artigo": "Lei completa"})
+    return {"fontes": fontes, "categorias": [{"id": "cat", "base_legal": base_legal}]}
+
+
+def _validator(tmp_path, data, **kwargs):
+    return vlc.LegalComplianceValidator(tmp_path, data=data, corpus=lc.LegalCorpus(tmp_path / "acervo"),
+                                        **kwargs)
+
+
+class TestConcurrentValidation:
+    PATHS = ["lei8", "lei3", "revogada", "lei5", "lei1", "lei7", "lei2", "lei6"]
+
+    def test_report_is_in_url_order(self, law_server, tmp_path, capsys):
+        base, _ = law_server
+        validator = _validator(tmp_path, _data(base, self.PATHS), workers=4)
+        assert validator.run(category=None, quick=True) is False
+        details = validator.report["details"]
+        assert [d["url"] for d in details] == sorted(f"{base}/{p}" for p in self.PATHS)
+        assert [d["status"] for d in details if d["status"] != "valid"] == ["invalid"]
+        assert validator.report["summary"]["valid"] == 7
+        assert validator.report["layers"]["governamental"]["total"] == 8
+        saved = json.loads((tmp_path / "validation_legal_report.json").read_text(encoding="utf-8"))
+        assert saved["details"] == details
+
+    def test_layer_limit_caps_simultaneous_requests(self, law_server, tmp_path, monkeypatch, capsys):
+        base, state = law_server
+        monkeypatch.setitem(vlc.LAYER_LIMITS, "governamental", 2)
+        _validator(tmp_path, _data(base, self.PATHS), workers=8).run(category=None, quick=True)
+        # Pico = teto da camada: paralelo (> 1), mas nunca acima do limite.
+        # Sem asserção de tempo de parede (instável sob pytest -n auto).
+        assert state["peak"] == 2
+
+    def test_busy_layer_does_not_hold_the_other_layers(self, law_server, tmp_path, monkeypatch, capsys):
+        # Em ordem de URL todas as federais vêm antes: sem intercalar, os 4
+        # workers ficariam presos no semáforo federal e as governamentais
+        # só começariam depois de 4 federais
+        base, state = law_server
+        monkeypatch.setattr(vlc, "classify_layer", lambda url, *args: (
+            "federal" if "/fed" in url else "governamental"))
+        monkeypatch.setitem(vlc.LAYER_LIMITS, "federal", 2)
+        monkeypatch.setitem(vlc.LAYER_LIMITS, "governamental", 2)
+        paths = [f"fed{i}" for i in range(6)] + ["gov1", "gov2"]
+        validator = _validator(tmp_path, _data(base, paths), workers=4)
+        validator.run(category=None, quick=True)
+        assert set(state["arrivals"][:4]) == {"/fed0", "/fed1", "/gov1", "/gov2"}
+        assert [d["url"] for d in validator.report["details"]] == sorted(f"{base}/{p}" for p in paths)
+        assert validator.report["layers"]["federal"]["total"] == 6
+
+    def test_body_is_not_downloaded(self, law_server, tmp_path, capsys):
+        base, state = law_server
+        validator = _validator(tmp_path, _data(base, ["lei1", "lei2"]), workers=2)
+        assert validator.run(category=None, quick=True) is True
+        assert state["sent"] < len(BIG_BODY) // 4
+
+    def test_sequential_mode(self, law_server, tmp_path, capsys):
+        base, state = law_server
+        validator = _validator(tmp_path, _data(base, self.PATHS[:3]), workers=1)
+        validator.run(category=None, quick=True)
+        assert state["peak"] == 1
+        assert validator.report["summary"]["validated_sources"] == 3
@@ -0,0 +1,201 @@
+"""Gate do acervo local de textos de leis (legal_corpus + validate_legal_sources).
+
+Cada lei é baixada uma vez por execução (memo por URL) e, entre execuções,
+só é rebaixada após o TTL — e mesmo assim via request condicional (304).
+"""
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import legal_corpus as lc  # noqa: E402
+import validate_legal_sources as vls  # noqa: E402
+
+LEI_HTML = (b"<html><body><p>Art. 1\xc2\xba Esta Lei assegura a pessoa com defici\xc3\xaancia"
+            b" o atendimento priorit\xc3\xa1rio.</p></body></html>")
+
+# Página grande: palavras-chave só no Art. 1º, seguido de ~4 MB de texto
+BIG_HTML = (
+    "<html><body><p>Art. 1º Reserva de vagas e cotas para pessoa com autismo.</p>"
+    + "".join(f"<p>Art. {n}. " + "Disposição geral sem termos relevantes. " * 2000 + "</p>"
+              for n in range(2, 52))
+    + "</body></html>"
+).encode("utf-8")
+LATIN1_HTML = "<html><body><p>Art. 2º Garantida a acessibilidade à pessoa com deficiência.</p></body></html>"
+
+
+@pytest.fixture
+def law_server(serve_http):
+    """Servidor local com ETag; registra os GETs recebidos."""
+    from http.server import BaseHTTPRequestHandler
+
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests.append((self.path, self.headers.get("If-None-Match")))
+            if self.headers.get("If-None-Match") == '"lei-v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            body, charset = LEI_HTML, "utf-8"
+            if self.path == "/grande":
+                body = BIG_HTML
+            elif self.path == "/latin1":
+                body, charset = LATIN1_HTML.encode("iso-8859-1"), "iso-8859-1"
+            self.send_response(200)
+            self.send_header("ETag", '"lei-v1"')
+            self.send_header("Content-Type", f"text/html; charset={charset}")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            for i in range(0, len(body), 16384):
+                self.wfile.write(body[i:i + 16384])
+
+    # Parada antecipada fecha a conexão no meio do corpo (reset ignorado)
+    return serve_http(Handler), requests
+
+
+@pytest.fixture
+def offline_policy(monkeypatch):
+    monkeypatch.setattr(vls, "FETCH_DELAY", 0)
+    monkeypatch.setattr(vls.LegalSourceValidator, "is_official_source", lambda self, url: True)
+
+
+def _validator(corpus, urls):
+    data = {"categorias": [
+        {"id": f"cat{i}", "base_legal": [{"lei": "Lei 13.146/2015", "link": url}]}
+        for i, url in enumerate(urls)
+    ]}
+    return vls.LegalSourceValidator(data=data, corpus=corpus)
+
+
+class TestLegalCorpus:
+    def test_store_is_content_addressed(self, tmp_path):
+        corpus = lc.LegalCorpus(tmp_path)
+        a = corpus.store("https://a.gov.br/lei", "texto", etag='"x"')
+        b = corpus.store("https://b.gov.br/lei", "texto")
+        assert a["sha256"] == b["sha256"] == lc.text_hash("texto")
+        assert len(list((tmp_path / "texts").iterdir())) == 1
+        corpus.save()
+
+        reloaded = lc.LegalCorpus(tmp_path)
+        assert reloaded.text("https://a.gov.br/lei") == "texto"
+        assert reloaded.conditional_headers("https://a.gov.br/lei") == {"If-None-Match": '"x"'}
+        assert reloaded.get("https://a.gov.br/lei")["fetched_at"]
+
+    def test_replaced_text_drops_orphan_blob(self, tmp_path):
+        corpus = lc.LegalCorpus(tmp_path)
+        old = corpus.store("https://a.gov.br/lei", "v1")["sha256"]
+        corpus.store("https://a.gov.br/lei", "v2")
+        assert not (tmp_path / "texts" / f"{old}.txt").exists()
+
+    def test_corrupted_blob_is_a_miss(self, tmp_path):
+        corpus = lc.LegalCorpus(tmp_path)
+        sha = corpus.store("https://a.gov.br/lei", "original")["sha256"]
+        (tmp_path / "texts" / f"{sha}.txt").write_text("adulterado", encoding="utf-8")
+        assert corpus.text("https://a.gov.br/lei") is None
+        assert corpus.fresh_text("https://a.gov.br/lei") is None
+
+    def test_ttl(self, tmp_path):
+        corpus = lc.LegalCorpus(tmp_path, ttl_days=7)
+        corpus.store("https://a.gov.br/lei", "texto")
+        assert corpus.fresh_text("https://a.gov.br/lei") == "texto"
+        corpus.entries["https://a.gov.br/lei"]["checked_at"] = "2020-01-01T00:00:00+00:00"
+        assert corpus.fresh_text("https://a.gov.br/lei") is None
+        assert lc.LegalCorpus(tmp_path, ttl_days=0).fresh_text("https://a.gov.br/lei") is None
+
+
+class TestFetchDedupe:
+    def test_same_law_is_fetched_once_per_run(self, law_server, offline_policy, tmp_path, capsys):
+        base, requests = law_server
+        corpus = lc.LegalCorpus(tmp_path)
+        validator = _validator(corpus, [f"{base}/lbi"] * 5 + [f"{base}/loas"])
+        validator.run()
+        assert sorted(path for path, _ in requests) == ["/lbi", "/loas"]
+        assert "pessoa com deficiência" in corpus.text(f"{base}/lbi")
+
+    def test_next_run_within_ttl_uses_no_network(self, law_server, offline_policy, tmp_path, capsys):
+        base, requests = law_server
+        _validator(lc.LegalCorpus(tmp_path), [f"{base}/lbi"]).run()
+        validator = _validator(lc.LegalCorpus(tmp_path), [f"{base}/lbi"])
+        validator.run()
+        assert len(requests) == 1
+        assert validator.corpus.stats["fresh"] == 1
+
+    def test_expired_entry_is_revalidated_with_304(self, law_server, offline_policy, tmp_path, capsys):
+        base, requests = law_server
+        _validator(lc.LegalCorpus(tmp_path), [f"{base}/lbi"]).run()
+
+        corpus = lc.LegalCorpus(tmp_path, ttl_days=0)
+        validator = _validator(corpus, [f"{base}/lbi"])
+        content = validator.fetch_law_content(f"{base}/lbi")
+        assert requests[-1] == ("/lbi", '"lei-v1"')
+        assert "atendimento prioritário" in content
+        assert corpus.stats == {"fresh": 0, "not_modified": 1, "stored": 0}
+
+    def test_without_cache_still_dedupes_in_run(self, law_server, offline_policy, capsys):
+        base, requests = law_server
+        validator = vls.LegalSourceValidator(data={"categorias": []}, use_cache=False)
+        assert validator.corpus is None
+        for _ in range(3):
+            assert validator.fetch_law_content(f"{base}/lbi")
+        assert len(requests) == 1
+
+
+class TestStreamingFetch:
+    def test_peak_memory_is_bounded_by_the_chunk(self, law_server, offline_policy, tmp_path,
+                                                 monkeypatch, capsys):
+        base, _ = law_server
+        monkeypatch.setattr(vls, "READ_CHUNK", 16 * 1024)
+        validator = vls.LegalSourceValidator(data={"categorias": []}, corpus=lc.LegalCorpus(tmp_path))
+        tracemalloc.start()
+        try:
+            law = validator.fetch_law(f"{base}/grande")
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert law["text"] is None and law["chars"] > 4_000_000
+        assert peak < len(BIG_HTML) // 8
+        assert law["index"].articles()[:2] == ["1", "2"] and len(law["index"].articles()) == 51
+        assert validator.corpus.get(f"{base}/grande")["chars"] == law["chars"]
+        assert not list((tmp_path / "texts").glob("*.part"))
+        assert validator.articles_near_keywords(law["index"], law["hits"]) == ["Art. 1º"]
+
+    def test_streamed_text_matches_whole_document_parse(self, law_server, offline_policy, tmp_path, capsys):
+        base, _ = law_server
+        validator = vls.LegalSourceValidator(data={"categorias": []}, corpus=lc.LegalCorpus(tmp_path))
+        streamed = validator.fetch_law_content(f"{base}/grande")
+        parser = vls.LawTextParser()
+        parser.feed(BIG_HTML.decode("utf-8"))
+        parser.close()
+        assert lc.text_hash(streamed) == lc.text_hash(parser.get_text())  # sem diff de 4 MB
+        assert parser.index().spans == validator.fetch_law(f"{base}/grande")["index"].spans
+
+    def test_charset_from_content_type(self, law_server, offline_policy, capsys):
+        base, _ = law_server
+        validator = vls.LegalSourceValidator(data={"categorias": []}, use_cache=False)
+        assert "pessoa com deficiência" in validator.fetch_law_content(f"{base}/latin1")
+
+    def test_stop_early_marks_partial_text(self, law_server, offline_policy, tmp_path, capsys):
+        base, requests = law_server
+        url = f"{base}/grande"
+        validator = vls.LegalSourceValidator(data={"categorias": []}, corpus=lc.LegalCorpus(tmp_path),
+                                             stop_early=True)
+        validator.keywords = ["autismo", "cotas"]
+        law = validator.fetch_law(url)
+        assert law["partial"] and law["chars"] < len(BIG_HTML) // 4
+        assert validator.corpus.get(url)["partial"]
+        assert validator.law_index(url) is None  # índice parcial não confere artigos citados
+
+        # Quem precisa do texto completo não reaproveita o parcial
+        full = vls.LegalSourceValidator(data={"categorias": []}, corpus=lc.LegalCorpus(tmp_path))
+        law = full.fetch_law(url)
+        assert not law["partial"] and law["chars"] > 4_000_000
+        assert requests[-1] == ("/grande", None)
+        assert "partial" not in full.corpus.get(url)
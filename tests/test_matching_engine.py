@@ -8,12 +8,16 @@ críticas casam com as categorias esperadas.
 from __future__ import annotations
 
 import json
+import sys
 from pathlib import Path
 
 import pytest
 
 ROOT = Path(__file__).resolve().parent.parent
 DATA = ROOT / "data"
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from validate_content import index_keywords_by_category  # noqa: E402
 
 
 @pytest.fixture(scope="module")
@@ -148,12 +152,20 @@ class TestCategoriesCoverage:
     # Categorias que ainda não têm keywords dedicadas — tolerância temporária.
     ALLOWED_UNCOVERED: set[str] = set()
 
-    def test_all_categories_have_at_least_one_keyword(self, matching, categoria_slugs):
-        covered = set()
-        for entry in matching["keyword_map"].values():
-            covered.update(entry["cats"])
-        uncovered = categoria_slugs - covered - self.ALLOWED_UNCOVERED
+    @pytest.fixture(scope="class")
+    def index(self, matching):
+        return index_keywords_by_category(matching["keyword_map"])
+
+    def test_all_categories_have_at_least_one_keyword(self, index, categoria_slugs):
+        uncovered = categoria_slugs - index.keys() - self.ALLOWED_UNCOVERED
         assert not uncovered, (
             f"{len(uncovered)} categorias sem keyword no matching engine: "
             f"{sorted(uncovered)}"
         )
+
+    def test_index_matches_per_category_scan(self, matching, index):
+        keyword_map = matching["keyword_map"]
+        for cat_id, coverage in index.items():
+            expected = [k for k, c in keyword_map.items() if cat_id in c["cats"]]
+            assert coverage["keywords"] == expected
+            assert coverage["weight"] == sum(keyword_map[k]["weight"] for k in expected)
@@ -0,0 +1,178 @@
+"""Gate dos validadores de APIs oficiais (ICD/OMS) em validate_sources.
+
+Sem rede: `_make_request` é substituído por fakes. Cobre a extração de
+códigos CID, o cache do token OAuth, o índice local de CIDs e o cache de
+situação de normas do Senado.
+"""
+from __future__ import annotations
+
+import json
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import validate_sources as vs  # noqa: E402
+
+
+@pytest.fixture
+def fast_throttle(monkeypatch):
+    monkeypatch.setattr(vs, "RATE_LIMIT_DELAY", 0)
+
+
+@pytest.fixture
+def icd_credentials(monkeypatch):
+    monkeypatch.setenv("ICD_CLIENT_ID", "cliente")
+    monkeypatch.setenv("ICD_CLIENT_SECRET", "segredo")
+
+
+class TestCidExtraction:
+    def test_every_referenced_code_is_collected_once(self, direitos, dicionario):
+        codes = vs.collect_cid_codes(direitos, dicionario)
+        keys = [(c["version"], c["code"]) for c in codes]
+        assert len(keys) == len(set(keys))
+        for defi in dicionario["deficiencias"]:
+            for code in defi.get("cid10", []):
+                assert ("10", code) in keys
+            for code in defi.get("cid11", []):
+                assert ("11", code) in keys
+
+    def test_ranges_and_mixed_versions(self):
+        data = {
+            "classificacao_deficiencia": [
+                {"tipo": "Física", "cid10": "S78, S88, Z89, Q71-Q73", "cid11": "AB00 a AB0Z"},
+                {"tipo": "Múltipla", "cid10": "Combinação", "cid11": "Combinação"},
+            ],
+            "categorias": [{"id": "x", "cids_relacionados": ["A15-A19", "LD40.0", "F84.0"]}],
+        }
+        keys = [(c["version"], c["code"]) for c in vs.collect_cid_codes(data)]
+        assert keys == [
+            ("10", "S78"), ("10", "S88"), ("10", "Z89"), ("10", "Q71"), ("10", "Q73"),
+            ("11", "AB00"), ("11", "AB0Z"),
+            ("10", "A15"), ("10", "A19"), ("11", "LD40.0"), ("10", "F84.0"),
+        ]
+
+
+class TestIcdToken:
+    def test_token_is_cached_until_expiry(self, monkeypatch, tmp_path, icd_credentials):
+        calls = []
+
+        def fake_request(url, method="GET", headers=None, data=None, timeout=None):
+            calls.append(url)
+            return 200, json.dumps({"access_token": f"t{len(calls)}", "expires_in": 3600})
+
+        monkeypatch.setattr(vs, "_make_request", fake_request)
+        path = tmp_path / "icd_token.json"
+        assert vs._get_icd_token(path) == "t1"
+        assert vs._get_icd_token(path) == "t1"
+        assert len(calls) == 1
+        if os.name == "posix":
+            assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+        cached = json.loads(path.read_text())
+        cached["expires_at"] = 0
+        path.write_text(json.dumps(cached))
+        assert vs._get_icd_token(path) == "t2"
+
+    def test_other_client_does_not_reuse_token(self, monkeypatch, tmp_path, icd_credentials):
+        monkeypatch.setattr(vs, "_make_request", lambda *a, **kw: (200, '{"access_token": "novo"}'))
+        path = tmp_path / "icd_token.json"
+        path.write_text(json.dumps({"client": "outro", "access_token": "velho", "expires_at": 1e12}))
+        assert vs._get_icd_token(path) == "novo"
+
+
+class TestCidIndex:
+    DATA = {"classificacao_deficiencia": [{"tipo": "TEA", "cid10": "F84.0", "cid11": "6A02, 6Z99"}]}
+
+    def test_index_is_built_and_then_used_offline(self, monkeypatch, tmp_path, icd_credentials,
+                                                  fast_throttle):
+        lookups = []
+
+        def fake_request(url, method="GET", headers=None, data=None, timeout=None):
+            if url == vs.ICD_TOKEN_URL:
+                return 200, '{"access_token": "t"}'
+            lookups.append(url)
+            if url.endswith("6Z99"):
+                return 404, ""
+            return 200, json.dumps({"title": {"@value": "Autismo"}})
+
+        monkeypatch.setattr(vs, "_make_request", fake_request)
+        monkeypatch.setattr(vs, "ICD_TOKEN_FILE", tmp_path / "token.json")
+        saved = []
+        save_token = vs._save_icd_token
+        monkeypatch.setattr(vs, "_save_icd_token", lambda path, payload: (
+            saved.append(path), save_token(path, payload)))
+        index = vs.CidIndex(tmp_path / "cid_index.json")
+        report = vs.ValidationReport()
+        vs.validate_cid(report, self.DATA, index=index)
+        assert len(lookups) == 3
+        # Token de teste nunca vai para o cache real do desenvolvedor
+        assert saved == [tmp_path / "token.json"]
+        assert [r.status for r in report.results] == ["ok", "ok", "error"]
+        index.save()
+
+        # Segunda execução: sem credenciais e sem rede, tudo do índice local
+        monkeypatch.delenv("ICD_CLIENT_ID")
+        report = vs.ValidationReport()
+        vs.validate_cid(report, self.DATA, index=vs.CidIndex.load(tmp_path / "cid_index.json"))
+        assert len(lookups) == 3
+        assert [(r.status, r.from_cache) for r in report.results] == [
+            ("ok", True), ("ok", True), ("error", True)]
+
+    def test_expired_or_transient_entries_are_refetched(self, tmp_path):
+        index = vs.CidIndex(tmp_path / "cid_index.json")
+        index.record("10", "F84.0", 200, "Autismo")
+        index.record("10", "F70", 503)
+        assert index.fresh("10", "F84.0", 30)
+        assert index.fresh("10", "F84.0", 0) is None
+        assert index.fresh("10", "F70", 30) is None
+
+
+class TestNormStore:
+    DATA = {
+        "fontes": [
+            {"tipo": "legislacao", "nome": "Lei 13.146/2015 — LBI"},
+            {"tipo": "legislacao", "nome": "Lei 8.742/1993 — LOAS"},
+            {"tipo": "legislacao", "nome": "Portaria sem número"},
+        ],
+        "categorias": [{"id": "bpc", "base_legal": [{"lei": "Lei 8.742/1993 (LOAS)"},
+                                                    {"lei": "Decreto 6.214/2007"}]}],
+    }
+    DICIONARIO = {"leis": [{"tipo": "lei_federal", "numero": "Lei 13.146/2015"}]}
+
+    def _fake_senado(self, calls):
+        def fake_request(url, method="GET", headers=None, data=None, timeout=None):
+            calls.append(url)
+            situacao = "Revogada" if "/DEC/" in url else "Em vigor"
+            body = {"DetalheNormaJuridica": {"Norma": {
+                "SituacaoNorma": {"DescricaoSituacao": situacao}, "EmentaNorma": "Ementa"}}}
+            return 200, json.dumps(body)
+        return fake_request
+
+    def test_refs_are_deduplicated_across_sections(self):
+        refs = vs.collect_norm_refs(self.DATA, self.DICIONARIO)
+        assert [r["key"] for r in refs] == [
+            "LEI/13146/2015", "LEI/8742/1993", None, "DEC/6214/2007"]
+
+    def test_only_expired_entries_hit_the_api(self, monkeypatch, tmp_path, fast_throttle):
+        calls = []
+        monkeypatch.setattr(vs, "_make_request", self._fake_senado(calls))
+        store = vs.NormStore(tmp_path / "norm_cache.json")
+        report = vs.ValidationReport()
+        vs.validate_legislacao(report, self.DATA, self.DICIONARIO, store=store)
+        assert len(calls) == 3
+        assert [r.status for r in report.results] == ["ok", "ok", "warning", "error"]
+        store.save()
+
+        store = vs.NormStore.load(tmp_path / "norm_cache.json")
+        store.entries["LEI/8742/1993"]["fetched_at"] = "2000-01-01"
+        report = vs.ValidationReport()
+        vs.validate_legislacao(report, self.DATA, self.DICIONARIO, store=store)
+        assert calls[3:] == [f"{vs.SENADO_API}/legislacao/LEI/8742/1993.json"]
+        assert [r.from_cache for r in report.results] == [True, False, False, True]
+        assert [r.status for r in report.results] == ["ok", "ok", "warning", "error"]
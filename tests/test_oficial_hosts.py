@@ -0,0 +1,121 @@
+"""Gate do matcher único da allowlist (scripts/oficial_hosts.py).
+
+A trie de sufixos precisa reproduzir a semântica das regex antigas do G1
+e dar a mesma resposta às três classificações que a consomem (G1,
+_is_oficial_br e classify_layer).
+"""
+from __future__ import annotations
+
+import json
+import re
+import sys
+from pathlib import Path
+from urllib.parse import urlparse
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import oficial_hosts  # noqa: E402
+from validate_legal_compliance import classify_layer  # noqa: E402
+from validate_sources import _is_oficial_br  # noqa: E402
+
+
+def _regex_allowlist(dominios):
+    """Compilação antiga do G1: uma regex por padrão (referência)."""
+    patterns = []
+    for entry in dominios:
+        padrao = entry["padrao"].strip().lower()
+        if padrao.startswith("*."):
+            patterns.append(re.compile(rf"^([a-z0-9-]+\.)*{re.escape(padrao[2:])}$"))
+        else:
+            patterns.append(re.compile(rf"^{re.escape(padrao)}$"))
+    return patterns
+
+
+UFS = {"ac", "al", "ap", "am", "ba", "ce", "df", "es", "go", "ma", "mt", "ms", "mg", "pa",
+       "pb", "pr", "pe", "pi", "rj", "rn", "rs", "ro", "rr", "sc", "sp", "se", "to"}
+
+
+def _legacy_classify_layer(url, orgao, tipo, nome):
+    """classify_layer anterior ao matcher (sufixos escritos à mão; referência)."""
+    host = (urlparse(url).hostname or "").lower()
+    orgao, tipo, nome = (" ".join((v or "").lower().split()) for v in (orgao, tipo, nome))
+    if host.endswith("who.int") or "oms" in nome:
+        return "internacional"
+    if any(host.endswith(f".{uf}.gov.br") for uf in UFS):
+        return "estadual_municipal"
+    if any(t in orgao for t in ["prefeitura", "governo do estado", "detran", "sefaz", "secretaria de estado"]):
+        return "estadual_municipal"
+    if tipo == "legislacao" and ("planalto.gov.br" in host or "presidência da república" in orgao):
+        return "federal"
+    return "governamental"
+
+
+@pytest.fixture(scope="module")
+def dominios():
+    with open(oficial_hosts.ALLOWLIST_JSON, encoding="utf-8") as f:
+        return json.load(f)["dominios"]
+
+
+class TestTrie:
+    def test_equivalent_to_regex_allowlist(self, dominios):
+        text = (ROOT / "data" / "direitos.json").read_text(encoding="utf-8")
+        hosts = {(urlparse(u).hostname or "").lower() for u in re.findall(r'https?://[^"\s]+', text)}
+        hosts |= {"gov.br", "evilgov.br", "gov.br.evil.com", "a_b.gov.br", "in.gov.br",
+                  "x.www.in.gov.br", "who.int", "apps.who.int", "", "sp.gov.br"}
+        patterns = _regex_allowlist(dominios)
+        matcher = oficial_hosts.OficialHosts(dominios)
+        for host in hosts:
+            expected = any(p.match(host) for p in patterns)
+            assert (matcher.match(host) is not None) is expected, host
+
+    @pytest.mark.parametrize("host, padrao, categoria", [
+        ("www.planalto.gov.br", "*.planalto.gov.br", "legislacao-federal"),
+        ("www.in.gov.br", "www.in.gov.br", "diario-oficial"),
+        ("portal.in.gov.br", "*.gov.br", "executivo-federal-estadual-municipal"),
+        ("bvsms.saude.gov.br", "bvsms.saude.gov.br", "saude-normativa"),
+        ("icd.who.int", "icd.who.int", "saude-internacional"),
+    ])
+    def test_most_specific_entry_wins(self, host, padrao, categoria):
+        assert oficial_hosts.default().match(host) == oficial_hosts.Dominio(padrao, categoria)
+
+    def test_matches_are_ordered_broadest_first(self):
+        found = oficial_hosts.default().matches("www4.planalto.gov.br")
+        assert [d.padrao for d in found] == ["*.gov.br", "*.planalto.gov.br"]
+
+
+class TestCallSites:
+    @pytest.mark.parametrize("url, oficial", [
+        ("https://www.planalto.gov.br/ccivil_03/leis/l8742.htm", True),
+        ("https://www.stj.jus.br/", True),
+        ("https://site.mil.br/", False),
+        ("https://icd.who.int/browse", False),
+    ])
+    def test_is_oficial_br_follows_allowlist_categories(self, url, oficial):
+        assert _is_oficial_br(url) is oficial
+
+    @pytest.mark.parametrize("url, tipo, nome, layer", [
+        ("https://icd.who.int/browse11", "", "", "internacional"),
+        ("https://www.planalto.gov.br/ccivil_03/leis/l13146.htm", "legislacao", "", "federal"),
+        ("https://www.fazenda.sp.gov.br/", "", "", "estadual_municipal"),
+        ("https://www.gov.br/inss", "servico", "", "governamental"),
+        ("https://www.stf.jus.br/", "jurisprudencia", "", "governamental"),
+    ])
+    def test_classify_layer_uses_the_same_matcher(self, url, tipo, nome, layer):
+        assert classify_layer(url, "", tipo, nome) == layer
+
+    def test_every_uf_is_in_the_allowlist(self):
+        for uf in UFS:
+            assert classify_layer(f"https://portal.{uf}.gov.br/", "", "", "") == "estadual_municipal"
+        assert classify_layer("https://prefeitura.rio.rj.gov.br/", "", "", "") == "estadual_municipal"
+
+    def test_same_layers_as_legacy_rules_on_the_dataset(self):
+        data = json.loads((ROOT / "data" / "direitos.json").read_text(encoding="utf-8"))
+        fontes = [(f.get("url", ""), f.get("orgao", ""), f.get("tipo", ""), f.get("nome", ""))
+                  for f in data["fontes"]]
+        fontes += [(link, "", "", "") for cat in data["categorias"]
+                   for link in re.findall(r'https?://[^"\s]+', json.dumps(cat))]
+        for fonte in fontes:
+            assert classify_layer(*fonte) == _legacy_classify_layer(*fonte), fonte
@@ -0,0 +1,33 @@
+"""Gate do round-robin compartilhado pelos checadores de rede.
+
+validate_sources intercala por host e validate_legal_compliance por camada
+com a mesma função; aqui fica o contrato comum (grupos na ordem da
+primeira ocorrência, ordem estável dentro do grupo, nenhum item perdido).
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from round_robin import interleave  # noqa: E402
+
+
+def test_groups_alternate_in_first_seen_order():
+    items = ["a1", "a2", "a3", "b1", "c1", "b2"]
+    assert interleave(items, key=lambda item: item[0]) == ["a1", "b1", "c1", "a2", "b2", "a3"]
+
+
+def test_single_group_and_empty_input_keep_their_order():
+    assert interleave(["x1", "x2", "x3"], key=lambda item: "x") == ["x1", "x2", "x3"]
+    assert interleave([], key=lambda item: item) == []
+
+
+def test_layer_tuples_are_interleaved_by_layer():
+    sources = [(f"https://fed/{i}", {}, "federal") for i in range(3)] + [
+        ("https://gov/1", {}, "governamental"), ("https://est/1", {}, "estadual_municipal")]
+    ordered = interleave(sources, key=lambda source: source[2])
+    assert [layer for _, _, layer in ordered[:3]] == ["federal", "governamental", "estadual_municipal"]
+    assert sorted(ordered) == sorted(sources)
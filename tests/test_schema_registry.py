@@ -0,0 +1,60 @@
+"""Gate dos schemas de todos os arquivos de data/ (validate_schema).
+
+Cada arquivo deve estar conforme ao seu schema; o registry compila cada
+schema uma vez por hash e o cache de resultados pula arquivos inalterados.
+"""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import validate_schema as vsch  # noqa: E402
+
+pytestmark = pytest.mark.skipif(not vsch.HAS_JSONSCHEMA, reason="jsonschema não instalado")
+
+
+class TestDataFiles:
+    @pytest.mark.parametrize("label, data_name, section, schema_name", vsch.DATA_SCHEMAS,
+                             ids=[entry[0] for entry in vsch.DATA_SCHEMAS])
+    def test_file_conforms_to_its_schema(self, label, data_name, section, schema_name):
+        validator, _ = vsch.REGISTRY.get(ROOT / "schemas" / schema_name)
+        with open(ROOT / "data" / data_name, encoding="utf-8") as f:
+            document = json.load(f)
+        if section is not None:
+            document = document[section]
+        errors = [f"{list(e.path)}: {e.message}" for e in validator.iter_errors(document)]
+        assert not errors, errors[:5]
+
+    def test_unchanged_files_are_skipped(self, tmp_path, capsys):
+        cache = tmp_path / "results.json"
+        assert vsch.validate_data_files(ROOT, cache_path=cache)
+        assert "inalterado" not in capsys.readouterr().out
+        assert vsch.validate_data_files(ROOT, cache_path=cache)
+        out = capsys.readouterr().out
+        assert out.count("inalterado") == len(vsch.DATA_SCHEMAS)
+
+    def test_failures_are_reported_and_not_cached(self, tmp_path, capsys):
+        cache = tmp_path / "results.json"
+        broken = {"fontes_oficiais.json": {"dominios": "não é lista"}}
+        assert not vsch.validate_data_files(ROOT, datasets=broken, cache_path=cache)
+        assert "fontes_oficiais.json" not in json.loads(cache.read_text())
+
+
+class TestRegistry:
+    def test_schema_is_compiled_once_per_hash(self, tmp_path):
+        registry = vsch.SchemaRegistry()
+        schema = tmp_path / "x.schema.json"
+        schema.write_text('{"type": "object"}')
+        first, key = registry.get(schema)
+        assert registry.get(schema)[0] is first
+
+        schema.write_text('{"type": "array"}')
+        second, new_key = registry.get(schema)
+        assert second is not first and new_key != key
+        assert not second.is_valid({})
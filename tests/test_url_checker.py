@@ -0,0 +1,405 @@
+"""Gate do motor concorrente de checagem de URLs (validate_sources.validate_urls).
+
+Garante que a paralelização não altera a semântica da checagem sequencial:
+ordem determinística no relatório, classificação via `classify_url_result`
+e teto de requests simultâneos por host.
+"""
+from __future__ import annotations
+
+import io
+import json
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import validate_sources as vs  # noqa: E402
+
+
+def _dataset(urls: list[str]) -> dict:
+    return {"fontes": [{"nome": f"fonte-{i}", "url": u} for i, u in enumerate(urls)]}
+
+
+@pytest.fixture
+def fast_throttle(monkeypatch):
+    monkeypatch.setattr(vs, "RATE_LIMIT_DELAY", 0)
+
+
+class TestValidateUrlsConcurrent:
+    def test_report_keeps_extraction_order(self, monkeypatch, fast_throttle):
+        urls = [f"https://h{i % 3}.gov.br/p{i}" for i in range(12)]
+
+        def fake_head(url, *a, **kw):
+            time.sleep(0.001 * (12 - int(url.rsplit("p", 1)[1])))
+            return vs.HttpResult(200)
+
+        monkeypatch.setattr(vs, "_http_head", fake_head)
+        report = vs.ValidationReport()
+        vs.validate_urls(report, _dataset(urls), workers=8)
+        assert [r.url for r in report.results] == urls
+
+    def test_classification_is_unchanged(self, monkeypatch, fast_throttle):
+        codes = {
+            "https://a.gov.br/404": (404, ""),
+            "https://www.stj.jus.br/": (403, ""),
+            "https://secdef.al.gov.br/": (0, "timed out"),
+            "https://example.com/": (0, "timed out"),
+            "https://b.gov.br/ok": (200, ""),
+        }
+        monkeypatch.setattr(vs, "_http_head", lambda url, *a, **kw: vs.HttpResult(*codes[url]))
+        report = vs.ValidationReport()
+        vs.validate_urls(report, _dataset(list(codes)), workers=4)
+        for r in report.results:
+            assert (r.status, r.message, r.ci_blocked) == vs.classify_url_result(r.url, *codes[r.url])
+
+    def test_per_host_limit_is_respected(self, monkeypatch, fast_throttle):
+        monkeypatch.setattr(vs, "PER_HOST_LIMIT", 2)
+        active: dict[str, int] = defaultdict(int)
+        peak: dict[str, int] = defaultdict(int)
+        lock = threading.Lock()
+
+        def fake_head(url, *a, **kw):
+            host = vs._url_host(url)
+            with lock:
+                active[host] += 1
+                peak[host] = max(peak[host], active[host])
+            time.sleep(0.01)
+            with lock:
+                active[host] -= 1
+            return vs.HttpResult(200)
+
+        monkeypatch.setattr(vs, "_http_head", fake_head)
+        urls = [f"https://www.planalto.gov.br/l{i}" for i in range(10)]
+        urls += [f"https://x{i}.sp.gov.br/" for i in range(6)]
+        vs.validate_urls(vs.ValidationReport(), _dataset(urls), workers=16)
+        assert peak["www.planalto.gov.br"] <= 2
+
+
+def test_interleave_by_host_round_robin():
+    items = [{"url": u} for u in (
+        "https://a.gov.br/1", "https://a.gov.br/2", "https://a.gov.br/3",
+        "https://b.gov.br/1", "https://c.gov.br/1",
+    )]
+    ordered = [i["url"] for i in vs.interleave(items, key=lambda i: vs._url_host(i["url"]))]
+    assert ordered[:3] == ["https://a.gov.br/1", "https://b.gov.br/1", "https://c.gov.br/1"]
+    assert sorted(ordered) == sorted(i["url"] for i in items)
+
+
+# ─── Pool HTTP (keep-alive) ─────────────────────────────────────────
+@pytest.fixture
+def local_server(serve_http):
+    """Servidor HTTP/1.1 local com keep-alive para exercitar o pool."""
+    from http.server import BaseHTTPRequestHandler
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _reply(self, code, body=b"", headers=None):
+            self.send_response(code)
+            for k, v in (headers or {}).items():
+                self.send_header(k, v)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if self.command != "HEAD":
+                self.wfile.write(body)
+
+        def do_HEAD(self):
+            if self.path in ("/no-head", "/big"):
+                return self._reply(405)
+            self.do_GET()
+
+        def do_GET(self):
+            if self.path == "/etag":
+                if self.headers.get("If-None-Match") == '"v1"':
+                    return self._reply(304)
+                return self._reply(200, b"versao 1", headers={"ETag": '"v1"'})
+            if self.path == "/big":
+                return self._reply(200, b"x" * (1024 * 1024))
+            if self.path == "/redirect":
+                return self._reply(301, headers={"Location": "/ok"})
+            if self.path == "/missing":
+                return self._reply(404, b"not found")
+            self._reply(200, b"<html>ok</html>")
+
+    # O probe "status-only" fecha a conexão no meio do corpo (reset ignorado)
+    return serve_http(Handler)
+
+
+@pytest.fixture
+def fresh_pool(monkeypatch):
+    pool = vs.HTTPPool()
+    monkeypatch.setattr(vs, "_POOL", pool)
+    yield pool
+    pool.close_all()
+
+
+class TestHTTPPool:
+    def test_connections_are_reused_per_host(self, local_server, fresh_pool):
+        for _ in range(3):
+            assert vs._make_request(f"{local_server}/ok") == (200, "<html>ok</html>")
+        assert fresh_pool.stats()["misses"] == 1
+        assert fresh_pool.stats()["hits"] == 2
+
+    def test_head_connections_are_reused(self, local_server, fresh_pool):
+        for _ in range(3):
+            assert vs._http_head(f"{local_server}/ok").status == 200
+        assert fresh_pool.stats()["misses"] == 1
+        assert fresh_pool.stats()["hits"] == 2
+
+    def test_head_to_get_fallback_through_pool(self, local_server, fresh_pool):
+        assert vs._http_head(f"{local_server}/no-head").status == 200
+
+    def test_get_fallback_reads_only_a_prefix(self, local_server, fresh_pool):
+        result = vs._http_head(f"{local_server}/big")
+        assert result.status == 200
+        assert fresh_pool.stats()["bytes_in"] <= vs.STATUS_PROBE_BYTES
+
+    def test_full_body_mode_still_available(self, local_server, fresh_pool):
+        status, body = vs._make_request(f"{local_server}/big")
+        assert status == 200 and len(body) == 1024 * 1024
+
+    def test_redirect_is_followed(self, local_server, fresh_pool):
+        assert vs._http_head(f"{local_server}/redirect").status == 200
+
+    def test_http_error_keeps_urllib_contract(self, local_server, fresh_pool):
+        assert vs._make_request(f"{local_server}/missing") == (404, "")
+        # conexão continua reaproveitável após o erro (corpo drenado)
+        vs._make_request(f"{local_server}/ok")
+        assert fresh_pool.stats()["hits"] >= 1
+
+    def test_connection_failure_is_status_zero(self, fresh_pool):
+        status, err = vs._make_request("http://127.0.0.1:9/", timeout=2)
+        assert status == 0 and err
+
+
+# ─── Cache condicional (ETag / Last-Modified) ──────────────────────
+class TestUrlCache:
+    def test_second_check_is_conditional_304(self, local_server, fresh_pool, tmp_path):
+        cache = vs.UrlCache(tmp_path / "url_cache.json")
+        throttle = vs.HostThrottle(delay=0)
+        url = f"{local_server}/etag"
+
+        assert vs._check_url(url, throttle, cache).status == 200
+        assert cache.get(url)["etag"] == '"v1"'
+
+        second = vs._check_url(url, throttle, cache)
+        assert second.status == 304
+        assert vs.classify_url_result(url, second.status)[0] == "ok"
+        assert cache.get(url)["etag"] == '"v1"'  # validador preservado no 304
+        assert cache.stats()["not_modified"] == 1
+
+    def test_roundtrip_and_ttl(self, tmp_path):
+        path = tmp_path / "url_cache.json"
+        cache = vs.UrlCache(path)
+        cache.record("https://a.gov.br/", vs.HttpResult(200, headers={"etag": "x"}))
+        cache.record("https://b.gov.br/", vs.HttpResult(0, "timed out"))
+        cache.save()
+
+        loaded = vs.UrlCache.load(path)
+        assert loaded.fresh("https://a.gov.br/", ttl_hours=1) is not None
+        assert loaded.fresh("https://a.gov.br/", ttl_hours=0) is None
+        # falhas nunca são reaproveitadas e não guardam validadores
+        assert loaded.fresh("https://b.gov.br/", ttl_hours=1) is None
+        assert loaded.conditional_headers("https://b.gov.br/") == {}
+
+    def test_ttl_skips_network_and_keeps_dates_untouched(self, monkeypatch, tmp_path, fast_throttle):
+        cache = vs.UrlCache(tmp_path / "c.json")
+        cache.record("https://a.gov.br/", vs.HttpResult(200))
+        calls = []
+        monkeypatch.setattr(vs, "_http_head", lambda url, *a, **kw: calls.append(url) or vs.HttpResult(200))
+
+        data = _dataset(["https://a.gov.br/", "https://b.gov.br/"])
+        report = vs.ValidationReport()
+        vs.validate_urls(report, data, cache=cache, cache_ttl_hours=24)
+        assert calls == ["https://b.gov.br/"]
+        assert [r.from_cache for r in report.results] == [True, False]
+
+        vs.update_consultation_dates(data, report)
+        assert "consultado_em" not in data["fontes"][0]
+
+
+# ─── Circuit breaker + timeout adaptativo ──────────────────────────
+class TestHostHealth:
+    def test_dead_host_is_short_circuited_to_ci_blocked(self, monkeypatch, fast_throttle):
+        calls = defaultdict(int)
+
+        def fake_head(url, *a, **kw):
+            host = vs._url_host(url)
+            calls[host] += 1
+            if host == "secdef.al.gov.br":
+                return vs.HttpResult(0, "timed out")
+            return vs.HttpResult(200)
+
+        monkeypatch.setattr(vs, "_http_head", fake_head)
+        urls = [f"https://secdef.al.gov.br/p{i}" for i in range(6)] + ["https://ok.gov.br/"]
+        report = vs.ValidationReport()
+        vs.validate_urls(report, _dataset(urls), workers=1, breaker_threshold=2)
+
+        assert calls["secdef.al.gov.br"] == 2
+        dead = [r for r in report.results if "secdef" in r.url]
+        assert all(r.status == "warning" and r.ci_blocked for r in dead)
+        assert report.stats["host_health"]["open_hosts"] == ["secdef.al.gov.br"]
+        assert report.stats["host_health"]["short_circuited"] == 4
+
+    def test_success_resets_consecutive_failures(self):
+        health = vs.HostHealth(threshold=2)
+        health.record("a.gov.br", vs.HttpResult(0, "timed out"), 15)
+        health.record("a.gov.br", vs.HttpResult(200), 0.2)
+        health.record("a.gov.br", vs.HttpResult(0, "timed out"), 15)
+        assert not health.is_open("a.gov.br")
+
+    def test_threshold_zero_disables_breaker(self):
+        health = vs.HostHealth(threshold=0)
+        for _ in range(5):
+            health.record("a.gov.br", vs.HttpResult(0, "timed out"), 15)
+        assert not health.is_open("a.gov.br")
+
+    def test_timeout_adapts_to_observed_latency(self):
+        health = vs.HostHealth(base_timeout=15)
+        assert health.timeout_for("fast.gov.br") == 15  # sem amostras
+        for latency in (0.1, 0.2, 0.3):
+            health.record("fast.gov.br", vs.HttpResult(200), latency)
+        assert health.timeout_for("fast.gov.br") == vs.ADAPTIVE_TIMEOUT_MIN
+        for latency in (5, 6, 7):
+            health.record("slow.gov.br", vs.HttpResult(200), latency)
+        assert health.timeout_for("slow.gov.br") == 15
+
+    def test_retries_stop_once_circuit_opens(self, monkeypatch):
+        monkeypatch.setattr(vs, "RETRY_BACKOFF", 0)
+        attempts = []
+
+        def failing_urlopen(req, timeout=None, insecure=False):
+            attempts.append(req.get_method())
+            raise TimeoutError("timed out")
+
+        monkeypatch.setattr(vs._POOL, "urlopen", failing_urlopen)
+        result = vs._http_head("https://dead.gov.br/", should_abort=lambda: True)
+        assert result.status == 0
+        assert attempts == ["HEAD"]  # sem retries nem fallback GET
+
+
+class TestIncremental:
+    URLS = [f"https://h{i % 2}.gov.br/p{i}" for i in range(6)]
+
+    def _run(self, monkeypatch, data, manifest, rotate=None, codes=None):
+        checked = []
+
+        def fake_head(url, *a, **kw):
+            checked.append(url)
+            return vs.HttpResult((codes or {}).get(url, 200))
+
+        monkeypatch.setattr(vs, "_http_head", fake_head)
+        report = vs.ValidationReport()
+        vs.validate_urls(report, data, workers=2, manifest=manifest, rotate=rotate)
+        return sorted(checked), report
+
+    def test_only_new_changed_and_failing_are_checked(self, monkeypatch, tmp_path, fast_throttle):
+        path = tmp_path / "manifest.json"
+        manifest = vs.UrlManifest.load(path)
+        data = _dataset(self.URLS)
+        checked, _ = self._run(monkeypatch, data, manifest, codes={self.URLS[1]: 404})
+        assert checked == sorted(self.URLS)
+        manifest.save()
+
+        data["fontes"][2]["nome"] = "renomeada"
+        data["fontes"].append({"nome": "nova", "url": "https://h9.gov.br/nova"})
+        checked, report = self._run(monkeypatch, data, vs.UrlManifest.load(path), rotate=0)
+        assert checked == sorted([self.URLS[1], self.URLS[2], "https://h9.gov.br/nova"])
+        assert [r.url for r in report.results] == [self.URLS[1], self.URLS[2], "https://h9.gov.br/nova"]
+        assert report.stats["incremental"]["unchanged"] == 4
+
+    def test_rotation_covers_everything_within_window(self, monkeypatch, tmp_path, fast_throttle):
+        manifest = vs.UrlManifest(tmp_path / "m.json", window_days=3)
+        data = _dataset(self.URLS)
+        self._run(monkeypatch, data, manifest)
+        for i, url in enumerate(self.URLS):  # datas distintas → ordem de rotação estável
+            manifest.entries[url]["checked_at"] = f"2026-01-0{i + 1}"
+
+        seen = set()
+        for run in range(3):
+            checked, _ = self._run(monkeypatch, data, manifest)
+            assert len(checked) == 2
+            seen.update(checked)
+            for url in checked:
+                manifest.entries[url]["checked_at"] = f"2026-02-0{run + 1}"
+        assert seen == set(self.URLS)
+
+    def test_removed_urls_are_pruned(self, monkeypatch, tmp_path, fast_throttle):
+        manifest = vs.UrlManifest(tmp_path / "m.json")
+        self._run(monkeypatch, _dataset(self.URLS), manifest)
+        _, report = self._run(monkeypatch, _dataset(self.URLS[:4]), manifest, rotate=0)
+        assert set(manifest.entries) == set(self.URLS[:4])
+        assert report.stats["incremental"]["pruned"] == 2
+
+    def test_quick_sample_does_not_prune_unsampled_urls(self, monkeypatch, tmp_path, fast_throttle):
+        manifest = vs.UrlManifest(tmp_path / "m.json")
+        data = _dataset(self.URLS * 2 + [f"https://h3.gov.br/q{i}" for i in range(6)])
+        self._run(monkeypatch, data, manifest)
+        known = set(manifest.entries)
+        monkeypatch.setattr(vs, "_http_head", lambda url, *a, **kw: vs.HttpResult(200))
+        report = vs.ValidationReport()
+        vs.validate_urls(report, data, quick=True, workers=2, manifest=manifest, rotate=0)
+        assert set(manifest.entries) == known
+        assert report.stats["incremental"]["pruned"] == 0
+
+
+class TestShard:
+    def test_partition_is_complete_disjoint_and_per_host(self):
+        items = [{"url": f"https://h{i % 7}.gov.br/p{i}"} for i in range(40)]
+        parts = [vs.filter_shard(items, (i, 3)) for i in (1, 2, 3)]
+        assert sorted(u["url"] for p in parts for u in p) == sorted(u["url"] for u in items)
+        for part in parts:
+            other = [u for p in parts if p is not part for u in p]
+            assert not {vs._url_host(u["url"]) for u in part} & {vs._url_host(u["url"]) for u in other}
+
+    @pytest.mark.parametrize("spec", ["0/3", "4/3", "1/0", "a/b", "3"])
+    def test_invalid_spec(self, spec):
+        with pytest.raises(ValueError):
+            vs.parse_shard(spec)
+
+    def test_merge_dedupes_and_requires_every_shard(self):
+        import merge_freshness_reports as merge
+
+        def shard(i, urls):
+            return {"shard": {"index": i, "total": 3},
+                    "results": [{"source": "url", "url": u, "status": "ok"} for u in urls]}
+
+        leg = {"results": [{"source": "legislacao", "item": "Lei 1", "url": "https://a/", "status": "ok"}]}
+        combined = merge.merge([shard(1, ["https://a/"]), shard(2, ["https://b/", "https://a/"]), leg])
+        assert combined["total"] == 3
+        assert combined["missing_shards"] == [3]
+        assert "missing_shards" not in merge.merge([shard(1, []), shard(2, []), shard(3, [])])
+
+
+class TestNdjson:
+    def test_results_are_streamed_as_they_complete(self, monkeypatch, fast_throttle):
+        urls = [f"https://h{i}.gov.br/" for i in range(4)]
+        monkeypatch.setattr(vs, "_http_head", lambda url, *a, **kw: vs.HttpResult(200))
+        out = io.StringIO()
+        report = vs.ValidationReport(sink=vs.NdjsonSink(out, progress_interval=0))
+        vs.validate_urls(report, _dataset(urls), workers=2)
+        events = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert sorted(e["url"] for e in events if e["event"] == "result") == urls
+        assert events[-1] == {**events[-1], "event": "progress", "done": 4, "total": 4}
+        assert [r.url for r in report.results] == urls  # relatório segue ordenado
+
+    def test_merge_reads_truncated_stream(self, tmp_path):
+        import merge_freshness_reports as merge
+
+        path = tmp_path / "urls.ndjson"
+        path.write_text(
+            '{"event": "start", "timestamp": "2026-01-01", "shard": null}\n'
+            '{"event": "result", "source": "url", "url": "https://a/", "status": "ok"}\n'
+            '{"event": "progress", "phase": "url", "done": 1, "total": 2}\n'
+            '{"event": "result", "source": "url", "url": "https://b/", "sta',
+            encoding="utf-8",
+        )
+        combined = merge.merge([merge.load(str(path))])
+        assert [r["url"] for r in combined["results"]] == ["https://a/"]
+        assert combined["partial_reports"] == 1
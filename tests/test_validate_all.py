@@ -0,0 +1,345 @@
+"""Gate do orquestrador validate_all (grafo de fases).
+
+As fases são substituídas por funções locais: valida ordem de dependências,
+paralelismo limitado por --jobs e ordem determinística do relatório.
+"""
+from __future__ import annotations
+
+import json
+import signal
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import validate_all as va  # noqa: E402
+
+
+def _phase(key, log, deps=(), delay=0.05, active=None, peak=None):
+    def run():
+        log.append(("start", key))
+        if active is not None:
+            with active["lock"]:
+                active["n"] += 1
+                peak.append(active["n"])
+        time.sleep(delay)
+        if active is not None:
+            with active["lock"]:
+                active["n"] -= 1
+        log.append(("end", key))
+        return va.ValidationResult(key, True, "ok")
+    return va.Phase(key, "", run, deps=deps)
+
+
+class TestPhaseGraph:
+    def test_dependencies_run_first(self, capsys):
+        log = []
+        validator = va.MasterValidator(verbose=False, jobs=4)
+        phases = [
+            _phase("pre", log),
+            _phase("schema", log, deps=("pre",)),
+            _phase("content", log, deps=("schema",)),
+            _phase("net", log, deps=("pre",)),
+        ]
+        done = validator.run_phases(phases)
+        assert set(done) == {"pre", "schema", "content", "net"}
+        assert log.index(("end", "pre")) < log.index(("start", "schema"))
+        assert log.index(("end", "schema")) < log.index(("start", "content"))
+        assert log.index(("end", "pre")) < log.index(("start", "net"))
+
+    @pytest.mark.parametrize("jobs", [1, 3])
+    def test_jobs_bound_concurrency(self, jobs, capsys):
+        log, peak = [], []
+        active = {"n": 0, "lock": threading.Lock()}
+        validator = va.MasterValidator(verbose=False, jobs=jobs)
+        phases = [_phase(f"net{i}", log, active=active, peak=peak) for i in range(5)]
+        validator.run_phases(phases)
+        # Pico de fases simultâneas = --jobs (paralelismo sem depender do
+        # tempo de parede, instável sob pytest -n auto)
+        assert max(peak) == jobs
+
+    def test_circular_dependency_is_reported(self, capsys):
+        validator = va.MasterValidator(verbose=False)
+        phases = [_phase("a", [], deps=("b",)), _phase("b", [], deps=("a",))]
+        with pytest.raises(RuntimeError):
+            validator.run_phases(phases)
+
+    def test_report_keeps_declared_order(self, monkeypatch, capsys):
+        log = []
+        validator = va.MasterValidator(verbose=False, jobs=4)
+        phases = [_phase("slow", log, delay=0.1), _phase("fast", log, delay=0)]
+        for phase in phases:
+            phase.quick = True
+        monkeypatch.setattr(validator, "phases", lambda: phases)
+        validator.run_all_validations(quick=True)
+        assert [r.name for r in validator.results] == ["slow", "fast"]
+
+
+class TestInProcess:
+    @pytest.fixture
+    def validator(self):
+        return va.MasterValidator(verbose=False)
+
+    def _run(self, validator, target, script="x.py", **kw):
+        # O proxy é instalado dentro do teste: o capture do pytest troca
+        # sys.stdout entre setup e call
+        validator._stdout = va._ThreadLocalStdout(sys.stdout)
+        sys.stdout = validator._stdout
+        try:
+            return validator.run_validator("fase", ROOT / "scripts" / script, target, **kw)
+        finally:
+            sys.stdout = validator._stdout._real
+
+    @pytest.mark.parametrize("value, success", [
+        (None, True), (True, True), (0, True), (False, False), (1, False),
+    ])
+    def test_return_value_follows_exit_code_contract(self, validator, value, success):
+        def target():
+            print("saída do validador")
+            return value
+        result = self._run(validator, target)
+        assert result.success is success
+        assert "saída do validador" in result.details
+
+    def test_sys_exit_and_exceptions(self, validator):
+        assert not self._run(validator, lambda: sys.exit(1)).success
+        assert self._run(validator, lambda: sys.exit(0)).success
+        result = self._run(validator, lambda: 1 / 0)
+        assert not result.success and "Exception" in result.message
+
+    def test_timeout(self, validator):
+        result = self._run(validator, lambda: time.sleep(1), timeout=0.05, timeout_as_warning=True)
+        assert result.success and result.is_timeout
+
+    def test_validators_share_the_parsed_dataset(self, validator, tmp_path, monkeypatch):
+        schema = validator._import_validator("validate_schema")
+        monkeypatch.setattr(schema, "CACHE_FILE", tmp_path / "results.json")
+        assert validator.validate_json_files().success
+        assert set(validator.dataset) == {"direitos", "dicionario", "matching"}
+        result = self._run(validator, validator._schema_target, script="validate_schema.py")
+        assert result.success, result.details
+        assert (tmp_path / "results.json").exists()
+
+    def test_no_cache_reaches_the_schema_validator(self, validator, tmp_path, monkeypatch):
+        schema = validator._import_validator("validate_schema")
+        monkeypatch.setattr(schema, "CACHE_FILE", tmp_path / "results.json")
+        validator.use_cache = False
+        assert validator.validate_json_files().success
+        result = self._run(validator, validator._schema_target, script="validate_schema.py")
+        assert result.success, result.details
+        assert not (tmp_path / "results.json").exists()
+
+
+class TestNetworkPhases:
+    NETWORK = ("sources", "legal_compliance", "legal_sources")
+
+    def test_network_phases_run_in_subprocess(self, monkeypatch):
+        validator = va.MasterValidator(verbose=False)
+        calls = []
+        monkeypatch.setattr(validator, "run_validator", lambda *a, **kw: pytest.fail("in-process"))
+        monkeypatch.setattr(validator, "run_script", lambda name, script, **kw: (
+            calls.append(Path(script).name) or va.ValidationResult(name, True, "ok",
+                                                                   "  ♻️  Pool HTTP: 12 KiB de corpo lidos")))
+        validator._local.metrics = {"cpu_s": 0.0, "peak_rss_kb": None, "peak_alloc_kb": None,
+                                    "net_bytes": None}
+        for phase in validator.phases():
+            if phase.key in self.NETWORK:
+                phase.run()
+        assert calls == ["validate_sources.py", "validate_legal_compliance.py",
+                         "validate_legal_sources.py"]
+        assert validator._local.metrics["net_bytes"] == 12 * 1024
+
+    def test_timeout_stops_the_validator_and_its_workers(self, tmp_path):
+        """O processo do validate_all termina logo após o timeout da fase."""
+        script = tmp_path / "lento.py"
+        script.write_text(
+            "import time\n"
+            "from concurrent.futures import ThreadPoolExecutor\n"
+            "with ThreadPoolExecutor(4) as pool:\n"
+            "    list(pool.map(time.sleep, [2] * 20))\n")
+        code = (
+            "import sys; sys.path.insert(0, sys.argv[1]); import validate_all as va\n"
+            "r = va.MasterValidator(verbose=False).run_script('lento', sys.argv[2], timeout=0.5,"
+            " timeout_as_warning=True)\n"
+            "assert r.is_timeout\n")
+        started = time.monotonic()
+        subprocess.run([sys.executable, "-c", code, str(ROOT / "scripts"), str(script)],
+                       check=True, timeout=30)
+        assert time.monotonic() - started < 5  # sem o kill: 10 s de sleeps na fila
+
+    @pytest.mark.skipif(not hasattr(va.os, "wait4"), reason="rusage por filho requer os.wait4")
+    def test_timeout_does_not_wait_for_grandchildren_holding_the_pipes(self, tmp_path, capsys):
+        pidfile = tmp_path / "neto.pid"
+        script = tmp_path / "pai.py"
+        script.write_text(
+            "import subprocess, sys, time\n"
+            "neto = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(12)'])\n"
+            f"open({str(pidfile)!r}, 'w').write(str(neto.pid))\n"
+            "print('iniciado', flush=True)\n"
+            "time.sleep(12)\n")
+        validator = va.MasterValidator(verbose=False)
+        started = time.monotonic()
+        try:
+            with pytest.raises(subprocess.TimeoutExpired) as exc:
+                validator._run_command([sys.executable, str(script)], timeout=1)
+            assert time.monotonic() - started < 5  # sem o limite: 12 s do neto
+            assert "iniciado" in exc.value.output
+        finally:
+            if pidfile.exists():
+                va.os.kill(int(pidfile.read_text()), signal.SIGKILL)
+
+
+class TestPhaseCache:
+    def _setup(self, tmp_path, outcome=True):
+        calls = []
+        (tmp_path / "data").mkdir(parents=True)
+        (tmp_path / "data" / "a.json").write_text("{}")
+        validator = va.MasterValidator(verbose=False, cache_dir=tmp_path / "cache")
+        validator.root = tmp_path
+
+        def run():
+            calls.append(1)
+            return va.ValidationResult("fase", outcome, "ok")
+
+        phase = va.Phase("fase", "", run, inputs=("data/*.json",))
+        return validator, phase, calls
+
+    def test_unchanged_inputs_reuse_the_result(self, tmp_path, capsys):
+        validator, phase, calls = self._setup(tmp_path)
+        validator._run_phase(phase)
+        results, _ = validator._run_phase(phase)
+        assert len(calls) == 1 and results[0].cached
+        assert validator.cache_stats == {"eligible": 2, "hits": 1}
+
+        (tmp_path / "data" / "a.json").write_text('{"x": 1}')
+        results, _ = validator._run_phase(phase)
+        assert len(calls) == 2 and not results[0].cached
+
+    def test_failures_are_not_cached_and_no_cache_skips(self, tmp_path, capsys):
+        validator, phase, calls = self._setup(tmp_path, outcome=False)
+        validator._run_phase(phase)
+        validator._run_phase(phase)
+        assert len(calls) == 2
+
+        validator, phase, calls = self._setup(tmp_path / "b")
+        validator.use_cache = False
+        validator._run_phase(phase)
+        validator._run_phase(phase)
+        assert len(calls) == 2
+
+
+class TestPhaseMetrics:
+    def test_in_process_phase_records_cpu_and_allocations(self, capsys):
+        validator = va.MasterValidator(verbose=False)
+
+        def target():
+            blob = [bytes(1024) for _ in range(2048)]  # ~2 MiB
+            return len(blob) and None
+
+        phase = va.Phase("fase", "", lambda: validator.run_validator(
+            "fase", ROOT / "scripts" / "x.py", target))
+        validator._stdout = va._ThreadLocalStdout(sys.stdout)
+        sys.stdout = validator._stdout
+        va.tracemalloc.start()
+        try:
+            validator._run_phase(phase)
+        finally:
+            va.tracemalloc.stop()
+            sys.stdout = validator._stdout._real
+        m = validator.phase_metrics["fase"]
+        assert m["wall_s"] >= m["start_s"] >= 0
+        assert m["cpu_s"] > 0
+        assert m["peak_alloc_kb"] >= 2048
+        assert m["peak_rss_kb"] is None and m["net_bytes"] is None
+
+    @pytest.mark.skipif(not hasattr(va.os, "wait4"), reason="rusage por filho requer os.wait4")
+    def test_subprocess_rusage_is_attributed_to_the_phase(self, tmp_path, capsys):
+        script = tmp_path / "burn.py"
+        script.write_text("x = sum(i * i for i in range(2_000_000))\n")
+        validator = va.MasterValidator(verbose=False, use_subprocess=True)
+        phase = va.Phase("fase", "", lambda: validator.run_validator("burn", script, None))
+        results, _ = validator._run_phase(phase)
+        assert results[0].success
+        m = validator.phase_metrics["fase"]
+        assert m["cpu_s"] > 0.05
+        assert m["peak_rss_kb"] > 1024
+
+    @pytest.mark.skipif(not hasattr(va.os, "wait4"), reason="rusage por filho requer os.wait4")
+    def test_exit_status_survives_the_rusage_reap(self, tmp_path, capsys):
+        script = tmp_path / "falha.py"
+        script.write_text("import sys\nprint('saida')\nsys.exit(3)\n")
+        validator = va.MasterValidator(verbose=False)
+        result = validator._run_command([sys.executable, str(script)], timeout=10)
+        assert result.returncode == 3
+        assert result.stdout.strip() == "saida"
+
+    def test_report_and_trace_export(self, tmp_path, monkeypatch, capsys):
+        log = []
+        validator = va.MasterValidator(verbose=False, jobs=2)
+        validator.root = tmp_path
+        phases = [_phase("a", log), _phase("b", log), _phase("c", log, deps=("a",))]
+        for phase in phases:
+            phase.quick = True
+        monkeypatch.setattr(validator, "phases", lambda: phases)
+        validator.run_all_validations(quick=True)
+
+        report = validator.generate_report()
+        assert list(report["phases"]) and set(report["phases"]) == {"a", "b", "c"}
+        assert [r["phase"] for r in report["results"]] == ["a", "b", "c"]
+
+        trace = json.loads(validator.write_trace(tmp_path / "trace.json").read_text())
+        spans = {e["name"]: e for e in trace["traceEvents"] if e["ph"] == "X"}
+        assert set(spans) == {"a", "b", "c"}
+        assert spans["c"]["ts"] >= spans["a"]["ts"] + spans["a"]["dur"]
+        assert all(e["dur"] >= 40_000 for e in spans.values())
+        assert any(e["ph"] == "M" for e in trace["traceEvents"])
+
+
+class TestHistory:
+    def _entry(self, wall, success=True, cached=False):
+        return {"phases": {"sources": {"wall_s": wall, "success": success, "cached": cached}}}
+
+    def test_percentiles_and_regression(self):
+        entries = [self._entry(w) for w in (10, 11, 9, 10, 12)] + [self._entry(20)]
+        trend = va.compute_trend(entries)["sources"]
+        assert trend["p50"] == 10.5 and trend["last"] == 20
+        assert trend["regression"] and not trend["flaky"]
+
+        entries[-1] = self._entry(12.5)
+        assert not va.compute_trend(entries)["sources"]["regression"]
+
+    def test_cached_runs_and_short_history_are_not_compared(self):
+        entries = [self._entry(10)] * 5 + [self._entry(0.01, cached=True)]
+        trend = va.compute_trend(entries)["sources"]
+        assert trend["p50"] == 10 and not trend["regression"]
+        assert not va.compute_trend([self._entry(1), self._entry(30)])["sources"]["regression"]
+
+    def test_flaky_phase(self):
+        outcomes = [True, False, True, True]
+        trend = va.compute_trend([self._entry(1, ok) for ok in outcomes])["sources"]
+        assert trend["flaky"] and trend["failures"] == 1
+
+    def test_runs_are_appended(self, tmp_path, monkeypatch, capsys):
+        history = tmp_path / "history.ndjson"
+        for _ in range(2):
+            validator = va.MasterValidator(verbose=False, history_file=history)
+            validator.root = tmp_path
+            phases = [_phase("a", []), _phase("b", [], deps=("a",))]
+            for phase in phases:
+                phase.quick = True
+            monkeypatch.setattr(validator, "phases", lambda: phases)
+            validator.run_all_validations(quick=True)
+            validator.append_history()
+        with open(history, "a") as f:
+            f.write('{"truncado')
+        entries = va.load_history(history)
+        assert len(entries) == 2 and entries[-1]["quick"]
+        assert set(entries[-1]["phases"]) == {"a", "b"}
+        assert entries[-1]["phases"]["a"]["success"]
+        assert va.load_history(history, limit=1) == entries[-1:]